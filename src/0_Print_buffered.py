@@ -0,0 +1,63 @@
+import os
+import tempfile
+import time
+
+from output_sink import NULL, OutputSink
+
+# Same examples as 0_Print.py, written through a buffered OutputSink.
+# Nothing reaches the terminal until the sink flushes (here: end of the with block).
+
+with OutputSink() as out:
+    out.print("a", "b", "c")
+    # a b c   (separated by a space)
+
+    out.print("a", "b", "c", sep="-")
+    # a-b-c
+
+    out.print("year", 2025, sep=":")
+    # year:2025
+
+    out.print(1, 2, 3, sep=", ")
+    # 1, 2, 3
+
+    out.print("path", "to", "file", sep="/")
+    # path/to/file
+
+    out.print("a", "b", "c", sep="")
+    # abc   (no spaces at all)
+
+    x = out.print("path", "to", "file", sep="/")
+    out.print(f"hello {x}")
+    # hello None   (like print(), out.print() returns None)
+
+
+# Throughput: the range loop from logical/12_For_Loop_By_Range.py, a million times.
+# A terminal's stdout is line-buffered, so the print() run below uses a
+# line-buffered file to behave the same way (one write per line).
+
+n = 1_000_000
+with tempfile.TemporaryDirectory() as tmp:
+    path = os.path.join(tmp, "out.txt")
+
+    with open(path, "w", buffering=1) as f:
+        start = time.perf_counter()
+        for i in range(n):
+            print(f"{i}", file=f)
+        print(f"\nprint() per line (line-buffered) :: {time.perf_counter() - start:.3f}s")
+
+    with OutputSink(path) as out:
+        start = time.perf_counter()
+        for i in range(n):
+            out.print(f"{i}")
+    print(f"OutputSink.print()               :: {time.perf_counter() - start:.3f}s")
+
+    with OutputSink(path) as out:
+        start = time.perf_counter()
+        out.writelines(range(n))
+    print(f"OutputSink.writelines(range(n))  :: {time.perf_counter() - start:.3f}s")
+
+    with OutputSink(NULL) as out:
+        start = time.perf_counter()
+        for i in range(n):
+            out.print(f"{i}")
+    print(f"OutputSink(NULL) (null sink)     :: {time.perf_counter() - start:.3f}s")
@@ -0,0 +1,202 @@
+# Bulk casting (a whole CSV column at once)
+
+# The safe cast in 3_Variable_TypeCasting.py:
+#
+#   try:
+#       n = int(s)
+#   except ValueError:
+#       n = None
+#
+# is fine for one value, but raising + catching an exception for every bad
+# value in a column of millions is slow.
+#
+# cast_column(values, int) instead:
+#   1) tries the whole column in ONE go (array.extend(map(int, values))) -
+#      clean data costs one try/except in total
+#   2) only if that fails, keeps what was converted before the bad value and
+#      finds the bad values in the rest with str.isdecimal + a regex that
+#      follows int()/float() rules, so bad values never raise; the rest is
+#      then converted once (nothing is converted twice)
+#   3) returns a typed array.array (or NumPy array) + a null mask + the
+#      number of failures, instead of raising per element
+#
+# Note: since Python 3.11 a caught exception is cheap, so the benchmark below
+# shows cast_column roughly level with try/except at 10% invalid values (and
+# ahead with more); on older Pythons the per-element raise costs several
+# times more.
+
+import array
+import re
+import time
+from dataclasses import dataclass, field
+from itertools import compress, count
+from operator import not_
+
+try:
+    import numpy as np
+except ImportError:  # array.array output only
+    np = None
+
+
+_D = r"\d(?:_?\d)*"  # digits, single underscores allowed between them (like int("1_000"))
+_INT = re.compile(rf"\s*[+-]?{_D}\s*")
+_FLOAT = re.compile(rf"\s*[+-]?(?:(?:{_D}(?:\.(?:{_D})?)?|\.{_D})(?:[eE][+-]?{_D})?|inf(?:inity)?|nan)\s*",
+                    re.IGNORECASE)
+
+TRUE_WORDS = {"1", "true", "t", "yes", "y", "on"}
+FALSE_WORDS = {"0", "false", "f", "no", "n", "off", ""}
+
+_TYPECODES = {int: "q", float: "d", bool: "b"}
+_INT64 = (-(2 ** 63), 2 ** 63 - 1)
+
+
+def _parse_bool(s: str) -> bool:
+    # bool("False") is True, so CSV booleans need words, not bool()
+    word = s.strip().lower()
+    if word in TRUE_WORDS:
+        return True
+    if word in FALSE_WORDS:
+        return False
+    raise ValueError(f"not a boolean: {s!r}")
+
+
+def _bad_positions(values, to_type) -> list:
+    """Indexes of values that don't parse as `to_type` - without raising.
+
+    Syntax only: an int out of the 64-bit range (or too long for int())
+    passes here and is caught while converting.
+    """
+    if to_type is bool:
+        words = TRUE_WORDS | FALSE_WORDS
+        return [i for i, s in enumerate(values) if s.strip().lower() not in words]
+    pattern = _INT if to_type is int else _FLOAT
+    # plain digit strings are valid for both int() and float(); only the rest
+    # (signs, spaces, ".", "e", junk) go through the regex.
+    # map() + compress() keep both scans over the column in C.
+    others = list(compress(count(), map(not_, map(str.isdecimal, values))))
+    return list(compress(others, map(not_, map(pattern.fullmatch, map(values.__getitem__, others)))))
+
+
+def _convert_into(out, convert, values) -> list:
+    """out.extend(map(convert, values)), going on past the values that fail.
+
+    Each failed value becomes a 0 in out; returns their indexes in values.
+    """
+    start = len(out)
+    failed = []
+    it = iter(values)
+    while True:
+        try:
+            out.extend(map(convert, it))  # array.extend keeps what it got before an error
+            return failed
+        except (ValueError, OverflowError):
+            failed.append(len(out) - start)
+            out.append(0)
+
+
+@dataclass
+class CastResult:
+    values: object  # array.array, or numpy.ndarray when as_numpy=True
+    null_mask: bytearray  # 1 where the input could not be cast
+    failures: int = 0
+    examples: list = field(default_factory=list)  # first few values that failed
+
+
+def cast_column(values, to_type, on_error: str = "null", fill=0, as_numpy: bool = False,
+                max_examples: int = 5) -> CastResult:
+    """Cast a column of strings to int, float or bool.
+
+    on_error="null"  -> failed cells become `fill` and are flagged in null_mask
+    on_error="raise" -> one ValueError for the whole column, with the count
+    """
+    if to_type not in _TYPECODES:
+        raise TypeError(f"unsupported type: {to_type!r}")
+    if on_error not in ("null", "raise"):
+        raise ValueError(f"on_error must be 'null' or 'raise', not {on_error!r}")
+    values = values if isinstance(values, list) else list(values)
+    convert = _parse_bool if to_type is bool else to_type
+    typecode = _TYPECODES[to_type]
+
+    out = array.array(typecode)
+    try:  # fast path: clean column, no per-element checks at all
+        out.extend(map(convert, values))
+        bad = []
+    except (ValueError, OverflowError):
+        # out keeps the converted prefix; the rest is validated once and
+        # converted once, with the bad cells swapped for a constant first
+        start = len(out)
+        tail = values[start:]
+        bad = _bad_positions(tail, to_type)
+        placeholder = "0"
+        for i in bad:
+            tail[i] = placeholder
+        # a value can pass the syntax check and still fail: an int out of the
+        # 64-bit range, or past int()'s digit limit ("Exceeds the limit ...")
+        bad = [start + i for i in sorted(bad + _convert_into(out, convert, tail))]
+    failures = len(bad)
+    examples = [values[i] for i in bad[:max_examples]]
+    if failures and on_error == "raise":
+        raise ValueError(f"{failures} of {len(values)} values are not {to_type.__name__}: {examples}")
+    mask = bytearray(len(values))
+    for i in bad:
+        mask[i] = 1
+        out[i] = fill
+
+    if as_numpy:
+        if np is None:
+            raise RuntimeError("as_numpy=True needs NumPy installed")
+        out = np.frombuffer(out, dtype={"q": np.int64, "d": np.float64, "b": np.int8}[typecode]).astype(
+            to_type if to_type is not int else np.int64)
+    return CastResult(out, mask, failures, examples)
+
+
+def cast_table(columns: dict, on_error: str = "null") -> dict:
+    """{name: (values, type)} -> {name: CastResult}; prints a failure report."""
+    results = {name: cast_column(values, to_type, on_error) for name, (values, to_type) in columns.items()}
+    for name, result in results.items():
+        print(f"{name:<10} failures :: {result.failures:<6} e.g. {result.examples}")
+    return results
+
+
+def main() -> None:
+    result = cast_column(["10", "x", "25", "", "-7", " 3 ", "1_000"], int)
+    print(f"values    :: {result.values}")
+    print(f"null_mask :: {list(result.null_mask)}")
+    print(f"failures  :: {result.failures} {result.examples}")
+
+    print()
+    cast_table({
+        "age": (["30", "25", "n/a"], int),
+        "salary": (["1.5e3", "abc", "inf", "2_500.75"], float),
+        "active": (["yes", "False", "maybe"], bool),
+    })
+
+    try:
+        cast_column(["1", "two", "3"], int, on_error="raise")
+    except ValueError as e:
+        print(f"\non_error='raise' :: {e}")
+
+    n = 1_000_000
+    for bad_every in (0, 10, 2):
+        column = [f"{i}x" if bad_every and i % bad_every == 0 else str(i) for i in range(n)]
+        share = 100 // bad_every if bad_every else 0
+        print(f"\n=== {n:,} strings, {share}% invalid, seconds ===")
+
+        start = time.perf_counter()
+        naive = []
+        for s in column:
+            try:
+                naive.append(int(s))
+            except ValueError:
+                naive.append(None)
+        print(f"try/except per element :: {time.perf_counter() - start:.3f}")
+
+        start = time.perf_counter()
+        result = cast_column(column, int)
+        print(f"cast_column            :: {time.perf_counter() - start:.3f}")
+        same = [v if m == 0 else None for v, m in zip(result.values, result.null_mask)] == naive
+        print(f"same values            :: {same}")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,15 +6,16 @@
 
 # It returns what the user typed as a string (str).
 
+# `ask` defaults to input(); pass any function that takes a prompt and returns
+# a string to feed answers from a file, a list, ... (see 4_User_input_batch.py)
 
 
-
-def main()->None:
-    x = input("Enter: ")
+def main(ask=input)->None:
+    x = ask("Enter: ")
     print(type(x))  # <class 'str'>
 
-    age = int(input("Enter age: "))
-    salary = float(input("Enter salary: "))
+    age = int(ask("Enter age: "))
+    salary = float(ask("Enter salary: "))
 
     print(f"Age ::{age} and type {type(age)}")
     print(f"Salary ::{salary} and type {type(salary)}")
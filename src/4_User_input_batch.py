@@ -0,0 +1,118 @@
+# Batch (non-interactive) input for the input() demos
+
+# input("Enter: ") waits for a human. For load-testing we want to run the same
+# entry points thousands of times with answers that come from somewhere else.
+
+# The interactive demos take an `ask` argument that defaults to input():
+#   4_User_input_And_Casting.main(ask)
+#   logical/9_If_Statements.main(ask)
+#   logical/9_Conditional_Expression.main(ask)
+#   logical/13_Nested_for_loops.grid_printer(ask)
+
+# ScriptedInput is such an `ask`: it hands out answers from a list, a file,
+# a stream (sys.stdin) or a generator, and raises EOFError when they run out,
+# exactly like input() does at the end of a piped stdin.
+
+# Run:
+#   python 4_User_input_batch.py                      # built-in scenarios + benchmark
+#   python 4_User_input_batch.py answers.txt          # one scenario per line, answers split by ","
+#   printf '30,41,500.5\n' | python 4_User_input_batch.py -
+
+import contextlib
+import importlib.util
+import io
+import os
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+class ScriptedInput:
+    def __init__(self, answers) -> None:
+        self._answers = iter(answers)
+
+    def __call__(self, prompt: str = "") -> str:
+        try:
+            return next(self._answers)
+        except StopIteration:
+            raise EOFError("no more scripted answers") from None
+
+    @classmethod
+    def from_stream(cls, stream) -> "ScriptedInput":
+        return cls(line.rstrip("\n") for line in stream)
+
+    @classmethod
+    def from_file(cls, path: str) -> "ScriptedInput":
+        with open(path, encoding="utf-8") as f:
+            return cls(f.read().splitlines())
+
+
+def read_scenarios(stream, sep: str = ","):
+    """One scenario per line; its answers separated by `sep` - read in one pass."""
+    return [line.rstrip("\n").split(sep) for line in stream if line.strip()]
+
+
+def load_demo(relative_path: str):
+    # the demo files start with a digit, so they can't be imported by name
+    path = os.path.join(HERE, relative_path)
+    spec = importlib.util.spec_from_file_location(os.path.basename(path)[:-3], path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def run_scenarios(entry_point, scenarios, show_output: bool = False) -> dict:
+    """Call entry_point(ask) once per scenario; count passes and failures."""
+    results = {"ok": 0, "errors": {}}
+    sink = sys.stdout if show_output else io.StringIO()
+    with contextlib.redirect_stdout(sink):
+        for answers in scenarios:
+            try:
+                entry_point(ScriptedInput(answers))
+                results["ok"] += 1
+            except (ValueError, EOFError) as e:
+                name = type(e).__name__
+                results["errors"][name] = results["errors"].get(name, 0) + 1
+            if not show_output:
+                sink.seek(0)
+                sink.truncate()
+    return results
+
+
+DEMOS = {
+    "4_User_input_And_Casting.main": ("4_User_input_And_Casting.py", "main",
+                                      [["hi", "30", "1500.5"], ["x", "abc", "1"], ["y", "41", "99"]]),
+    "9_If_Statements.main": ("logical/9_If_Statements.py", "main", [["-5"], ["0"], ["1"], ["42"], ["x"]]),
+    "9_Conditional_Expression.main": ("logical/9_Conditional_Expression.py", "main", [["17"], ["18"], ["abc"]]),
+    "13_Nested_for_loops.grid_printer": ("logical/13_Nested_for_loops.py", "grid_printer", [["2", "3", "*"], ["1", "1"]]),
+}
+
+
+def main() -> None:
+    if len(sys.argv) > 1:
+        if sys.argv[1] == "-":
+            scenarios = read_scenarios(sys.stdin)  # not ours to close
+        else:
+            with open(sys.argv[1], encoding="utf-8") as f:
+                scenarios = read_scenarios(f)
+        demo = load_demo("4_User_input_And_Casting.py")
+        print(run_scenarios(demo.main, scenarios, show_output=True))
+        return
+
+    print("=== one scenario, output shown ===")
+    grid = load_demo("logical/13_Nested_for_loops.py")
+    run_scenarios(grid.grid_printer, [["2", "4", "#"]], show_output=True)
+
+    print("\n=== scenarios per second (output discarded) ===")
+    for name, (path, func, scenarios) in DEMOS.items():
+        entry_point = getattr(load_demo(path), func)
+        batch = scenarios * (20_000 // len(scenarios))
+        start = time.perf_counter()
+        results = run_scenarios(entry_point, batch)
+        elapsed = time.perf_counter() - start
+        print(f"{name:<34} {len(batch) / elapsed:>10,.0f}/s  {results}")
+
+
+if __name__ == "__main__":
+    main()
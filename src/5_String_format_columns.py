@@ -0,0 +1,137 @@
+# Columnar formatter for aligned, fixed-width tables
+#
+# string_format_number() / string_format_texting() in 5_String_format.py format
+# ONE value at a time:  "{:,}".format(n), "{:>10}".format(name), ...
+#
+# Here a whole COLUMN is formatted at once:
+#   1) every value -> text with the column's spec (",", "b", "o", "X", "E", ".2f" ...)
+#   2) one pass of len() over the column gives its width
+#   3) every cell is padded with ljust / rjust / "^" in bulk
+#   4) rows are joined and written in large chunks to a file / io.StringIO
+# Each step is a map() over a C function, so there is no Python code per cell.
+#
+#   write_table([Column(names, header="name"),
+#                Column(amounts, ",", header="amount")], out)
+
+import io
+import os
+import tempfile
+import time
+from itertools import repeat
+
+
+class Column:
+    def __init__(self, values, spec: str = "", align: str | None = None, header: str | None = None) -> None:
+        self.values = values  # a sequence (list, tuple, array.array, range ...)
+        self.spec = spec
+        self.align = align  # "<", ">", "^"; default: numbers right, text left
+        self.header = header
+
+    def cells(self, header_row: bool = False) -> list:
+        """Formatted values, under the header (an empty one if header_row and there is none)."""
+        cells = list(map(format, self.values, repeat(self.spec)))
+        if self.header is not None or header_row:
+            cells.insert(0, "" if self.header is None else self.header)
+        return cells
+
+    def _default_align(self) -> str:
+        first = self.values[0] if len(self.values) else ""
+        return ">" if isinstance(first, (int, float)) and not isinstance(first, bool) else "<"
+
+    def padded(self, header_row: bool = False) -> list:
+        cells = self.cells(header_row)
+        width = max(map(len, cells), default=0)
+        align = self.align or self._default_align()
+        if align == "<":
+            return list(map(str.ljust, cells, repeat(width)))
+        if align == ">":
+            return list(map(str.rjust, cells, repeat(width)))
+        # str.center() breaks ties differently from format's "^", so use format
+        return list(map(format, cells, repeat(f"^{width}")))
+
+
+def write_table(columns, file, sep: str = " | ", chunk_rows: int = 65_536) -> int:
+    """Write the columns as an aligned table; returns the number of lines written.
+
+    Raises ValueError if the columns are not all the same length.
+    """
+    header_row = any(column.header is not None for column in columns)
+    padded = [column.padded(header_row) for column in columns]
+    rows = list(map(sep.join, zip(*padded, strict=True)))
+    if header_row:
+        rule = sep.replace(" ", "-").replace("|", "+")
+        rows.insert(1, rule.join("-" * len(cells[0]) for cells in padded))
+    for start in range(0, len(rows), chunk_rows):
+        file.write("\n".join(rows[start:start + chunk_rows]))
+        file.write("\n")
+    return len(rows)
+
+
+def format_table(columns, sep: str = " | ") -> str:
+    buffer = io.StringIO()
+    write_table(columns, buffer, sep)
+    return buffer.getvalue()
+
+
+def string_format_number():
+    numbers = [1000, 255, 7, 65535]
+
+    print(format_table([
+        Column(numbers, header="number"),
+        Column(numbers, ",", header="{:,}"),
+        Column(numbers, "b", header="{:b}"),
+        Column(numbers, "o", header="{:o}"),
+        Column(numbers, "X", header="{:X}"),
+        Column(numbers, "E", header="{:E}"),
+    ]))
+
+
+def string_format_texting():
+    names = ["Bro", "Ilankumaran", "Sam"]
+
+    print(format_table([
+        Column(names, align="<", header="{:<}"),
+        Column(names, align=">", header="{:>}"),
+        Column(names, align="^", header="{:^}"),
+    ]))
+
+
+def benchmark(n: int = 1_000_000) -> None:
+    print(f"=== {n:,}-row report, seconds (lower is better) ===")
+    ids = list(range(n))
+    names = [f"user{i % 5000}" for i in range(n)]
+    amounts = [i * 37 % 1_000_003 for i in range(n)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "report.txt")
+
+        start = time.perf_counter()
+        w_id = max(len(format(v)) for v in ids)
+        w_name = max(len(v) for v in names)
+        w_amount = max(len(format(v, ",")) for v in amounts)
+        w_hex = max(len(format(v, "X")) for v in amounts)
+        with open(path, "w") as f:
+            for i, name, amount in zip(ids, names, amounts):
+                f.write(f"{i:>{w_id}} | {name:<{w_name}} | {amount:>{w_amount},} | {amount:>{w_hex}X}\n")
+        elapsed = time.perf_counter() - start
+        print(f"{'per-cell f-string + write':<32} {elapsed:.3f}")
+        with open(path) as f:
+            expected = f.read()
+
+        start = time.perf_counter()
+        with open(path, "w") as f:
+            write_table([Column(ids), Column(names), Column(amounts, ","), Column(amounts, "X")], f)
+        elapsed = time.perf_counter() - start
+        print(f"{'write_table (columnar)':<32} {elapsed:.3f}")
+        with open(path) as f:
+            print("same output:", f.read() == expected)
+
+
+def main() -> None:
+    string_format_number()
+    string_format_texting()
+    benchmark()
+
+
+if __name__ == "__main__":
+    main()
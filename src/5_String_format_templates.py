@@ -0,0 +1,184 @@
+# Precompiled format templates
+#
+# str.format() parses the template string on EVERY call.
+# compile_template() parses it ONCE (with string.Formatter().parse) and turns it
+# into a small function built around an f-string, which Python evaluates
+# without any parsing at run time.
+#
+#   tpl = compile_template("The {} jumped over the {}")
+#   tpl.render("cow", "moon")                  # like .format("cow", "moon")
+#   tpl.render_map({"animal": "cow"})          # like .format_map(...)
+#   tpl.render_batch(rows)                     # many records -> one joined str
+#
+# Compiled templates are kept in a bounded LRU cache (functools.lru_cache).
+# Templates the compiler can't turn into an f-string safely (nested fields like
+# "{:{width}}", quotes or backslashes inside a format spec) fall back to
+# str.format, so every template still works.
+
+import re
+import string
+import time
+from functools import lru_cache
+
+_FIELD = re.compile(r"([^.\[]*)((?:\.[A-Za-z_]\w*|\[[^\]]+\])*)$")
+_ACCESSOR = re.compile(r"\.([A-Za-z_]\w*)|\[([^\]]+)\]")
+
+
+class _Fallback(Exception):
+    """Template can't be compiled to an f-string; use str.format instead."""
+
+
+def _literal(text: str) -> str:
+    escaped = text.encode("unicode_escape").decode("ascii").replace('"', '\\"')
+    return escaped.replace("{", "{{").replace("}", "}}")
+
+
+def _field_expr(field_name: str, auto: list) -> str:
+    match = _FIELD.match(field_name)
+    if match is None:
+        raise _Fallback
+    first, rest = match.groups()
+    if first.isdigit() or first == "":
+        # mixing "{}" and "{0}" is an error; let str.format raise it
+        style = "auto" if first == "" else "manual"
+        if auto[1] not in (None, style):
+            raise _Fallback
+        auto[1] = style
+        if style == "auto":
+            first = auto[0]
+            auto[0] += 1
+        expr = f"args[{int(first)}]"
+    elif first.isidentifier():
+        expr = f"kw[{first!r}]"
+    else:
+        raise _Fallback
+    for attr, key in _ACCESSOR.findall(rest):
+        if any(ch in key for ch in "'\"\\"):
+            raise _Fallback  # an f-string expression can't hold these (before 3.12)
+        expr += f".{attr}" if attr else f"[{int(key)}]" if key.isdigit() else f"[{key!r}]"
+    return expr
+
+
+def _fstring(template: str) -> str:
+    parts = []
+    auto = [0, None]  # next automatic field number, "auto"/"manual" numbering
+    for literal, field_name, spec, conversion in string.Formatter().parse(template):
+        parts.append(_literal(literal))
+        if field_name is None:
+            continue
+        if any(ch in spec for ch in '{}"\\\n\r'):
+            raise _Fallback
+        expr = _field_expr(field_name, auto)
+        parts.append("{" + expr + (f"!{conversion}" if conversion else "") + (f":{spec}" if spec else "") + "}")
+    return 'f"' + "".join(parts) + '"'
+
+
+class Template:
+    def __init__(self, template: str) -> None:
+        self.template = template
+        try:
+            body = _fstring(template)
+            # the comprehensions keep the per-record loop inside one code object
+            source = (f"def _one(args, kw):\n    return {body}\n"
+                      f"def _many_maps(rows):\n    args = ()\n    return [{body} for kw in rows]\n"
+                      f"def _many_seqs(rows):\n    kw = {{}}\n    return [{body} for args in rows]\n")
+            code = compile(source, f"<template {template!r}>", "exec")
+        except (_Fallback, SyntaxError):
+            fmt = template.format
+            self._one = lambda args, kw: fmt(*args, **kw)
+            self._many_maps = lambda rows: [fmt(**row) for row in rows]
+            self._many_seqs = lambda rows: [fmt(*row) for row in rows]
+            self.compiled = False
+            return
+        namespace = {}
+        exec(code, namespace)
+        self._one = namespace["_one"]
+        self._many_maps = namespace["_many_maps"]
+        self._many_seqs = namespace["_many_seqs"]
+        self.compiled = True
+
+    def render(self, *args, **kwargs) -> str:
+        return self._one(args, kwargs)
+
+    def render_map(self, mapping) -> str:
+        return self._one((), mapping)
+
+    def render_many(self, rows) -> list:
+        """rows: mappings (like format_map) or sequences (like positional format)."""
+        rows = rows if isinstance(rows, list) else list(rows)
+        if not rows:
+            return []
+        if hasattr(rows[0], "keys"):
+            return self._many_maps(rows)
+        return self._many_seqs(rows)
+
+    def render_batch(self, rows, sep: str = "\n") -> str:
+        return sep.join(self.render_many(rows))
+
+    def write_batch(self, rows, file, sep: str = "\n") -> None:
+        file.write(self.render_batch(rows, sep))
+        file.write(sep)
+
+
+@lru_cache(maxsize=256)
+def compile_template(template: str) -> Template:
+    return Template(template)
+
+
+def string_format():
+    text = compile_template("The {} jumped over the {}")
+    print(text.render("cow", "moon"))
+    print(compile_template("The {animal} jumped over the {item}").render_map({"animal": "cow", "item": "moon"}))
+
+
+def string_format_texting():
+    name = "Bro"
+
+    print(compile_template("Hello, my name is {}").render(name))
+    print(compile_template("Hello, my name is {:<10}. Nice to meet you").render(name))
+    print(compile_template("Hello, my name is {:>10}. Nice to meet you").render(name))
+    print(compile_template("Hello, my name is {:^10}. Nice to meet you").render(name))
+
+
+def string_format_number():
+    number = 1000
+
+    print(compile_template("The number pi is {:.3f}").render(number))
+    print(compile_template("The number is {:,}").render(number))
+    print(compile_template("The number is {:b}").render(number))
+    print(compile_template("The number is {:o}").render(number))
+    print(compile_template("The number is {:X}").render(number))
+    print(compile_template("The number is {0:{1}}").render(number, "E"))  # nested -> str.format fallback
+
+
+def benchmark(n: int = 200_000) -> None:
+    print(f"\n=== {n:,} log lines, seconds (lower is better) ===")
+    rows = [{"level": "INFO", "user": f"user{i}", "ms": i % 997 * 0.37} for i in range(n)]
+    template = "[{level:<5}] user={user!r} took {ms:8.2f} ms"
+    tpl = compile_template(template)
+
+    def timed(label, fn):
+        start = time.perf_counter()
+        out = fn()
+        print(f"{label:<32} {time.perf_counter() - start:.3f}")
+        return out
+
+    expected = timed("str.format(**row)", lambda: "\n".join(template.format(**row) for row in rows))
+    timed("str.format_map(row)", lambda: "\n".join(template.format_map(row) for row in rows))
+    timed("hand-written f-string", lambda: "\n".join(
+        f"[{row['level']:<5}] user={row['user']!r} took {row['ms']:8.2f} ms" for row in rows))
+    timed("Template.render_map(row)", lambda: "\n".join(tpl.render_map(row) for row in rows))
+    out = timed("Template.render_batch(rows)", lambda: tpl.render_batch(rows))
+    print("same output:", out == expected)
+    print("cache:", compile_template.cache_info())
+
+
+def main() -> None:
+    string_format()
+    string_format_number()
+    string_format_texting()
+    benchmark()
+
+
+if __name__ == "__main__":
+    main()
@@ -4,97 +4,89 @@ Generated from String_Functions.md
 
 Run:
     python 5_String_methods.py
-"""
+    python 5_String_methods.py -s split_join    # one section only
+    python 5_String_methods.py -n strip         # entries containing "strip"
 
-def show(title: str) -> None:
-    print("\n" + "=" * 80)
-    print(title)
-    print("=" * 80)
+Each entry is declared once in the tables below and only evaluated when
+its section runs (see `demo_registry.py`).
+"""
 
-def demo(expr: str, value) -> None:
-    """Pretty-print an expression and its evaluated result."""
-    print(f"{expr:<55} -> {value!r}")
+from demo_registry import DemoRegistry
 
-def formatting() -> None:
-    show("Formatting")
-    demo('\"Hi {}, age {}\".format(\"Sam\", 30)', "Hi {}, age {}".format("Sam", 30))
-    demo('\"Hi {name}\".format_map({\"name\":\"Sam\"})', "Hi {name}".format_map({"name": "Sam"}))
+STRINGS = DemoRegistry(width=55)
 
-def search_replace() -> None:
-    show("Search / Replace")
-    demo('\"hello\".find(\"ll\")', "hello".find("ll"))
-    demo('\"ababa\".rfind(\"ba\")', "ababa".rfind("ba"))
-    demo('\"hello\".index(\"ll\")', "hello".index("ll"))
-    demo('\"ababa\".rindex(\"ba\")', "ababa".rindex("ba"))
-    demo('\"banana\".count(\"an\")', "banana".count("an"))
-    demo('\"a-b\".replace(\"-\", \"_\")', "a-b".replace("-", "_"))
-    demo('\"hello\".startswith(\"he\")', "hello".startswith("he"))
-    demo('\"hello\".endswith(\"lo\")', "hello".endswith("lo"))
+STRINGS.add_section("formatting", "Formatting", [
+    ('"Hi {}, age {}".format("Sam", 30)', lambda: "Hi {}, age {}".format("Sam", 30)),
+    ('"Hi {name}".format_map({"name":"Sam"})', lambda: "Hi {name}".format_map({"name": "Sam"})),
+])
 
-def split_join() -> None:
-    show("Split / Join")
-    demo('\"a,b,c\".split(\",\")', "a,b,c".split(","))
-    demo('\"a,b,c\".rsplit(\",\", 1)', "a,b,c".rsplit(",", 1))
-    demo('\"a\\nb\".splitlines()', "a\nb".splitlines())
-    demo('\"-\".join([\"a\",\"b\"])', "-".join(["a", "b"]))
-    demo('\"a=b=c\".partition(\"=\")', "a=b=c".partition("="))
-    demo('\"a=b=c\".rpartition(\"=\")', "a=b=c".rpartition("="))
+STRINGS.add_section("search_replace", "Search / Replace", [
+    ('"hello".find("ll")', lambda: "hello".find("ll")),
+    ('"ababa".rfind("ba")', lambda: "ababa".rfind("ba")),
+    ('"hello".index("ll")', lambda: "hello".index("ll")),
+    ('"ababa".rindex("ba")', lambda: "ababa".rindex("ba")),
+    ('"banana".count("an")', lambda: "banana".count("an")),
+    ('"a-b".replace("-", "_")', lambda: "a-b".replace("-", "_")),
+    ('"hello".startswith("he")', lambda: "hello".startswith("he")),
+    ('"hello".endswith("lo")', lambda: "hello".endswith("lo")),
+])
 
-def case_conversions() -> None:
-    show("Case conversions")
-    demo('\"HeLLo\".lower()', "HeLLo".lower())
-    demo('\"HeLLo\".upper()', "HeLLo".upper())
-    demo('\"hello\".capitalize()', "hello".capitalize())
-    demo('\"hello world\".title()', "hello world".title())
-    demo('\"HeLLo\".swapcase()', "HeLLo".swapcase())
-    demo('\"ß\".casefold()', "ß".casefold())
+STRINGS.add_section("split_join", "Split / Join", [
+    ('"a,b,c".split(",")', lambda: "a,b,c".split(",")),
+    ('"a,b,c".rsplit(",", 1)', lambda: "a,b,c".rsplit(",", 1)),
+    ('"a\\nb".splitlines()', lambda: "a\nb".splitlines()),
+    ('"-".join(["a","b"])', lambda: "-".join(["a", "b"])),
+    ('"a=b=c".partition("=")', lambda: "a=b=c".partition("=")),
+    ('"a=b=c".rpartition("=")', lambda: "a=b=c".rpartition("=")),
+])
 
-def trim_padding() -> None:
-    show("Trim / Padding (Alignment)")
-    demo('\"  hi  \".strip()', "  hi  ".strip())
-    demo('\"  hi\".lstrip()', "  hi".lstrip())
-    demo('\"hi  \".rstrip()', "hi  ".rstrip())
-    demo('\"hi\".center(6)', "hi".center(6))
-    demo('\"hi\".ljust(5)', "hi".ljust(5))
-    demo('\"hi\".rjust(5)', "hi".rjust(5))
-    demo('\"42\".zfill(5)', "42".zfill(5))
+STRINGS.add_section("case_conversions", "Case conversions", [
+    ('"HeLLo".lower()', lambda: "HeLLo".lower()),
+    ('"HeLLo".upper()', lambda: "HeLLo".upper()),
+    ('"hello".capitalize()', lambda: "hello".capitalize()),
+    ('"hello world".title()', lambda: "hello world".title()),
+    ('"HeLLo".swapcase()', lambda: "HeLLo".swapcase()),
+    ('"ß".casefold()', lambda: "ß".casefold()),
+])
 
-def checks_true_false() -> None:
-    show("Checks (True/False methods)")
-    demo('\"abc\".isalpha()', "abc".isalpha())
-    demo('\"123\".isdigit()', "123".isdigit())
-    demo('\"123\".isdecimal()', "123".isdecimal())
-    demo('\"Ⅻ\".isnumeric()', "Ⅻ".isnumeric())
-    demo('\"a1\".isalnum()', "a1".isalnum())
-    demo('\"   \".isspace()', "   ".isspace())
-    demo('\"abc\".islower()', "abc".islower())
-    demo('\"ABC\".isupper()', "ABC".isupper())
-    demo('\"Hello World\".istitle()', "Hello World".istitle())
-    demo('\"abc\".isascii()', "abc".isascii())
-    demo('\"name_1\".isidentifier()', "name_1".isidentifier())
-    demo('\"hi\\n\".isprintable()', "hi\n".isprintable())
+STRINGS.add_section("trim_padding", "Trim / Padding (Alignment)", [
+    ('"  hi  ".strip()', lambda: "  hi  ".strip()),
+    ('"  hi".lstrip()', lambda: "  hi".lstrip()),
+    ('"hi  ".rstrip()', lambda: "hi  ".rstrip()),
+    ('"hi".center(6)', lambda: "hi".center(6)),
+    ('"hi".ljust(5)', lambda: "hi".ljust(5)),
+    ('"hi".rjust(5)', lambda: "hi".rjust(5)),
+    ('"42".zfill(5)', lambda: "42".zfill(5)),
+])
 
-def other_advanced() -> None:
-    show("Other advanced / useful methods")
-    demo('\"hi\".encode(\"utf-8\")', "hi".encode("utf-8"))
-    demo('\"a\\tb\".expandtabs(4)', "a\tb".expandtabs(4))
+STRINGS.add_section("checks_true_false", "Checks (True/False methods)", [
+    ('"abc".isalpha()', lambda: "abc".isalpha()),
+    ('"123".isdigit()', lambda: "123".isdigit()),
+    ('"123".isdecimal()', lambda: "123".isdecimal()),
+    ('"Ⅻ".isnumeric()', lambda: "Ⅻ".isnumeric()),
+    ('"a1".isalnum()', lambda: "a1".isalnum()),
+    ('"   ".isspace()', lambda: "   ".isspace()),
+    ('"abc".islower()', lambda: "abc".islower()),
+    ('"ABC".isupper()', lambda: "ABC".isupper()),
+    ('"Hello World".istitle()', lambda: "Hello World".istitle()),
+    ('"abc".isascii()', lambda: "abc".isascii()),
+    ('"name_1".isidentifier()', lambda: "name_1".isidentifier()),
+    ('"hi\\n".isprintable()', lambda: "hi\n".isprintable()),
+])
 
-    tbl = str.maketrans({"-": "_"})
-    demo('tbl = str.maketrans({\"-\":\"_\"})', tbl)
-    demo('\"a-b\".translate(tbl)', "a-b".translate(tbl))
+STRINGS.add_section("other_advanced", "Other advanced / useful methods", [
+    ('"hi".encode("utf-8")', lambda: "hi".encode("utf-8")),
+    ('"a\\tb".expandtabs(4)', lambda: "a\tb".expandtabs(4)),
+    ('tbl = str.maketrans({"-":"_"})', lambda: str.maketrans({"-": "_"})),
+    ('"a-b".translate(tbl)', lambda: "a-b".translate(str.maketrans({"-": "_"}))),
+    ('"unhappy".removeprefix("un")', lambda: "unhappy".removeprefix("un")),
+    ('"file.txt".removesuffix(".txt")', lambda: "file.txt".removesuffix(".txt")),
+])
 
-    demo('\"unhappy\".removeprefix(\"un\")', "unhappy".removeprefix("un"))
-    demo('\"file.txt\".removesuffix(\".txt\")', "file.txt".removesuffix(".txt"))
 
 def main() -> None:
-    formatting()
-    search_replace()
-    split_join()
-    case_conversions()
-    trim_padding()
-    checks_true_false()
-    other_advanced()
-    print("\nDone ✅")
+    STRINGS.main()
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,259 @@
+"""
+String Methods — multi-pattern search (Aho–Corasick)
+Extends the find / rfind / count / index demos in 5_String_methods.py
+
+Run:
+    python 5_String_search.py
+
+Why:
+- `text.find(p)` / `text.count(p)` walk the whole text once PER pattern.
+  With thousands of keywords that is O(patterns × text).
+- `PatternIndex` builds an Aho–Corasick automaton ONCE; one pass over the
+  text then finds every pattern.
+
+Same semantics as the str methods:
+- `find(text)`      -> {pattern: first index or -1}      (like str.find)
+- `count_all(text)` -> {pattern: non-overlapping count}  (like str.count)
+- `find_all(text)`  -> every (index, pattern), overlaps included
+- `replace_all(text, mapping)` -> leftmost-longest replacement in one pass
+
+Files:
+- `scan_file(path)` memory-maps the file and walks it in fixed-size slices,
+  so a multi-gigabyte file never has to fit in memory. Offsets are byte
+  offsets (patterns are matched as UTF-8).
+- `save(path)` / `PatternIndex.load(path)` cache a built index with pickle.
+"""
+
+import mmap
+import os
+import pickle
+import random
+import string
+import tempfile
+import time
+from collections import deque
+
+
+class _Automaton:
+    """goto / fail / output tables over any kind of symbol (chars or byte values)."""
+
+    def __init__(self, keys) -> None:
+        # keys: one sequence of symbols per pattern (a str, or UTF-8 bytes)
+        self.goto = [{}]
+        self.fail = [0]
+        self.out = [()]  # pattern ids ending in this state (fail chain included)
+        self.lengths = []
+
+        for pid, symbols in enumerate(keys):
+            self.lengths.append(len(symbols))
+            state = 0
+            for sym in symbols:
+                nxt = self.goto[state].get(sym)
+                if nxt is None:
+                    nxt = len(self.goto)
+                    self.goto[state][sym] = nxt
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.out.append(())
+                state = nxt
+            self.out[state] += (pid,)
+
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for sym, nxt in self.goto[state].items():
+                queue.append(nxt)
+                f = self.fail[state]
+                while f and sym not in self.goto[f]:
+                    f = self.fail[f]
+                target = self.goto[f].get(sym, 0)
+                self.fail[nxt] = target if target != nxt else 0
+                self.out[nxt] += self.out[self.fail[nxt]]
+
+    def scan(self, symbols, state: int = 0, offset: int = 0):
+        """Yield (end_index_exclusive, pattern_id); also returns the final state."""
+        goto, fail, out = self.goto, self.fail, self.out
+        root = goto[0]
+        for i, sym in enumerate(symbols, offset + 1):
+            while state and sym not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(sym, 0) if state else root.get(sym, 0)
+            if out[state]:
+                for pid in out[state]:
+                    yield i, pid
+        return state
+
+
+class PatternIndex:
+    def __init__(self, patterns) -> None:
+        self.patterns = list(dict.fromkeys(p for p in patterns if p))
+        self._str = _Automaton(self.patterns)
+        self._bytes = None  # built on first file/bytes scan
+
+    # ---- str API ------------------------------------------------------------
+
+    def find_all(self, text: str):
+        """Every occurrence as (index, pattern), ordered by end position."""
+        lengths = self._str.lengths
+        for end, pid in self._str.scan(text):
+            yield end - lengths[pid], self.patterns[pid]
+
+    def find(self, text: str) -> dict:
+        # one pattern's matches arrive in order, so its first match is its lowest index
+        first = dict.fromkeys(self.patterns, -1)
+        missing = len(first)
+        for start, pattern in self.find_all(text):
+            if first[pattern] == -1:
+                first[pattern] = start
+                missing -= 1
+                if not missing:
+                    break
+        return first
+
+    def count_all(self, text: str) -> dict:
+        return self._count(self._str, self._str.scan(text))
+
+    def _count(self, automaton: _Automaton, matches) -> dict:
+        lengths = automaton.lengths
+        counts = [0] * len(self.patterns)
+        next_free = [0] * len(self.patterns)  # str.count does not overlap
+        for end, pid in matches:
+            if end - lengths[pid] >= next_free[pid]:
+                counts[pid] += 1
+                next_free[pid] = end
+        return dict(zip(self.patterns, counts))
+
+    def replace_all(self, text: str, mapping: dict) -> str:
+        """Replace every pattern with mapping[pattern] in one pass.
+
+        Where matches overlap, the leftmost wins, then the longest
+        (same rule as a regex alternation sorted longest-first).
+        """
+        best = {}  # start -> longest pattern starting there
+        for start, pattern in self.find_all(text):
+            if pattern in mapping and len(pattern) > len(best.get(start, "")):
+                best[start] = pattern
+        parts, pos = [], 0
+        for start in sorted(best):
+            if start < pos:
+                continue
+            pattern = best[start]
+            parts.append(text[pos:start])
+            parts.append(mapping[pattern])
+            pos = start + len(pattern)
+        parts.append(text[pos:])
+        return "".join(parts)
+
+    # ---- files --------------------------------------------------------------
+
+    def _byte_automaton(self) -> _Automaton:
+        if self._bytes is None:
+            self._bytes = _Automaton([p.encode("utf-8") for p in self.patterns])
+        return self._bytes
+
+    def _scan_file(self, path: str, chunk_size: int):
+        automaton = self._byte_automaton()
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                state = 0
+                for offset in range(0, len(mm), chunk_size):
+                    # the automaton state carries over, so matches may span slices
+                    state = yield from automaton.scan(mm[offset:offset + chunk_size], state, offset)
+
+    def scan_file(self, path: str, chunk_size: int = 1 << 20):
+        """Yield (byte_offset, pattern) for a file, via mmap, slice by slice."""
+        lengths = self._byte_automaton().lengths
+        for end, pid in self._scan_file(path, chunk_size):
+            yield end - lengths[pid], self.patterns[pid]
+
+    def count_file(self, path: str, chunk_size: int = 1 << 20) -> dict:
+        return self._count(self._byte_automaton(), self._scan_file(path, chunk_size))
+
+    # ---- cache --------------------------------------------------------------
+
+    def save(self, path: str) -> None:
+        with open(path, "wb") as f:
+            pickle.dump(self, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path: str) -> "PatternIndex":
+        with open(path, "rb") as f:
+            index = pickle.load(f)
+        if not isinstance(index, cls):
+            raise TypeError(f"{path} does not contain a {cls.__name__}")
+        return index
+
+
+def show(title: str) -> None:
+    print("\n" + "=" * 80)
+    print(title)
+    print("=" * 80)
+
+
+def demo(expr: str, value) -> None:
+    """Pretty-print an expression and its evaluated result."""
+    print(f"{expr:<55} -> {value!r}")
+
+
+def search_demo() -> None:
+    show("Multi-pattern search")
+    idx = PatternIndex(["an", "ba", "nana"])
+    demo('"banana".find("an")', "banana".find("an"))
+    demo('"banana".count("an")', "banana".count("an"))
+    demo('idx.find("banana")', idx.find("banana"))
+    demo('idx.count_all("banana")', idx.count_all("banana"))
+    demo('list(idx.find_all("banana"))', list(idx.find_all("banana")))
+    demo('idx.replace_all("banana", {"ba": "B", "nana": "N"})', idx.replace_all("banana", {"ba": "B", "nana": "N"}))
+
+
+def benchmark(n_patterns: int = 2000, text_size: int = 1_000_000) -> None:
+    show(f"{n_patterns:,} patterns over {text_size:,} characters")
+    rng = random.Random(7)
+    alphabet = string.ascii_lowercase[:8] + " "
+    text = "".join(rng.choices(alphabet, k=text_size))
+    patterns = list({"".join(rng.choices(alphabet[:-1], k=rng.randint(4, 8))) for _ in range(n_patterns)})
+
+    start = time.perf_counter()
+    expected = {p: text.count(p) for p in patterns}
+    naive = time.perf_counter() - start
+
+    start = time.perf_counter()
+    idx = PatternIndex(patterns)
+    build = time.perf_counter() - start
+
+    start = time.perf_counter()
+    counts = idx.count_all(text)
+    scan = time.perf_counter() - start
+
+    demo("text.count(p) for every pattern (s)", round(naive, 3))
+    demo("PatternIndex(patterns) build (s)", round(build, 3))
+    demo("idx.count_all(text) (s)", round(scan, 3))
+    demo("same counts", counts == expected)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "text.txt")
+        cache = os.path.join(tmp, "index.pickle")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+        idx.save(cache)
+
+        start = time.perf_counter()
+        loaded = PatternIndex.load(cache)
+        demo("PatternIndex.load(cache) (s)", round(time.perf_counter() - start, 3))
+
+        start = time.perf_counter()
+        file_counts = loaded.count_file(path)
+        demo("loaded.count_file(path) via mmap (s)", round(time.perf_counter() - start, 3))
+        demo("same counts", file_counts == expected)
+
+
+def main() -> None:
+    search_demo()
+    benchmark()
+    print("\nDone ✅")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+"""
+Math Functions Demo — batch mode (Python)
+
+Run:
+    python 8_Math_batch.py
+
+Note:
+- `8_Math_functions.py` calls one scalar `math.*` function at a time.
+- This file evaluates a whole *family* of functions (one per demo section)
+  over a batch of values in one go.
+- Input can be a list, a tuple, an `array.array`, a `memoryview` of doubles
+  or a NumPy array.
+- If NumPy is installed it is used (fast path). Otherwise `map()` over the
+  C-level `math` functions is used (pure-Python fallback).
+  The backend is picked once, at import time.
+- Domain errors differ by backend: `math` raises ValueError,
+  NumPy returns nan (with a RuntimeWarning). The int-returning functions
+  (ceil / floor / trunc) raise like `math` on both: ValueError for nan,
+  OverflowError for +-inf.
+"""
+
+import array
+import math
+import random
+import time
+
+try:
+    import numpy as np
+except ImportError:  # pure-Python fallback
+    np = None
+
+BACKEND = "numpy" if np is not None else "python"
+
+
+# section -> {function name: (math function, numpy name or None, result typecode)}
+#   typecode is used when the input was an `array.array` / `memoryview`:
+#   "d" -> float, "q" -> int, "b" -> bool
+FAMILIES = {
+    "rounding": {
+        "ceil": (math.ceil, "ceil", "q"),
+        "floor": (math.floor, "floor", "q"),
+        "trunc": (math.trunc, "trunc", "q"),
+        "fabs": (math.fabs, "fabs", "d"),
+    },
+    "power_log": {
+        "sqrt": (math.sqrt, "sqrt", "d"),
+        "exp": (math.exp, "exp", "d"),
+        "expm1": (math.expm1, "expm1", "d"),
+        "log": (math.log, "log", "d"),
+        "log1p": (math.log1p, "log1p", "d"),
+        "log2": (math.log2, "log2", "d"),
+        "log10": (math.log10, "log10", "d"),
+    },
+    "trig": {
+        "sin": (math.sin, "sin", "d"),
+        "cos": (math.cos, "cos", "d"),
+        "tan": (math.tan, "tan", "d"),
+        "asin": (math.asin, "arcsin", "d"),
+        "acos": (math.acos, "arccos", "d"),
+        "atan": (math.atan, "arctan", "d"),
+        "degrees": (math.degrees, "degrees", "d"),
+        "radians": (math.radians, "radians", "d"),
+    },
+    "hyperbolic": {
+        "sinh": (math.sinh, "sinh", "d"),
+        "cosh": (math.cosh, "cosh", "d"),
+        "tanh": (math.tanh, "tanh", "d"),
+        "asinh": (math.asinh, "arcsinh", "d"),
+        "atanh": (math.atanh, "arctanh", "d"),
+    },
+    "special": {
+        # NumPy has no gamma/erf -> always the `map()` path
+        "gamma": (math.gamma, None, "d"),
+        "lgamma": (math.lgamma, None, "d"),
+        "erf": (math.erf, None, "d"),
+        "erfc": (math.erfc, None, "d"),
+    },
+    "float_helpers": {
+        "isfinite": (math.isfinite, "isfinite", "b"),
+        "isinf": (math.isinf, "isinf", "b"),
+        "isnan": (math.isnan, "isnan", "b"),
+    },
+}
+
+_NUMPY_DTYPES = {"d": "float64", "q": "int64", "b": "bool"}
+
+
+def _lookup(name: str):
+    for funcs in FAMILIES.values():
+        if name in funcs:
+            return funcs[name]
+    raise KeyError(f"unknown batch function: {name!r}")
+
+
+def _is_ndarray(values) -> bool:
+    return np is not None and isinstance(values, np.ndarray)
+
+
+def _python_batch(fn, typecode: str, values):
+    # map() over a C function: no Python-level loop body per element
+    if isinstance(values, (array.array, memoryview)):
+        return array.array(typecode, map(fn, values))
+    return list(map(fn, values))
+
+
+def _check_integral(values, fn) -> None:
+    """Raise like math.ceil / floor / trunc would before NumPy casts to int64."""
+    finite = np.isfinite(values)
+    if not finite.all():
+        bad = values[~finite][0]
+        fn(float(bad))  # ValueError for nan, OverflowError for +-inf
+    if values.size and np.abs(values).max() >= 2.0 ** 63:
+        raise OverflowError("result does not fit in a 64-bit int")
+
+
+def _like_input(out, values, typecode: str):
+    """A NumPy result in the same container kind as the input."""
+    if _is_ndarray(values):
+        return out
+    if isinstance(values, (array.array, memoryview)):
+        return array.array(typecode, out.tobytes())
+    return out.tolist()
+
+
+def _numpy_batch(fn, np_name, typecode: str, values, floats=None):
+    """floats: values already converted to a float64 ndarray (batch_family reuses it)."""
+    if np_name is None:
+        if _is_ndarray(values):
+            return np.fromiter(map(fn, values.tolist()), dtype=_NUMPY_DTYPES[typecode], count=len(values))
+        return _python_batch(fn, typecode, values)
+
+    if floats is None:
+        floats = np.asarray(values, dtype=np.float64)
+    if typecode == "q":
+        try:
+            _check_integral(floats, fn)
+        except OverflowError:
+            if not _is_ndarray(values) and not isinstance(values, (array.array, memoryview)):
+                return _python_batch(fn, typecode, values)  # a list: Python ints have no upper bound
+            raise
+    out = getattr(np, np_name)(floats)
+    out = out.astype(_NUMPY_DTYPES[typecode], copy=False)
+    return _like_input(out, values, typecode)
+
+
+def batch(name: str, values):
+    """Apply one math function (e.g. "sin") to every value.
+
+    The result has the same "kind" as the input: list -> list,
+    array.array/memoryview -> array.array, ndarray -> ndarray.
+    """
+    fn, np_name, typecode = _lookup(name)
+    if np is None:
+        return _python_batch(fn, typecode, values)
+    return _numpy_batch(fn, np_name, typecode, values)
+
+
+def batch_family(section: str, values) -> dict:
+    """Apply every function of a demo section to the same batch of values."""
+    if np is None:
+        return {name: batch(name, values) for name in FAMILIES[section]}
+    floats = np.asarray(values, dtype=np.float64)  # convert once, not once per function
+    return {name: _numpy_batch(fn, np_name, typecode, values, floats)
+            for name, (fn, np_name, typecode) in FAMILIES[section].items()}
+
+
+def show(title: str) -> None:
+    print("\n" + "=" * 80)
+    print(title)
+    print("=" * 80)
+
+
+def demo(expr: str, value) -> None:
+    print(f"{expr:<60} -> {value!r}")
+
+
+def batch_demo() -> None:
+    show(f"Batch evaluation (backend: {BACKEND})")
+    values = [0.25, 0.5, 0.75]
+    demo("batch('sqrt', [0.25, 0.5, 0.75])", batch("sqrt", values))
+    demo("batch('floor', array('d', [1.5, -1.5]))", batch("floor", array.array("d", [1.5, -1.5])))
+    demo("batch('isnan', [1.0, math.nan])", batch("isnan", [1.0, math.nan]))
+    demo("batch_family('hyperbolic', [0.5])", batch_family("hyperbolic", [0.5]))
+
+
+def benchmark(n: int = 200_000) -> None:
+    show(f"Scalar vs batched throughput ({n:,} values per function)")
+    # (0.1, 0.9) is inside the domain of every function above
+    values = [random.uniform(0.1, 0.9) for _ in range(n)]
+    print(f"{'section':<15}{'scalar Mvals/s':>18}{'batched Mvals/s':>18}{'speedup':>10}")
+
+    for section, funcs in FAMILIES.items():
+        total = n * len(funcs)
+
+        start = time.perf_counter()
+        for fn, _, _ in funcs.values():
+            out = []
+            for x in values:  # one call at a time, like demo()
+                out.append(fn(x))
+        scalar = time.perf_counter() - start
+
+        start = time.perf_counter()
+        batch_family(section, values)
+        batched = time.perf_counter() - start
+
+        print(f"{section:<15}{total / scalar / 1e6:>18.2f}{total / batched / 1e6:>18.2f}"
+              f"{scalar / batched:>9.1f}x")
+
+
+def main() -> None:
+    batch_demo()
+    benchmark()
+    print("\nDone ✅")
+
+
+if __name__ == "__main__":
+    main()
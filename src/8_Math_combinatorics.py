@@ -0,0 +1,208 @@
+"""
+Combinatorics Demo — memoized engine (Python)
+
+Run:
+    python 8_Math_combinatorics.py
+
+Note:
+- The "combinatorics" section of `8_Math_functions.py` calls `math.comb`,
+  `math.perm`, ... from scratch for every query.
+- Without a modulus, one-off queries go straight to `math.factorial` /
+  `math.perm` / `math.comb` (C code; tables of exact big factorials would
+  only cost memory). What `Combinatorics` adds:
+    * a bounded LRU cache of whole Pascal rows for `comb_row(n)`
+    * with a prime `modulus` p: factorial and inverse-factorial tables mod p
+      (grown on demand, at most `max_table` entries), so `comb(n, k) % p`
+      is 3 multiplications. The tables stop at p - 1: above that n! = 0
+      mod p, and comb uses Lucas' theorem instead. Queries past the table
+      cap are computed in O(k) without growing it.
+- Bulk helpers: `comb_row(n)`, `gcd_many(iterable)`, `lcm_many(iterable)`.
+"""
+
+import math
+import time
+from functools import lru_cache, reduce
+
+
+class Combinatorics:
+    def __init__(self, modulus: int | None = None, row_cache_size: int = 128, max_table: int = 1 << 20) -> None:
+        self.modulus = modulus
+        self.max_table = max_table  # largest n kept in the modular tables
+        self._fact = [1]
+        self._inv_fact = [1]
+        # one LRU per instance (a decorated method would share it across instances)
+        self._row = lru_cache(maxsize=row_cache_size)(self._build_row)
+
+    # ---- modular tables -----------------------------------------------------
+
+    def _grow(self, n: int) -> int:
+        """Extend the tables towards n; returns the largest n they now cover."""
+        fact = self._fact
+        m = self.modulus
+        # p! = 0 mod p: an inverse from it would zero the whole table
+        n = min(n, m - 1, self.max_table)
+        start = len(fact)
+        if n < start:
+            return len(fact) - 1
+        for i in range(start, n + 1):
+            fact.append(fact[-1] * i % m)
+        # one modular inverse (Fermat, m prime), then walk back down
+        top = [0] * (n + 1 - start)
+        top[-1] = pow(fact[n], m - 2, m)
+        for i in range(n, start, -1):
+            top[i - start - 1] = top[i - start] * i % m
+        self._inv_fact.extend(top)
+        return n
+
+    def precompute(self, max_n: int) -> None:
+        """Build the modular factorial (and inverse) tables up to max_n in one go."""
+        if self.modulus:
+            self._grow(max_n)
+
+    def _falling(self, n: int, k: int) -> int:
+        """n * (n-1) * ... * (n-k+1) mod p, without tables."""
+        m = self.modulus
+        result = 1
+        for i in range(n - k + 1, n + 1):
+            result = result * i % m
+        return result
+
+    # ---- single queries -----------------------------------------------------
+
+    def factorial(self, n: int) -> int:
+        if n < 0:
+            raise ValueError("factorial() not defined for negative values")
+        m = self.modulus
+        if not m:
+            return math.factorial(n)
+        if n >= m:
+            return 0
+        top = self._grow(n)
+        if n <= top:
+            return self._fact[n]
+        return self._fact[top] * self._falling(n, n - top) % m
+
+    def _comb_small(self, n: int, k: int) -> int:
+        """C(n, k) mod p for 0 <= n < p."""
+        if k > n:
+            return 0
+        k = min(k, n - k)
+        m = self.modulus
+        top = self._grow(n)
+        if n <= top:
+            return self._fact[n] * self._inv_fact[k] % m * self._inv_fact[n - k] % m
+        # past the table cap: n! / (n-k)! in O(k), over k! (from the table when it fits)
+        k_fact_inv = self._inv_fact[k] if k <= top else pow(self.factorial(k), m - 2, m)
+        return self._falling(n, k) * k_fact_inv % m
+
+    def comb(self, n: int, k: int) -> int:
+        m = self.modulus
+        if not m:
+            return math.comb(n, k) if 0 <= k <= n else 0
+        if k < 0 or k > n:
+            return 0
+        # Lucas: C(n, k) = prod C(n_i, k_i) mod p over the base-p digits of n and k
+        result = 1
+        while n and result:
+            n, n_digit = divmod(n, m)
+            k, k_digit = divmod(k, m)
+            result = result * self._comb_small(n_digit, k_digit) % m
+        return result
+
+    def perm(self, n: int, k: int) -> int:
+        m = self.modulus
+        if not m:
+            return math.perm(n, k) if 0 <= k <= n else 0
+        if k < 0 or k > n:
+            return 0
+        if n < m:
+            top = self._grow(n)
+            if n <= top:
+                return self._fact[n] * self._inv_fact[n - k] % m
+            return self._falling(n, k)
+        return self.comb(n, k) * self.factorial(k) % m  # P(n, k) = C(n, k) * k!
+
+    # ---- bulk queries -------------------------------------------------------
+
+    def _build_row(self, n: int) -> tuple:
+        # C(n, k+1) = C(n, k) * (n - k) / (k + 1)  -> no factorials needed
+        half = [1]
+        c = 1
+        for k in range(n // 2):
+            c = c * (n - k) // (k + 1)
+            half.append(c)
+        mirror = half[: n + 1 - len(half)]
+        return tuple(half + mirror[::-1])
+
+    def comb_row(self, n: int) -> tuple:
+        """Whole Pascal row: (C(n, 0), C(n, 1), ..., C(n, n))."""
+        if self.modulus:
+            return tuple(self.comb(n, k) for k in range(n + 1))
+        return self._row(n)
+
+    def row_cache_info(self):
+        return self._row.cache_info()
+
+    @staticmethod
+    def gcd_many(values) -> int:
+        return math.gcd(*values)
+
+    @staticmethod
+    def lcm_many(values) -> int:
+        return reduce(math.lcm, values, 1)
+
+
+def show(title: str) -> None:
+    print("\n" + "=" * 80)
+    print(title)
+    print("=" * 80)
+
+
+def demo(expr: str, value) -> None:
+    print(f"{expr:<60} -> {value!r}")
+
+
+def combinatorics_demo() -> None:
+    show("Memoized combinatorics")
+    c = Combinatorics()
+    demo("c.factorial(5)", c.factorial(5))
+    demo("c.comb(5, 2)", c.comb(5, 2))
+    demo("c.perm(5, 2)", c.perm(5, 2))
+    demo("c.comb_row(5)", c.comb_row(5))
+    demo("c.gcd_many([12, 18, 30])", c.gcd_many([12, 18, 30]))
+    demo("c.lcm_many([12, 18, 30])", c.lcm_many([12, 18, 30]))
+    demo("c.row_cache_info()", c.row_cache_info())
+
+    p = Combinatorics(modulus=1_000_000_007)
+    demo("Combinatorics(modulus=10**9+7).comb(1000, 500)", p.comb(1000, 500))
+    demo("math.comb(1000, 500) % (10**9+7)", math.comb(1000, 500) % 1_000_000_007)
+
+
+def benchmark(n: int = 2000, rounds: int = 5) -> None:
+    show(f"math.comb vs cached comb_row (all k for n={n}, {rounds} rounds)")
+    c = Combinatorics()
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        row = [math.comb(n, k) for k in range(n + 1)]
+    plain = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        cached_row = c.comb_row(n)
+    cached = time.perf_counter() - start
+
+    demo("math.comb for each k (seconds)", round(plain, 4))
+    demo("Combinatorics.comb_row (seconds)", round(cached, 4))
+    demo("same row", tuple(row) == cached_row)
+    demo("speedup", f"{plain / cached:.1f}x")
+
+
+def main() -> None:
+    combinatorics_demo()
+    benchmark()
+    print("\nDone ✅")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,145 +3,119 @@ Math Functions Demo (Python)
 
 Run:
     python 8_Math_functions.py
+    python 8_Math_functions.py --list          # section names
+    python 8_Math_functions.py -s trig         # one section only
+    python 8_Math_functions.py -n log          # entries containing "log"
 
 Note:
 - Uses the `math` module + a few built-in numeric helpers.
+- Each entry is declared once in the tables below and only evaluated when
+  its section runs (see `demo_registry.py`).
 """
 
 import math
 
-
-def show(title: str) -> None:
-    print("\n" + "=" * 80)
-    print(title)
-    print("=" * 80)
-
-
-def demo(expr: str, value) -> None:
-    print(f"{expr:<60} -> {value!r}")
-
-
-def builtins_demo() -> None:
-    show("Built-in numeric helpers (no import)")
-    demo("abs(-5)", abs(-5))
-    demo("round(3.14159, 2)", round(3.14159, 2))
-    demo("pow(2, 3)", pow(2, 3))
-    demo("divmod(10, 3)", divmod(10, 3))
-    demo("sum([1, 2, 3])", sum([1, 2, 3]))
-    demo("min(3, 7, 2)", min(3, 7, 2))
-    demo("max(3, 7, 2)", max(3, 7, 2))
-
-
-def constants_demo() -> None:
-    show("math constants")
-    for name in ["pi", "e", "tau", "inf", "nan"]:
-        if hasattr(math, name):
-            demo(f"math.{name}", getattr(math, name))
-
-
-def rounding_demo() -> None:
-    show("Rounding / integer-like operations")
-    demo("math.ceil(3.1)", math.ceil(3.1))
-    demo("math.floor(3.9)", math.floor(3.9))
-    demo("math.trunc(-3.9)", math.trunc(-3.9))
-    demo("math.fabs(-5)", math.fabs(-5))
-    demo("math.fmod(7, 3)", math.fmod(7, 3))
-    if hasattr(math, "remainder"):
-        demo("math.remainder(8, 3)", math.remainder(8, 3))
-    demo("math.modf(3.14)", math.modf(3.14))
-    demo("math.frexp(8)", math.frexp(8))
-    demo("math.ldexp(0.5, 4)", math.ldexp(0.5, 4))
-    demo("math.copysign(3, -1)", math.copysign(3, -1))
-    demo("math.isclose(0.1 + 0.2, 0.3)", math.isclose(0.1 + 0.2, 0.3))
-
-
-def power_log_demo() -> None:
-    show("Powers / roots / logarithms")
-    demo("math.sqrt(16)", math.sqrt(16))
-    demo("math.isqrt(17)", math.isqrt(17))
-    demo("math.pow(2, 3)", math.pow(2, 3))
-    demo("math.exp(1)", math.exp(1))
-    demo("math.exp2(10)", math.exp2(10))
-    demo("math.expm1(1)", math.expm1(1))
-    demo("math.log(8, 2)", math.log(8, 2))
-    demo("math.log1p(0.5)", math.log1p(0.5))
-    demo("math.log2(8)", math.log2(8))
-    demo("math.log10(1000)", math.log10(1000))
-    if hasattr(math, "cbrt"):
-        demo("math.cbrt(27)", math.cbrt(27))
-
-
-def trig_demo() -> None:
-    show("Trigonometry (radians)")
-    demo("math.sin(math.pi/2)", math.sin(math.pi / 2))
-    demo("math.cos(0)", math.cos(0))
-    demo("math.tan(0)", math.tan(0))
-    demo("math.asin(1)", math.asin(1))
-    demo("math.acos(1)", math.acos(1))
-    demo("math.atan(1)", math.atan(1))
-    demo("math.atan2(1, 1)", math.atan2(1, 1))
-    demo("math.degrees(math.pi)", math.degrees(math.pi))
-    demo("math.radians(180)", math.radians(180))
-
-
-def hyperbolic_demo() -> None:
-    show("Hyperbolic functions")
-    demo("math.sinh(0)", math.sinh(0))
-    demo("math.cosh(0)", math.cosh(0))
-    demo("math.tanh(0)", math.tanh(0))
-    demo("math.asinh(1)", math.asinh(1))
-    demo("math.acosh(1)", math.acosh(1))
-    demo("math.atanh(0.5)", math.atanh(0.5))
-
-
-def combinatorics_demo() -> None:
-    show("Combinatorics / number theory")
-    demo("math.factorial(5)", math.factorial(5))
-    demo("math.comb(5, 2)", math.comb(5, 2))
-    demo("math.perm(5, 2)", math.perm(5, 2))
-    demo("math.gcd(12, 18)", math.gcd(12, 18))
-    demo("math.lcm(12, 18)", math.lcm(12, 18))
-
-
-def geometry_demo() -> None:
-    show("Geometry / distances / precision helpers")
-    demo("math.hypot(3, 4)", math.hypot(3, 4))
-    demo("math.dist([0,0], [3,4])", math.dist([0, 0], [3, 4]))
-    demo("math.fsum([0.1] * 10)", math.fsum([0.1] * 10))
-    demo("math.prod([1,2,3,4])", math.prod([1, 2, 3, 4]))
-
-
-def special_demo() -> None:
-    show("Special functions")
-    demo("math.gamma(6)", math.gamma(6))
-    demo("math.lgamma(6)", math.lgamma(6))
-    demo("math.erf(1)", math.erf(1))
-    demo("math.erfc(1)", math.erfc(1))
-
-
-def float_helpers_demo() -> None:
-    show("Float checks / stepping")
-    demo("math.isfinite(1.0)", math.isfinite(1.0))
-    demo("math.isinf(math.inf)", math.isinf(math.inf))
-    demo("math.isnan(math.nan)", math.isnan(math.nan))
-    if hasattr(math, "nextafter"):
-        demo("math.nextafter(1.0, 2.0)", math.nextafter(1.0, 2.0))
-    if hasattr(math, "ulp"):
-        demo("math.ulp(1.0)", math.ulp(1.0))
+from demo_registry import DemoRegistry
+
+MATH = DemoRegistry(width=60)
+
+MATH.add_section("builtins", "Built-in numeric helpers (no import)", [
+    ("abs(-5)", lambda: abs(-5)),
+    ("round(3.14159, 2)", lambda: round(3.14159, 2)),
+    ("pow(2, 3)", lambda: pow(2, 3)),
+    ("divmod(10, 3)", lambda: divmod(10, 3)),
+    ("sum([1, 2, 3])", lambda: sum([1, 2, 3])),
+    ("min(3, 7, 2)", lambda: min(3, 7, 2)),
+    ("max(3, 7, 2)", lambda: max(3, 7, 2)),
+])
+
+MATH.add_section("constants", "math constants", [
+    (f"math.{name}", lambda name=name: getattr(math, name), lambda name=name: hasattr(math, name))
+    for name in ["pi", "e", "tau", "inf", "nan"]
+])
+
+MATH.add_section("rounding", "Rounding / integer-like operations", [
+    ("math.ceil(3.1)", lambda: math.ceil(3.1)),
+    ("math.floor(3.9)", lambda: math.floor(3.9)),
+    ("math.trunc(-3.9)", lambda: math.trunc(-3.9)),
+    ("math.fabs(-5)", lambda: math.fabs(-5)),
+    ("math.fmod(7, 3)", lambda: math.fmod(7, 3)),
+    ("math.remainder(8, 3)", lambda: math.remainder(8, 3), lambda: hasattr(math, "remainder")),
+    ("math.modf(3.14)", lambda: math.modf(3.14)),
+    ("math.frexp(8)", lambda: math.frexp(8)),
+    ("math.ldexp(0.5, 4)", lambda: math.ldexp(0.5, 4)),
+    ("math.copysign(3, -1)", lambda: math.copysign(3, -1)),
+    ("math.isclose(0.1 + 0.2, 0.3)", lambda: math.isclose(0.1 + 0.2, 0.3)),
+])
+
+MATH.add_section("power_log", "Powers / roots / logarithms", [
+    ("math.sqrt(16)", lambda: math.sqrt(16)),
+    ("math.isqrt(17)", lambda: math.isqrt(17)),
+    ("math.pow(2, 3)", lambda: math.pow(2, 3)),
+    ("math.exp(1)", lambda: math.exp(1)),
+    ("math.exp2(10)", lambda: math.exp2(10), lambda: hasattr(math, "exp2")),
+    ("math.expm1(1)", lambda: math.expm1(1)),
+    ("math.log(8, 2)", lambda: math.log(8, 2)),
+    ("math.log1p(0.5)", lambda: math.log1p(0.5)),
+    ("math.log2(8)", lambda: math.log2(8)),
+    ("math.log10(1000)", lambda: math.log10(1000)),
+    ("math.cbrt(27)", lambda: math.cbrt(27), lambda: hasattr(math, "cbrt")),
+])
+
+MATH.add_section("trig", "Trigonometry (radians)", [
+    ("math.sin(math.pi/2)", lambda: math.sin(math.pi / 2)),
+    ("math.cos(0)", lambda: math.cos(0)),
+    ("math.tan(0)", lambda: math.tan(0)),
+    ("math.asin(1)", lambda: math.asin(1)),
+    ("math.acos(1)", lambda: math.acos(1)),
+    ("math.atan(1)", lambda: math.atan(1)),
+    ("math.atan2(1, 1)", lambda: math.atan2(1, 1)),
+    ("math.degrees(math.pi)", lambda: math.degrees(math.pi)),
+    ("math.radians(180)", lambda: math.radians(180)),
+])
+
+MATH.add_section("hyperbolic", "Hyperbolic functions", [
+    ("math.sinh(0)", lambda: math.sinh(0)),
+    ("math.cosh(0)", lambda: math.cosh(0)),
+    ("math.tanh(0)", lambda: math.tanh(0)),
+    ("math.asinh(1)", lambda: math.asinh(1)),
+    ("math.acosh(1)", lambda: math.acosh(1)),
+    ("math.atanh(0.5)", lambda: math.atanh(0.5)),
+])
+
+MATH.add_section("combinatorics", "Combinatorics / number theory", [
+    ("math.factorial(5)", lambda: math.factorial(5)),
+    ("math.comb(5, 2)", lambda: math.comb(5, 2)),
+    ("math.perm(5, 2)", lambda: math.perm(5, 2)),
+    ("math.gcd(12, 18)", lambda: math.gcd(12, 18)),
+    ("math.lcm(12, 18)", lambda: math.lcm(12, 18)),
+])
+
+MATH.add_section("geometry", "Geometry / distances / precision helpers", [
+    ("math.hypot(3, 4)", lambda: math.hypot(3, 4)),
+    ("math.dist([0,0], [3,4])", lambda: math.dist([0, 0], [3, 4])),
+    ("math.fsum([0.1] * 10)", lambda: math.fsum([0.1] * 10)),
+    ("math.prod([1,2,3,4])", lambda: math.prod([1, 2, 3, 4])),
+])
+
+MATH.add_section("special", "Special functions", [
+    ("math.gamma(6)", lambda: math.gamma(6)),
+    ("math.lgamma(6)", lambda: math.lgamma(6)),
+    ("math.erf(1)", lambda: math.erf(1)),
+    ("math.erfc(1)", lambda: math.erfc(1)),
+])
+
+MATH.add_section("float_helpers", "Float checks / stepping", [
+    ("math.isfinite(1.0)", lambda: math.isfinite(1.0)),
+    ("math.isinf(math.inf)", lambda: math.isinf(math.inf)),
+    ("math.isnan(math.nan)", lambda: math.isnan(math.nan)),
+    ("math.nextafter(1.0, 2.0)", lambda: math.nextafter(1.0, 2.0), lambda: hasattr(math, "nextafter")),
+    ("math.ulp(1.0)", lambda: math.ulp(1.0), lambda: hasattr(math, "ulp")),
+])
 
 
 def main() -> None:
-    builtins_demo()
-    constants_demo()
-    rounding_demo()
-    power_log_demo()
-    trig_demo()
-    hyperbolic_demo()
-    combinatorics_demo()
-    geometry_demo()
-    special_demo()
-    float_helpers_demo()
-    print("\nDone ✅")
+    MATH.main()
 
 
 if __name__ == "__main__":
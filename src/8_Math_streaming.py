@@ -0,0 +1,315 @@
+"""
+Geometry / precision helpers — streaming version (Python)
+
+Run:
+    python 8_Math_streaming.py
+
+Note:
+- The "geometry" section of `8_Math_functions.py` calls `math.fsum`, `math.prod`,
+  `math.dist`, `math.hypot` on tiny lists that are fully in memory.
+- `StreamAggregator` gets the same answers from data that arrives in
+  chunks (a generator, or a memory-mapped binary file of doubles),
+  using a few floats of state no matter how long the stream is.
+- `merge()` combines partial aggregators, e.g. one per worker process.
+
+How it stays exact:
+- The running sum is kept as a short list of non-overlapping floats
+  ("partials") whose exact sum is the exact sum of every value seen.
+  Each chunk is folded in with a few `math.fsum` calls (C speed),
+  so `.sum` is correctly rounded, exactly like `math.fsum(all_values)`.
+- The product is kept as mantissa * 2**exponent, so it never overflows
+  or underflows mid-stream (rounding error is the same as `math.prod`).
+- Norms scale every value by a power of two (an exact operation) before
+  squaring, so huge or tiny values do not overflow like `x * x` would.
+"""
+
+import array
+import math
+import mmap
+import os
+import random
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, repeat
+
+DOUBLE_SIZE = 8
+
+
+def _as_sequence(chunk):
+    # the exact-sum step needs two passes over a chunk
+    if isinstance(chunk, (list, tuple, array.array, memoryview)):
+        return chunk
+    return list(chunk)
+
+
+def _exact_partials(values) -> list:
+    """Non-overlapping floats whose exact sum equals the exact sum of values.
+
+    `math.fsum` sums exactly internally and rounds once. Subtracting the
+    rounded result and summing again gives the next (smaller) float, until
+    nothing is left over.
+    """
+    terms = []
+    while True:
+        t = math.fsum(chain(values, (-x for x in terms)))
+        if t == 0.0:
+            return terms
+        terms.append(t)
+
+
+class ExactSum:
+    def __init__(self) -> None:
+        self.partials = []
+        self.special = 0.0  # sum of inf/nan values, kept apart
+
+    def add(self, values) -> None:
+        values = _as_sequence(values)
+        try:
+            total = math.fsum(values)
+        except ValueError:  # inf + -inf
+            total = math.nan
+        if not math.isfinite(total):
+            self.special += total
+            return
+        self.partials = _exact_partials(list(chain(self.partials, values)))
+
+    def merge(self, other: "ExactSum") -> None:
+        self.special += other.special
+        self.partials = _exact_partials(self.partials + other.partials)
+
+    @property
+    def value(self) -> float:
+        if self.special != 0.0 or math.isnan(self.special):
+            return self.special
+        return math.fsum(self.partials)
+
+
+class RunningProduct:
+    def __init__(self) -> None:
+        self.mantissa = 1.0
+        self.exponent = 0
+
+    def add(self, values) -> None:
+        m, e = self.mantissa, self.exponent
+        frexp = math.frexp
+        for x in values:
+            m, k = frexp(m * x)
+            e += k
+        self.mantissa, self.exponent = m, e
+
+    def merge(self, other: "RunningProduct") -> None:
+        m, k = math.frexp(self.mantissa * other.mantissa)
+        self.mantissa = m
+        self.exponent += other.exponent + k
+
+    @property
+    def value(self) -> float:
+        try:
+            return math.ldexp(self.mantissa, self.exponent)
+        except OverflowError:
+            return math.copysign(math.inf, self.mantissa)
+
+
+class RunningNorm:
+    """sqrt(x0**2 + x1**2 + ...) — like `math.hypot(*values)`."""
+
+    def __init__(self) -> None:
+        # values are scaled by 2**-scale_exp before squaring; scale_exp is the
+        # exponent of the largest value seen (None until a non-zero value arrives)
+        self.scale_exp = None
+        self.squares = ExactSum()
+
+    def _rescale(self, new_exp: int) -> None:
+        shift = 2 * (self.scale_exp - new_exp)
+        self.squares.partials = [math.ldexp(p, shift) for p in self.squares.partials]
+        self.scale_exp = new_exp
+
+    def add(self, values) -> None:
+        values = _as_sequence(values)
+        if not values:
+            return
+        largest = max(map(abs, values))
+        if not math.isfinite(largest):
+            self.squares.special += largest
+            return
+        if largest == 0.0:
+            return
+        exp = math.frexp(largest)[1]
+        if self.scale_exp is None:
+            self.scale_exp = exp
+        elif exp > self.scale_exp:
+            self._rescale(exp)
+        # ldexp, not a multiplication by 2.0**-exp: that factor overflows for subnormal values
+        self.squares.add([x * x for x in map(math.ldexp, values, repeat(-self.scale_exp))])
+
+    def merge(self, other: "RunningNorm") -> None:
+        self.squares.special += other.squares.special
+        if other.scale_exp is None:
+            return
+        if self.scale_exp is None:
+            self.scale_exp = other.scale_exp
+        elif other.scale_exp > self.scale_exp:
+            self._rescale(other.scale_exp)
+        shift = 2 * (other.scale_exp - self.scale_exp)
+        self.squares.partials = _exact_partials(
+            self.squares.partials + [math.ldexp(p, shift) for p in other.squares.partials])
+
+    @property
+    def value(self) -> float:
+        return math.ldexp(math.sqrt(self.squares.value), self.scale_exp or 0)
+
+
+class StreamAggregator:
+    """Running count / sum / product / norm, plus a distance between two streams."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self._sum = ExactSum()
+        self._prod = RunningProduct()
+        self._norm = RunningNorm()
+        self._dist = RunningNorm()
+
+    def update(self, chunk) -> None:
+        chunk = _as_sequence(chunk)
+        self._sum.add(chunk)  # OverflowError (fsum) here: the chunk is not counted
+        self._prod.add(chunk)
+        self._norm.add(chunk)
+        self.count += len(chunk)
+
+    def update_distance(self, p_chunk, q_chunk) -> None:
+        """Feed matching chunks of two points p and q (like `math.dist(p, q)`)."""
+        if len(p_chunk) != len(q_chunk):
+            raise ValueError("both points must have the same dimension")
+        self._dist.add([p - q for p, q in zip(p_chunk, q_chunk)])
+
+    def merge(self, other: "StreamAggregator") -> "StreamAggregator":
+        self.count += other.count
+        self._sum.merge(other._sum)
+        self._prod.merge(other._prod)
+        self._norm.merge(other._norm)
+        self._dist.merge(other._dist)
+        return self
+
+    @property
+    def sum(self) -> float:
+        return self._sum.value
+
+    @property
+    def prod(self) -> float:
+        return self._prod.value
+
+    @property
+    def norm(self) -> float:
+        return self._norm.value
+
+    @property
+    def dist(self) -> float:
+        return self._dist.value
+
+
+def iter_doubles(path: str, chunk_size: int = 65_536, start: int = 0, stop: int | None = None):
+    """Yield memoryview chunks of native doubles from a binary file (via mmap).
+
+    A chunk is only valid until the next one is requested.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            doubles = memoryview(mm).cast("d")
+            try:
+                stop = len(doubles) if stop is None else min(stop, len(doubles))
+                for i in range(start, stop, chunk_size):
+                    chunk = doubles[i:min(i + chunk_size, stop)]
+                    try:
+                        yield chunk
+                    finally:
+                        chunk.release()
+            finally:
+                doubles.release()
+
+
+def aggregate_file(path: str, start: int = 0, stop: int | None = None) -> StreamAggregator:
+    agg = StreamAggregator()
+    for chunk in iter_doubles(path, start=start, stop=stop):
+        agg.update(chunk)
+    return agg
+
+
+def aggregate_file_parallel(path: str, workers: int = 4) -> StreamAggregator:
+    """Each worker aggregates one slice of the file; the parent merges them."""
+    total = os.path.getsize(path) // DOUBLE_SIZE
+    step = -(-total // workers) or 1
+    bounds = [(lo, min(lo + step, total)) for lo in range(0, total, step)]
+    result = StreamAggregator()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(aggregate_file, path, lo, hi) for lo, hi in bounds]
+        for fut in futures:
+            result.merge(fut.result())
+    return result
+
+
+def show(title: str) -> None:
+    print("\n" + "=" * 80)
+    print(title)
+    print("=" * 80)
+
+
+def demo(expr: str, value) -> None:
+    print(f"{expr:<60} -> {value!r}")
+
+
+def streaming_demo() -> None:
+    show("Streaming aggregator (chunks from a generator)")
+    agg = StreamAggregator()
+    for chunk in ([0.1] * 5, [0.1] * 5):
+        agg.update(chunk)
+    demo("math.fsum([0.1] * 10)", math.fsum([0.1] * 10))
+    demo("agg.sum  (2 chunks of [0.1] * 5)", agg.sum)
+    demo("sum([0.1] * 10)  (plain, drifts)", sum([0.1] * 10))
+
+    agg = StreamAggregator()
+    agg.update([1, 2])
+    agg.update([3, 4])
+    demo("math.prod([1,2,3,4])", math.prod([1, 2, 3, 4]))
+    demo("agg.prod", agg.prod)
+    demo("math.hypot(1, 2, 3, 4)", math.hypot(1, 2, 3, 4))
+    demo("agg.norm", agg.norm)
+
+    agg.update_distance([0, 0], [3, 4])
+    demo("math.dist([0,0], [3,4])", math.dist([0, 0], [3, 4]))
+    demo("agg.dist", agg.dist)
+
+    big = StreamAggregator()
+    big.update([1e300, 1e300, 1e-300])
+    demo("math.prod([1e300, 1e300, 1e-300])", math.prod([1e300, 1e300, 1e-300]))
+    demo("agg.prod  (no intermediate overflow)", big.prod)
+
+
+def file_demo(n: int = 1_000_000) -> None:
+    show(f"Memory-mapped file of {n:,} doubles, merged across workers")
+    values = array.array("d", (random.uniform(-1e6, 1e6) for _ in range(n)))
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "doubles.bin")
+        with open(path, "wb") as f:
+            values.tofile(f)
+
+        serial = aggregate_file(path)
+        parallel = aggregate_file_parallel(path)
+
+    demo("math.fsum(values)", math.fsum(values))
+    demo("aggregate_file(path).sum", serial.sum)
+    demo("aggregate_file_parallel(path).sum", parallel.sum)
+    demo("math.hypot(*values)", math.hypot(*values))
+    demo("aggregate_file_parallel(path).norm", parallel.norm)
+    demo("count", parallel.count)
+
+
+def main() -> None:
+    streaming_demo()
+    file_demo()
+    print("\nDone ✅")
+
+
+if __name__ == "__main__":
+    main()
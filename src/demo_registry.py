@@ -0,0 +1,78 @@
+"""demo_registry.py
+
+Shared, table-driven registry for the "expression -> result" demo scripts
+(`5_String_methods.py`, `8_Math_functions.py`).
+
+Each entry is declared once as (expression text, callable). Nothing is
+evaluated until a section is run, and every result is cached, so running
+the same section again only prints.
+
+Run a demo script with filters:
+    python 8_Math_functions.py                      # everything
+    python 8_Math_functions.py --list               # section names
+    python 8_Math_functions.py -s trig -s special   # only these sections
+    python 8_Math_functions.py -n log               # entries whose text contains "log"
+"""
+
+import sys
+
+
+def show(title: str) -> None:
+    print("\n" + "=" * 80)
+    print(title)
+    print("=" * 80)
+
+
+class DemoRegistry:
+    def __init__(self, width: int = 60) -> None:
+        self.width = width
+        self.sections = {}  # name -> (title, entries)
+        self._cache = {}  # (section, expr) -> value
+
+    def add_section(self, name: str, title: str, entries) -> None:
+        """entries: (expr, fn) or (expr, fn, when) tuples.
+
+        `when` is an optional zero-argument check; the entry is skipped when
+        it returns False (e.g. a math function missing on older Pythons).
+        """
+        self.sections[name] = (title, [e if len(e) == 3 else (*e, None) for e in entries])
+
+    def evaluate(self, section: str, expr: str, fn):
+        key = (section, expr)
+        if key not in self._cache:
+            self._cache[key] = fn()
+        return self._cache[key]
+
+    def demo(self, expr: str, value) -> None:
+        print(f"{expr:<{self.width}} -> {value!r}")
+
+    def run(self, sections=None, name: str | None = None) -> None:
+        for section in sections or self.sections:
+            title, entries = self.sections[section]
+            selected = [(expr, fn) for expr, fn, when in entries
+                        if (name is None or name in expr) and (when is None or when())]
+            if not selected:
+                continue
+            show(title)
+            for expr, fn in selected:
+                self.demo(expr, self.evaluate(section, expr, fn))
+
+    def main(self, argv=None) -> None:
+        argv = sys.argv[1:] if argv is None else argv
+        if not argv:
+            self.run()
+        else:
+            import argparse  # only paid for when filtering
+
+            parser = argparse.ArgumentParser()
+            parser.add_argument("-s", "--section", action="append", choices=list(self.sections),
+                                help="run only this section (repeatable)")
+            parser.add_argument("-n", "--name", help="run only entries whose text contains NAME")
+            parser.add_argument("--list", action="store_true", help="list section names and exit")
+            args = parser.parse_args(argv)
+            if args.list:
+                for section, (title, entries) in self.sections.items():
+                    print(f"{section:<20} {title} ({len(entries)} entries)")
+                return
+            self.run(args.section, args.name)
+        print("\nDone ✅")
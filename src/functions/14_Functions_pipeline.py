@@ -0,0 +1,290 @@
+"""14_Functions_pipeline.py
+
+Run:
+    python 14_Functions_pipeline.py
+
+10_lambda_demo.py builds a whole new list for every step:
+
+    squares = transform_list(items, lambda x: x * x)
+    shifted = transform_list(squares, lambda x: x + 1)
+
+Pipeline describes the steps first and runs them in ONE pass at the end:
+
+    Pipeline(items).map(lambda x: x * x).filter(lambda x: x % 3).map(lambda x: x + 1).sum()
+
+- Lazy and fused: the stages become a chain of map() / filter() iterators,
+  so each item flows through every stage before the next item is read and
+  no intermediate list is ever built (the loops themselves run in C).
+- .parallel(workers, chunksize): the items are cut into chunks and each
+  chunk runs the whole chain in a worker process. The functions must be
+  picklable (module-level def, not lambda), and a reduce function must be
+  associative, since chunks are reduced separately and then combined.
+- .vectorize(): if NumPy is installed, the items are numbers and every
+  stage is a pure-arithmetic function of its one argument (checked on the
+  bytecode: only its argument, numeric constants, arithmetic and
+  comparisons), the SAME lambdas are called once on a whole ndarray.
+  NumPy integers are 64-bit: results that overflow int64 wrap around
+  instead of growing like Python ints, so only use it when they fit.
+  Anything NumPy refuses to do falls back to the plain pass.
+
+compose(f, g, ...) is the function-level version: compose(fn, fn) is
+run_twice(fn, .).
+"""
+
+import dis
+import functools
+import operator
+import os
+import random
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+try:
+    import numpy as np
+except ImportError:  # plain Python pass only
+    np = None
+
+_MISSING = object()
+
+# opcodes of a lambda that only does arithmetic on its argument (3.10 - 3.13 names)
+_ARITHMETIC_OPS = {
+    "RESUME", "NOP", "CACHE", "LOAD_FAST", "LOAD_FAST_CHECK", "LOAD_FAST_LOAD_FAST", "LOAD_CONST",
+    "LOAD_SMALL_INT", "BINARY_OP", "UNARY_NEGATIVE", "UNARY_POSITIVE", "COMPARE_OP", "RETURN_VALUE",
+    "RETURN_CONST", "BINARY_ADD", "BINARY_SUBTRACT", "BINARY_MULTIPLY", "BINARY_TRUE_DIVIDE",
+    "BINARY_FLOOR_DIVIDE", "BINARY_MODULO", "BINARY_POWER",
+}
+
+
+def is_arithmetic(fn) -> bool:
+    """True if fn(x) only combines x with numeric constants via operators."""
+    code = getattr(fn, "__code__", None)
+    if code is None or code.co_argcount != 1 or code.co_freevars or code.co_kwonlyargcount:
+        return False
+    if not all(type(c) in (int, float, type(None)) for c in code.co_consts):
+        return False  # None is the implicit docstring slot in older versions
+    return all(ins.opname in _ARITHMETIC_OPS for ins in dis.get_instructions(fn))
+
+
+def compose(*fns):
+    """compose(f, g, h)(x) == h(g(f(x))), applied left to right like Pipeline.map."""
+    def composed(x):
+        for fn in fns:
+            x = fn(x)
+        return x
+    return composed
+
+
+def _chain(stages, items):
+    """The fused pass: one lazy iterator for every stage."""
+    it = iter(items)
+    for kind, fn in stages:
+        it = map(fn, it) if kind == "map" else filter(fn, it)
+    return it
+
+
+def _run_chunk(stages, chunk) -> list:
+    return list(_chain(stages, chunk))
+
+
+def _sum_chunk(stages, chunk):
+    return sum(_chain(stages, chunk))
+
+
+def _reduce_chunk(stages, fn, chunk) -> tuple:
+    # (False, None) for a chunk the filters emptied: a sentinel object would not survive pickling
+    result = _reduce(fn, _chain(stages, chunk))
+    return (False, None) if result is _MISSING else (True, result)
+
+
+def _reduce(fn, it, initial=_MISSING):
+    if initial is _MISSING:
+        first = next(it, _MISSING)
+        if first is _MISSING:
+            return _MISSING
+        return functools.reduce(fn, it, first)
+    return functools.reduce(fn, it, initial)
+
+
+def _chunks(items, size: int):
+    it = iter(items)
+    while chunk := list(islice(it, size)):
+        yield chunk
+
+
+class Pipeline:
+    """Immutable chain of map / filter stages; each builder call returns a new Pipeline."""
+
+    def __init__(self, items, stages=(), workers: int | None = None, chunksize: int = 0,
+                 vectorized: bool = False) -> None:
+        self.items = items
+        self.stages = tuple(stages)
+        self.workers = workers
+        self.chunksize = chunksize
+        self.vectorized = vectorized
+
+    def _with(self, **changes) -> "Pipeline":
+        settings = dict(items=self.items, stages=self.stages, workers=self.workers,
+                        chunksize=self.chunksize, vectorized=self.vectorized)
+        settings.update(changes)
+        return Pipeline(**settings)
+
+    def map(self, fn) -> "Pipeline":
+        return self._with(stages=self.stages + (("map", fn),))
+
+    def filter(self, fn) -> "Pipeline":
+        return self._with(stages=self.stages + (("filter", fn),))
+
+    def parallel(self, workers: int | None = None, chunksize: int = 50_000) -> "Pipeline":
+        return self._with(workers=workers or os.cpu_count() or 1, chunksize=chunksize)
+
+    def vectorize(self, enabled: bool = True) -> "Pipeline":
+        return self._with(vectorized=enabled)
+
+    # ---- run ----------------------------------------------------------------
+
+    def _numpy_array(self):
+        """The result as an ndarray, or None when the NumPy route does not apply."""
+        if not (self.vectorized and np is not None and all(is_arithmetic(fn) for _, fn in self.stages)):
+            return None
+        array = self.items if isinstance(self.items, np.ndarray) else np.asarray(self.items)
+        if array.ndim != 1 or array.dtype.kind not in "iuf":
+            return None
+        try:
+            for kind, fn in self.stages:
+                if kind == "map":
+                    array = np.broadcast_to(fn(array), array.shape)  # a constant lambda gives a scalar
+                else:
+                    array = array[np.broadcast_to(np.asarray(fn(array), dtype=bool), array.shape)]
+        except (TypeError, ValueError, ArithmeticError):
+            return None
+        return array
+
+    def __iter__(self):
+        array = self._numpy_array()
+        if array is not None:
+            return iter(array.tolist())
+        if self.workers:
+            return (x for part in self._parallel_map(_run_chunk) for x in part)
+        return _chain(self.stages, self.items)
+
+    def _parallel_map(self, worker, *extra):
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            parts = [pool.submit(worker, self.stages, *extra, chunk) for chunk in _chunks(self.items, self.chunksize)]
+            for part in parts:
+                yield part.result()
+
+    def to_list(self) -> list:
+        array = self._numpy_array()
+        if array is not None:
+            return array.tolist()
+        if self.workers:
+            return [x for part in self._parallel_map(_run_chunk) for x in part]
+        return list(_chain(self.stages, self.items))
+
+    def reduce(self, fn, initial=_MISSING):
+        """functools.reduce over the results; empty input with no initial raises TypeError."""
+        if self.workers:
+            parts = [value for found, value in self._parallel_map(_reduce_chunk, fn) if found]
+            result = _reduce(fn, iter(parts), initial)
+        else:
+            array = self._numpy_array()
+            it = iter(array.tolist()) if array is not None else _chain(self.stages, self.items)
+            result = _reduce(fn, it, initial)
+        if result is _MISSING:
+            raise TypeError("reduce() of empty iterable with no initial value")
+        return result
+
+    def sum(self, start=0):
+        array = self._numpy_array()
+        if array is not None:
+            return array.sum().item() + start
+        if self.workers:
+            return sum(self._parallel_map(_sum_chunk), start)
+        return sum(_chain(self.stages, self.items), start)
+
+    def count(self) -> int:
+        return sum(1 for _ in self) if not self.workers else sum(map(len, self._parallel_map(_run_chunk)))
+
+
+# ---- demo / benchmark (module-level functions, so process pools can pickle them) ----
+
+def square(x):
+    return x * x
+
+
+def not_multiple_of_3(x):
+    return x % 3
+
+
+def plus_one(x):
+    return x + 1
+
+
+def transform_list(items, func):
+    """Same as 10_lambda_demo.transform_list."""
+    return [func(x) for x in items]
+
+
+def measure(fn, repeat: int = 3):
+    """(result, best seconds, peak bytes allocated) - the peak from one extra traced run."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, best, peak
+
+
+def main():
+    print("=== Pipeline vs transform_list ===")
+    items = [1, 2, 3, 4, 5, 6]
+    print("squares        ->", Pipeline(items).map(lambda x: x * x).to_list())
+    print("fused 3 stages ->", Pipeline(items).map(square).filter(not_multiple_of_3).map(plus_one).to_list())
+    print("product        ->", Pipeline(items).reduce(operator.mul))
+    print("run_twice(+1, 5) as compose ->", compose(plus_one, plus_one)(5))
+    print("is_arithmetic(lambda x: x * x + 1) ->", is_arithmetic(lambda x: x * x + 1))
+    print("is_arithmetic(lambda x: str(x))    ->", is_arithmetic(lambda x: str(x)))
+
+    n = 2_000_000
+    data = list(range(n))
+    print(f"\n=== square -> drop multiples of 3 -> +1 -> sum, {n:,} items, best of 3 ===")
+
+    def per_stage():
+        step = transform_list(data, square)
+        step = [x for x in step if not_multiple_of_3(x)]
+        return sum(transform_list(step, plus_one))
+
+    def fused():
+        return Pipeline(data).map(square).filter(not_multiple_of_3).map(plus_one).sum()
+
+    expected, secs, peak = measure(per_stage)
+    print(f"{'transform_list per stage':<30}:: {secs:.3f}s, peak {peak / 2**20:6.1f} MiB")
+    total, secs, peak = measure(fused)
+    print(f"{'Pipeline (fused)':<30}:: {secs:.3f}s, peak {peak / 2**20:6.1f} MiB (same: {total == expected})")
+
+    start = time.perf_counter()
+    total = Pipeline(data).map(square).filter(not_multiple_of_3).map(plus_one).parallel().sum()
+    print(f"{f'Pipeline.parallel() x{os.cpu_count()}':<30}:: {time.perf_counter() - start:.3f}s "
+          f"(same: {total == expected})")
+
+    if np is not None:
+        start = time.perf_counter()
+        total = (Pipeline(data).map(lambda x: x * x).filter(lambda x: x % 3).map(lambda x: x + 1)
+                 .vectorize().sum())
+        print(f"{'Pipeline.vectorize() (NumPy)':<30}:: {time.perf_counter() - start:.3f}s "
+              f"(same: {total == expected})")
+
+    sample = random.sample(data, 10)
+    print("\nspot check ::", Pipeline(sample).map(square).to_list() == transform_list(sample, square))
+
+
+if __name__ == "__main__":
+    main()
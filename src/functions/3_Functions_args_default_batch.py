@@ -0,0 +1,124 @@
+"""3_Functions_args_default_batch.py
+
+Run:
+    python 3_Functions_args_default_batch.py
+
+discount_price() in 3_Functions_args_default.py is fine for one price, but
+for a whole catalog every call
+- asks the clock for today's UTC date again,
+- defines two nested functions again,
+- checks both deal days again,
+although the answer (which discount applies today) is the same for every
+item. price_batch() works that out once, then applies it to the whole
+column of prices: one list comprehension, or one NumPy expression when the
+prices are an ndarray.
+
+Deal days are a table, so new ones are data, not another elif:
+
+    DEAL_DAYS = (DealDay("Black Friday", 11, 27, 40),
+                 DealDay("Boxing Day", 12, 26, 20))
+
+Prices are rounded exactly like discount_price():  round(price - price / 100 * percent).
+"""
+
+import importlib.util
+import os
+import random
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+
+try:
+    import numpy as np
+except ImportError:  # plain lists only
+    np = None
+
+
+@dataclass(frozen=True)
+class DealDay:
+    name: str
+    month: int
+    day: int
+    percent: float
+
+
+DEAL_DAYS = (
+    DealDay("Black Friday", 11, 27, 40),
+    DealDay("Boxing Day", 12, 26, 20),
+)
+
+
+def todays_deal(today: date | None = None, rules=DEAL_DAYS, force=()) -> DealDay | None:
+    """The deal that applies on `today` (UTC today by default), or None.
+
+    `force` names deals to apply whatever the date, like discount_price's
+    is_back_friday / is_boxing_day flags. The first matching rule in the
+    table wins, as in discount_price's if / elif.
+    """
+    today = today or datetime.now(timezone.utc).date()
+    for rule in rules:
+        if rule.name in force or (today.month == rule.month and today.day == rule.day):
+            return rule
+    return None
+
+
+def price_batch(prices, discount: float = 0, today: date | None = None, rules=DEAL_DAYS, force=()):
+    """Discounted price of every item; the deal day is looked up once.
+
+    `discount` is the percentage for ordinary days (discount_price accepts a
+    discount argument but never uses it, so there it is always 0).
+    Returns a list, or an int64 ndarray if `prices` is an ndarray.
+    """
+    deal = todays_deal(today, rules, force)
+    percent = deal.percent if deal else discount
+    if np is not None and isinstance(prices, np.ndarray):
+        # same float operations in the same order; np.round rounds half to even, like round()
+        return np.round(prices - prices / 100 * percent).astype(np.int64)
+    return [round(price - price / 100 * percent) for price in prices]
+
+
+# ---- demo / benchmark ----
+
+def _load_discount_price():
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "3_Functions_args_default.py")
+    spec = importlib.util.spec_from_file_location("3_Functions_args_default", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.discount_price
+
+
+def main():
+    print("=== same prices as 3_Functions_args_default.main() ===")
+    print(f"Back friday Price :: {price_batch([919], force={'Black Friday'})[0]}, "
+          f"Boxing day Price :: {price_batch([919], force={'Boxing Day'})[0]}")
+
+    print("\n=== a catalog on each deal day ===")
+    catalog = [919, 45, 1299, 5]
+    for day in (date(2025, 11, 27), date(2025, 12, 26), date(2025, 6, 1)):
+        deal = todays_deal(day)
+        print(f"{day} {deal.name if deal else 'no deal':<13}:: {price_batch(catalog, today=day)}")
+
+    print("\n=== a custom rule table (10% off on Pi day) ===")
+    rules = DEAL_DAYS + (DealDay("Pi Day", 3, 14, 10),)
+    print(f"2025-03-14 :: {price_batch(catalog, today=date(2025, 3, 14), rules=rules)}")
+
+    discount_price = _load_discount_price()
+    n = 1_000_000
+    prices = [random.randint(1, 5000) for _ in range(n)]
+    print(f"\n=== {n:,} prices, Black Friday, seconds ===")
+    start = time.perf_counter()
+    expected = [discount_price(price, is_back_friday=True) for price in prices]
+    print(f"{'discount_price() per item':<28}:: {time.perf_counter() - start:.3f}")
+    start = time.perf_counter()
+    result = price_batch(prices, force={"Black Friday"})
+    print(f"{'price_batch(list)':<28}:: {time.perf_counter() - start:.3f} (same: {result == expected})")
+    if np is not None:
+        array = np.asarray(prices, dtype=np.int64)
+        start = time.perf_counter()
+        result = price_batch(array, force={"Black Friday"})
+        print(f"{'price_batch(ndarray)':<28}:: {time.perf_counter() - start:.3f} "
+              f"(same: {result.tolist() == expected})")
+
+
+if __name__ == "__main__":
+    main()
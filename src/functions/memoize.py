@@ -0,0 +1,297 @@
+"""memoize.py
+
+Caching decorators - functools.lru_cache plus:
+
+- three eviction policies: "lru" (least recently used), "lfu" (least
+  frequently used) and "ttl" (entries expire `ttl` seconds after they were
+  stored; when space runs out the oldest entry goes first),
+- a size limit in BYTES (max_bytes, measured with deep_sizeof) as well as,
+  or instead of, a number of entries (max_entries),
+- unhashable arguments: lists, dicts and sets are turned into a stable,
+  hashable key (make_key), so f([1, 2]) can be cached,
+- a lock around the cache, so one cached function can be shared by threads,
+- cache_info(): hits, misses, evictions, expirations, entries and bytes.
+
+    @memoize(policy="lfu", max_bytes=1 << 20)
+    def transform_list(items, func): ...
+
+    transform_list.cache_info()   # CacheInfo(hits=..., misses=..., ...)
+    transform_list.cache_clear()
+
+Cached values are returned as they are, not copied: mutating a returned
+list changes what the next caller gets. Two threads asking for the same
+missing key may both compute it (the lock is not held while fn runs).
+"""
+
+import functools
+import sys
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+CacheInfo = namedtuple("CacheInfo", "hits misses evictions expirations entries bytes")
+
+_MISSING = object()
+
+
+class _Tag:
+    """Marks a frozen container, so freeze([1, 2]) != freeze((1, 2))."""
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __repr__(self) -> str:
+        return f"<{self.name}>"
+
+
+_LIST, _DICT, _SET, _KWARGS = _Tag("list"), _Tag("dict"), _Tag("set"), _Tag("kwargs")
+
+
+def freeze(value):
+    """A hashable stand-in for value: lists/tuples, dicts and sets are frozen recursively."""
+    if isinstance(value, (list, tuple)):
+        frozen = tuple(value)
+        try:
+            hash(frozen)  # the common case: a list of numbers / strings
+        except TypeError:
+            frozen = tuple(map(freeze, value))
+        return (_LIST, frozen) if isinstance(value, list) else frozen
+    if isinstance(value, dict):
+        return _DICT, frozenset((freeze(k), freeze(v)) for k, v in value.items())
+    if isinstance(value, (set, frozenset)):
+        return _SET, frozenset(map(freeze, value))
+    hash(value)  # anything else must be hashable already (raises TypeError if not)
+    return value
+
+
+def make_key(args: tuple, kwargs: dict):
+    """Cache key for a call; equal calls give equal keys (keyword order does not matter)."""
+    key = args + (_KWARGS,) + tuple(sorted(kwargs.items())) if kwargs else args
+    try:
+        hash(key)
+        return key
+    except TypeError:
+        return freeze(key)
+
+
+def deep_sizeof(value, _seen=None) -> int:
+    """sys.getsizeof of value and everything inside its lists, tuples, sets and dicts."""
+    if _seen is None:
+        _seen = set()
+    if id(value) in _seen:
+        return 0
+    _seen.add(id(value))
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(deep_sizeof(k, _seen) + deep_sizeof(v, _seen) for k, v in value.items())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(deep_sizeof(v, _seen) for v in value)
+    return size
+
+
+class Cache:
+    """Entries, limits, lock and counters; subclasses choose the eviction order."""
+
+    def __init__(self, max_entries: int | None = None, max_bytes: int | None = None,
+                 sizeof=deep_sizeof) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self._entries = OrderedDict()  # key -> [value, bytes, ...]
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = self.expirations = 0
+
+    # -- eviction policy hooks --
+    def _touch(self, key, entry) -> None:
+        """key was read."""
+
+    def _stored(self, key, entry) -> None:
+        """key was just added."""
+
+    def _dropped(self, key) -> None:
+        """key was removed."""
+
+    def _victim(self):
+        """The key to evict next."""
+        return next(iter(self._entries))
+
+    _expires = False  # True when entries can expire (_expired is then consulted)
+
+    def _expired(self, entry) -> bool:
+        return False
+
+    # -- public API --
+    def get(self, key, default=_MISSING):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            if self._expires and self._expired(entry):
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return default
+            self.hits += 1
+            self._touch(key, entry)
+            return entry[0]
+
+    def set(self, key, value) -> None:
+        size = self.sizeof(key) + self.sizeof(value) if self.max_bytes is not None else 0
+        if self.max_bytes is not None and size > self.max_bytes:
+            return  # would never fit: do not flush the whole cache for it
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            # make room first, so the new entry is never its own victim
+            while self._entries and (
+                    (self.max_entries is not None and len(self._entries) >= self.max_entries)
+                    or (self.max_bytes is not None and self._bytes + size > self.max_bytes)):
+                self._remove(self._victim())
+                self.evictions += 1
+            if self.max_entries == 0:
+                return
+            entry = [value, size]
+            self._entries[key] = entry
+            self._bytes += size
+            self._stored(key, entry)
+
+    def _remove(self, key) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry[1]
+        self._dropped(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            for key in list(self._entries):
+                self._remove(key)
+            self.hits = self.misses = self.evictions = self.expirations = 0
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.evictions, self.expirations,
+                             len(self._entries), self._bytes)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key) -> bool:
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and not (self._expires and self._expired(entry))
+
+
+class LRUCache(Cache):
+    """Evicts the least recently used entry."""
+
+    def _touch(self, key, entry) -> None:
+        self._entries.move_to_end(key)
+
+
+class LFUCache(Cache):
+    """Evicts the least frequently used entry (the oldest one among ties).
+
+    Keys are grouped by use count, so finding the victim is O(1).
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._count = {}
+        self._by_count = {}  # use count -> OrderedDict of keys with that count
+        self._lowest = 0
+
+    def _move(self, key, old: int, new: int) -> None:
+        if old:
+            keys = self._by_count[old]
+            del keys[key]
+            if not keys:
+                del self._by_count[old]
+                if self._lowest == old:
+                    self._lowest = new
+        self._by_count.setdefault(new, OrderedDict())[key] = None
+        self._count[key] = new
+
+    def _touch(self, key, entry) -> None:
+        count = self._count[key]
+        self._move(key, count, count + 1)
+
+    def _stored(self, key, entry) -> None:
+        self._move(key, 0, 1)
+        self._lowest = 1
+
+    def _dropped(self, key) -> None:
+        count = self._count.pop(key)
+        keys = self._by_count[count]
+        del keys[key]
+        if not keys:
+            del self._by_count[count]
+            if self._lowest == count:
+                self._lowest = min(self._by_count, default=0)
+
+    def _victim(self):
+        return next(iter(self._by_count[self._lowest]))
+
+
+class TTLCache(Cache):
+    """Entries expire `ttl` seconds after they were stored; the oldest is evicted first."""
+
+    _expires = True
+
+    def __init__(self, ttl: float, *args, clock=time.monotonic, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.ttl = ttl
+        self._clock = clock
+
+    def _stored(self, key, entry) -> None:
+        now = self._clock()
+        entry.append(now + self.ttl)
+        # entries are in storage order, so the expired ones are at the front
+        while True:
+            oldest = next(iter(self._entries))
+            if oldest is key or not self._expired(self._entries[oldest], now):
+                break
+            self._remove(oldest)
+            self.expirations += 1
+
+    def _expired(self, entry, now: float | None = None) -> bool:
+        return (self._clock() if now is None else now) >= entry[2]
+
+
+POLICIES = {"lru": LRUCache, "lfu": LFUCache, "ttl": TTLCache}
+
+
+def memoize(fn=None, *, policy: str = "lru", max_entries: int | None = 128, max_bytes: int | None = None,
+            ttl: float | None = None, key=make_key, sizeof=deep_sizeof):
+    """Cache fn's results. Usable as @memoize or @memoize(policy=..., ...).
+
+    max_entries=None and max_bytes=None means unbounded. policy="ttl" needs ttl.
+    """
+    if fn is None:
+        return functools.partial(memoize, policy=policy, max_entries=max_entries, max_bytes=max_bytes,
+                                 ttl=ttl, key=key, sizeof=sizeof)
+    if policy not in POLICIES:
+        raise ValueError(f"policy must be one of {sorted(POLICIES)}, not {policy!r}")
+    if policy == "ttl":
+        if ttl is None:
+            raise TypeError("policy 'ttl' needs ttl=<seconds>")
+        cache = TTLCache(ttl, max_entries, max_bytes, sizeof)
+    else:
+        cache = POLICIES[policy](max_entries, max_bytes, sizeof)
+    get, put = cache.get, cache.set
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        k = key(args, kwargs)
+        value = get(k, _MISSING)
+        if value is _MISSING:
+            value = fn(*args, **kwargs)
+            put(k, value)
+        return value
+
+    wrapper.cache = cache
+    wrapper.cache_info = cache.info
+    wrapper.cache_clear = cache.clear
+    return wrapper
@@ -0,0 +1,374 @@
+"""10_Logical_Operator_rules.py
+
+Run:
+    python 10_Logical_Operator_rules.py
+
+9_If_Statements.py, 9_Conditional_Expression.py and 10_Logical_Operator.py
+hard-code their decisions:
+
+    if (has_id and not is_banned) or is_admin:
+        print("Entry allowed")
+
+Here the same logic is data. A rule is a string, parsed once with ast and
+checked against a small grammar (and / or / not, comparisons, `in`, names
+and constants - no calls, no attribute access), then compiled to either
+
+- a Python function over COLUMNS: one list comprehension per batch, with
+  the rule inlined as real bytecode (no eval() per record), or
+- NumPy boolean masks (&, |, ~ over whole arrays), when NumPy is installed
+  and the batch columns are arrays.
+
+A batch is a dict {field: column}; columns(records, fields) builds one
+from a list of dict records.
+
+    rule = Rule("(has_id and not is_banned) or is_admin")
+    rule.mask(batch)                      # [True, False, ...]
+
+    grades = RuleSet([("x < 0", "Negative"), ("x == 0", "Zero"),
+                      ("x == 1", "Single")], default="More")   # if / elif / else
+    grades.decide(batch)                  # first matching rule per record
+    grades.hits                           # Counter: how often each branch fired
+"""
+
+import ast
+import operator
+import random
+import time
+from collections import Counter
+from operator import itemgetter
+
+try:
+    import numpy as np
+except ImportError:  # Python backend only
+    np = None
+
+ELSE = "else"
+
+_ALLOWED = (ast.Expression, ast.BoolOp, ast.And, ast.Or, ast.UnaryOp, ast.Not, ast.USub,
+            ast.Compare, ast.Eq, ast.NotEq, ast.Lt, ast.LtE, ast.Gt, ast.GtE, ast.In, ast.NotIn,
+            ast.Name, ast.Load, ast.Constant, ast.Tuple, ast.List)
+
+
+def _parse(expr: str) -> ast.Expression:
+    tree = ast.parse(expr.strip(), mode="eval")
+    for node in ast.walk(tree):
+        if not isinstance(node, _ALLOWED):
+            raise ValueError(f"unsupported syntax in rule {expr!r}: {type(node).__name__}")
+        if isinstance(node, ast.Name) and node.id.startswith("_"):
+            raise ValueError(f"field names may not start with '_' in rule {expr!r}: {node.id}")
+        if isinstance(node, (ast.Tuple, ast.List)) and not all(isinstance(e, ast.Constant) for e in node.elts):
+            raise ValueError(f"only constants are allowed inside {type(node).__name__.lower()}s in rule {expr!r}")
+    return tree
+
+
+def _fields(trees) -> list:
+    """Field names in order of first appearance."""
+    names = {}
+    for tree in trees:
+        found = [node for node in ast.walk(tree) if isinstance(node, ast.Name)]
+        for node in sorted(found, key=lambda node: (node.lineno, node.col_offset)):
+            names.setdefault(node.id)
+    return list(names)
+
+
+def _compile_comprehension(element: str, fields: list, name: str, constants=None):
+    """Build `name(_n, *fields)` returning [element for each record].
+
+    The rule's field names are used directly as loop variables, so the rule
+    text runs unchanged inside the comprehension. `constants` ({'_o0': ...})
+    become default arguments: local-variable speed inside the loop.
+    """
+    constants = constants or {}
+    if fields:
+        params = ", ".join(fields)
+        loop = f"for {params}, in _zip({params})" if len(fields) == 1 else f"for {params} in _zip({params})"
+        signature = f"_n, {params}"
+    else:
+        loop, signature = "for _ in _range(_n)", "_n"
+    defaults = "".join(f", {c}={c}" for c in constants)
+    source = f"def {name}({signature}, _zip=zip, _range=range{defaults}):\n    return [{element} {loop}]\n"
+    namespace = dict(constants)
+    exec(compile(source, f"<rule {name}>", "exec"), namespace)
+    return namespace[name]
+
+
+def _numpy_eval(node, batch: dict, n: int):
+    if isinstance(node, ast.Expression):
+        return np.broadcast_to(np.asarray(_numpy_eval(node.body, batch, n), dtype=bool), (n,))
+    if isinstance(node, ast.Name):
+        return np.asarray(batch[node.id])
+    if isinstance(node, ast.Constant):
+        return node.value
+    if isinstance(node, (ast.Tuple, ast.List)):
+        return [e.value for e in node.elts]
+    if isinstance(node, ast.BoolOp):
+        values = [np.asarray(_numpy_eval(v, batch, n), dtype=bool) for v in node.values]
+        ufunc = np.logical_and if isinstance(node.op, ast.And) else np.logical_or
+        return ufunc.reduce(values)
+    if isinstance(node, ast.UnaryOp):
+        value = _numpy_eval(node.operand, batch, n)
+        return np.logical_not(np.asarray(value, dtype=bool)) if isinstance(node.op, ast.Not) else -value
+    # ast.Compare: a < b <= c  ->  (a < b) & (b <= c)
+    result = None
+    left = _numpy_eval(node.left, batch, n)
+    for op, comparator in zip(node.ops, node.comparators):
+        right = _numpy_eval(comparator, batch, n)
+        if isinstance(op, (ast.In, ast.NotIn)):
+            if isinstance(comparator, (ast.Tuple, ast.List)):  # a constant collection: vectorized
+                part = np.isin(left, right, invert=isinstance(op, ast.NotIn))
+            else:
+                # `in` a column means per record ('ad' in role[i]); np.isin would test the whole array
+                part = np.fromiter(map(operator.contains, _per_record(right, n), _per_record(left, n)),
+                                   dtype=bool, count=n)
+                if isinstance(op, ast.NotIn):
+                    part = ~part
+        else:
+            part = _NUMPY_COMPARE[type(op)](left, right)
+        result = part if result is None else result & part
+        left = right
+    return result
+
+
+def _per_record(value, n: int) -> list:
+    """A column as its n records, or a constant repeated n times."""
+    if isinstance(value, np.ndarray) and value.ndim and len(value) == n:
+        return list(value)
+    return [value] * n
+
+
+if np is not None:
+    _NUMPY_COMPARE = {ast.Eq: np.equal, ast.NotEq: np.not_equal, ast.Lt: np.less,
+                      ast.LtE: np.less_equal, ast.Gt: np.greater, ast.GtE: np.greater_equal}
+
+
+def _batch_length(batch: dict, fields: list) -> int:
+    missing = [f for f in fields if f not in batch]
+    if missing:
+        raise KeyError(f"batch has no column(s) {missing}")
+    lengths = {len(batch[f]) for f in fields}
+    if len(lengths) > 1:
+        raise ValueError(f"batch columns have different lengths: {sorted(lengths)}")
+    if lengths:
+        return lengths.pop()
+    return len(next(iter(batch.values()))) if batch else 0
+
+
+def _use_numpy(batch: dict, fields: list, backend: str) -> bool:
+    if backend == "python":
+        return False
+    if backend == "numpy":
+        if np is None:
+            raise ImportError("backend 'numpy' needs NumPy installed")
+        return True
+    if backend != "auto":
+        raise ValueError(f"backend must be 'auto', 'python' or 'numpy', not {backend!r}")
+    return np is not None and bool(fields) and all(isinstance(batch[f], np.ndarray) for f in fields)
+
+
+def columns(records, fields) -> dict:
+    """[{'x': 1, ...}, {'x': 2, ...}]  ->  {'x': [1, 2], ...}"""
+    records = records if isinstance(records, list) else list(records)
+    return {f: list(map(itemgetter(f), records)) for f in fields}
+
+
+class Rule:
+    """One boolean rule, e.g. "(has_id and not is_banned) or is_admin"."""
+
+    def __init__(self, expr: str) -> None:
+        self.expr = expr
+        self._tree = _parse(expr)
+        self.fields = _fields([self._tree])
+        self._mask = _compile_comprehension(f"True if ({ast.unparse(self._tree.body)}) else False",
+                                            self.fields, "_mask")
+        self.hits = 0
+        self.evaluated = 0
+
+    def mask(self, batch: dict, backend: str = "auto"):
+        """One bool per record (a list, or an ndarray with the NumPy backend)."""
+        n = _batch_length(batch, self.fields)
+        if _use_numpy(batch, self.fields, backend):
+            result = _numpy_eval(self._tree, batch, n)
+            self.hits += int(np.count_nonzero(result))
+        else:
+            result = self._mask(n, *map(batch.__getitem__, self.fields))
+            self.hits += result.count(True)
+        self.evaluated += n
+        return result
+
+    def __call__(self, **values) -> bool:
+        """Evaluate for a single record: rule(has_id=True, is_banned=False, is_admin=False)."""
+        return self.mask({f: [values[f]] for f in self.fields}, backend="python")[0]
+
+    def __repr__(self) -> str:
+        return f"Rule({self.expr!r})"
+
+
+class RuleSet:
+    """An if / elif / else chain: the first rule that matches decides the outcome.
+
+    hits counts how often each branch was taken (keyed by the rule text, and
+    ELSE for the default); pass count_hits=False to skip the counting.
+    """
+
+    def __init__(self, rules, default=None, count_hits: bool = True) -> None:
+        self.rules = [(expr, outcome) for expr, outcome in rules]
+        self.default = default
+        self.count_hits = count_hits
+        self._trees = [_parse(expr) for expr, _ in self.rules]
+        self.fields = _fields(self._trees)
+        self._names = [expr for expr, _ in self.rules] + [ELSE]
+        self._outcomes = [outcome for _, outcome in self.rules] + [default]
+        conditions = [ast.unparse(tree.body) for tree in self._trees]
+        # 0 if rule0 else 1 if rule1 else ... else len(rules): the index of the branch taken
+        chain = "".join(f"{i} if ({c}) else " for i, c in enumerate(conditions))
+        self._branch = _compile_comprehension(f"{chain}{len(conditions)}", self.fields, "_branch")
+        # when every outcome is distinct, produce the outcomes directly and count
+        # hits from them, instead of building branch indexes and mapping them
+        self._direct = None
+        try:
+            distinct = len(set(self._outcomes)) == len(self._outcomes)
+        except TypeError:  # unhashable outcomes
+            distinct = False
+        if distinct:
+            chain = "".join(f"_o{i} if ({c}) else " for i, c in enumerate(conditions))
+            constants = {f"_o{i}": outcome for i, outcome in enumerate(self._outcomes)}
+            self._direct = _compile_comprehension(f"{chain}_o{len(conditions)}", self.fields, "_decide", constants)
+            self._name_of = dict(zip(self._outcomes, self._names))
+        self.hits = Counter()
+
+    def _numpy_branches(self, batch: dict, n: int):
+        masks = [_numpy_eval(tree, batch, n) for tree in self._trees]
+        taken = np.select(masks, list(range(len(masks))), len(masks)) if masks else np.zeros(n, dtype=int)
+        if self.count_hits:
+            counts = np.bincount(taken, minlength=len(self._names))
+            self.hits.update({name: int(c) for name, c in zip(self._names, counts) if c})
+        return taken
+
+    def branches(self, batch: dict, backend: str = "auto"):
+        """The index of the branch each record takes (len(rules) means else)."""
+        n = _batch_length(batch, self.fields)
+        if _use_numpy(batch, self.fields, backend):
+            return self._numpy_branches(batch, n)
+        taken = self._branch(n, *map(batch.__getitem__, self.fields))
+        if self.count_hits:
+            self.hits.update({self._names[i]: c for i, c in Counter(taken).items()})
+        return taken
+
+    def decide(self, batch: dict, backend: str = "auto"):
+        """The outcome for every record (a list, or an ndarray with the NumPy backend)."""
+        n = _batch_length(batch, self.fields)
+        if _use_numpy(batch, self.fields, backend):
+            outcomes = np.empty(len(self._outcomes), dtype=object)
+            for i, outcome in enumerate(self._outcomes):  # element-wise: outcomes may be tuples
+                outcomes[i] = outcome
+            return outcomes[self._numpy_branches(batch, n)]
+        if self._direct is None:
+            return list(map(self._outcomes.__getitem__, self.branches(batch, "python")))
+        result = self._direct(n, *map(batch.__getitem__, self.fields))
+        if self.count_hits:
+            self.hits.update({self._name_of[o]: c for o, c in Counter(result).items()})
+        return result
+
+    def decide_one(self, **values):
+        return self.decide({f: [values[f]] for f in self.fields}, backend="python")[0]
+
+    def report(self) -> str:
+        total = sum(self.hits.values()) or 1
+        lines = [f"{'branch':<40} {'hits':>10} {'share':>7}"]
+        for name in self._names:
+            count = self.hits.get(name, 0)
+            lines.append(f"{('if ' if not lines[1:] else 'elif ' if name != ELSE else '') + name:<40} "
+                         f"{count:>10,} {count / total:>7.1%}")
+        return "\n".join(lines)
+
+
+# ---- demo / benchmark ----
+
+ENTRY = "(has_id and not is_banned) or is_admin"
+
+
+def examples():
+    print("=== 10_Logical_Operator.py as a Rule ===")
+    entry = Rule(ENTRY)
+    print(f"{entry} fields={entry.fields}")
+    allowed = entry(has_id=True, is_banned=False, is_admin=False)
+    print("Entry allowed" if allowed else "Entry denied")
+
+    print("\n=== 9_If_Statements.py as a RuleSet ===")
+    numbers = RuleSet([("x < 0", "Negative changed to zero"), ("x == 0", "Zero"), ("x == 1", "Single")],
+                      default="More")
+    for x, message in zip(range(-1, 4), numbers.decide({"x": list(range(-1, 4))})):
+        print(f"x = {x:>2} :: {message}")
+    print(numbers.report())
+
+    print("\n=== 9_Conditional_Expression.py as a RuleSet ===")
+    vote = RuleSet([("age >= 18", "*** Right to vote ***!!!")], default="Can not vote")
+    print(vote.decide_one(age=17), "|", vote.decide_one(age=30))
+
+
+def benchmark(n: int = 1_000_000):
+    print(f"\n=== entry rule over {n:,} records, seconds ===")
+    records = [{"has_id": random.random() < 0.9, "is_banned": random.random() < 0.05,
+                "is_admin": random.random() < 0.01} for _ in range(n)]
+
+    start = time.perf_counter()
+    expected = []
+    for r in records:
+        if (r["has_id"] and not r["is_banned"]) or r["is_admin"]:
+            expected.append(True)
+        else:
+            expected.append(False)
+    print(f"{'hand-written if per record':<32}:: {time.perf_counter() - start:.3f}")
+
+    code = compile(ENTRY, "<rule>", "eval")
+    start = time.perf_counter()
+    evaluated = [bool(eval(code, {}, r)) for r in records]
+    print(f"{'eval() per record':<32}:: {time.perf_counter() - start:.3f} (same: {evaluated == expected})")
+
+    entry = Rule(ENTRY)
+    batch = columns(records, entry.fields)
+    start = time.perf_counter()
+    result = entry.mask(batch)
+    print(f"{'Rule.mask (compiled, columns)':<32}:: {time.perf_counter() - start:.3f} (same: {result == expected})")
+
+    if np is not None:
+        arrays = {f: np.asarray(col) for f, col in batch.items()}
+        start = time.perf_counter()
+        result = entry.mask(arrays)
+        print(f"{'Rule.mask (NumPy masks)':<32}:: {time.perf_counter() - start:.3f} "
+              f"(same: {result.tolist() == expected})")
+    print(f"hits :: {entry.hits:,} of {entry.evaluated:,} evaluated")
+
+    print(f"\n=== if/elif chain over {n:,} values, seconds ===")
+    xs = [random.randint(-3, 5) for _ in range(n)]
+    start = time.perf_counter()
+    expected = []
+    for x in xs:
+        if x < 0:
+            expected.append("Negative")
+        elif x == 0:
+            expected.append("Zero")
+        elif x == 1:
+            expected.append("Single")
+        else:
+            expected.append("More")
+    print(f"{'hand-written if/elif loop':<32}:: {time.perf_counter() - start:.3f}")
+    rules = [("x < 0", "Negative"), ("x == 0", "Zero"), ("x == 1", "Single")]
+    start = time.perf_counter()
+    result = RuleSet(rules, default="More", count_hits=False).decide({"x": xs})
+    print(f"{'RuleSet.decide, no hit counts':<32}:: {time.perf_counter() - start:.3f} (same: {result == expected})")
+    chain = RuleSet(rules, default="More")
+    start = time.perf_counter()
+    result = chain.decide({"x": xs})
+    print(f"{'RuleSet.decide, counting hits':<32}:: {time.perf_counter() - start:.3f} (same: {result == expected})")
+    if np is not None:
+        start = time.perf_counter()
+        result = chain.decide({"x": np.asarray(xs)})
+        print(f"{'RuleSet.decide (NumPy)':<32}:: {time.perf_counter() - start:.3f} "
+              f"(same: {result.tolist() == expected})")
+    print(chain.report())
+
+
+if __name__ == "__main__":
+    examples()
+    benchmark()
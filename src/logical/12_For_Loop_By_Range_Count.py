@@ -1,13 +1,22 @@
-import time as tm
 import datetime
+import time as tm
+
+from countdown_scheduler import CountdownScheduler, run_countdown
 
 ## for Range between 50(Inclusive) and 100(Exclusive) and Count
 for i in range(0, 10, 2):
     print(f"{i}")
 
 print(f"\n========= for Range Count down timer =========")
-## for Range between 50(Inclusive) and 100(Exclusive) and Count
-for i in range(5, 0, -1):
-    print(f"{i}")
-    tm.sleep(1)
-print(f"Happy new year", datetime.now().year, sep=" :: [", end="]")
+## Count down 5 .. 1, one second apart (asyncio under the hood, see countdown_scheduler.py)
+run_countdown(5, interval=1, on_tick=lambda i: print(f"{i}"))
+print(f"Happy new year", datetime.datetime.now().year, sep=" :: [", end="]\n")
+
+print(f"\n========= 10,000 countdowns at once (3 ticks, 0.1s apart) =========")
+scheduler = CountdownScheduler()
+for n in range(10_000):
+    scheduler.add(n, 3, interval=0.1)
+start = tm.perf_counter()
+lateness = scheduler.run()
+print(f"took {tm.perf_counter() - start:.2f}s (one countdown alone takes 0.30s)")
+print(f"worst tick lateness :: {max(lateness.values()) * 1000:.1f} ms")
@@ -0,0 +1,127 @@
+"""12_For_Loop_Parallel_Range.py
+
+Run:
+    python 12_For_Loop_Parallel_Range.py
+
+The for / while loop demos walk a range one item at a time:
+
+    for i in range(50, 100):
+        work(i)
+
+parallel_range(start, stop, step, fn) splits the range into chunks (small
+range objects - cheap to send to another process) and maps them over a
+process pool (CPU-bound fn) or a thread pool (I/O-bound fn, e.g. network or
+disk waits).
+
+- ordered=True yields results in range order; ordered=False yields each
+  chunk's results as soon as it is done.
+- chunksize=None tunes itself: fn is timed on the first few items (those
+  results are kept, not recomputed) and chunks are sized to take ~50 ms each,
+  while still leaving several chunks per worker.
+- For a process pool, fn must be a module-level function (it is pickled).
+"""
+
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+
+TARGET_CHUNK_SECONDS = 0.05
+PROBE_ITEMS = 16
+
+
+def _run_chunk(fn, chunk: range) -> list:
+    return list(map(fn, chunk))
+
+
+def split_range(r: range, chunksize: int):
+    """range(0, 10, 2) with chunksize 2 -> range(0, 4, 2), range(4, 8, 2), range(8, 10, 2)."""
+    for i in range(0, len(r), chunksize):
+        yield r[i:i + chunksize]  # slicing a range gives a range
+
+
+def tune_chunksize(per_item_seconds: float, items: int, workers: int) -> int:
+    by_time = int(TARGET_CHUNK_SECONDS / per_item_seconds) if per_item_seconds > 0 else items
+    most = max(1, math.ceil(items / (workers * 4)))  # keep >= 4 chunks per worker
+    return max(1, min(by_time, most))
+
+
+def parallel_range(start: int, stop: int, step: int = 1, fn=None, chunksize: int | None = None,
+                   kind: str = "process", workers: int | None = None, ordered: bool = True):
+    """Yield fn(i) for i in range(start, stop, step), computed in parallel."""
+    if fn is None:
+        raise TypeError("parallel_range() needs fn")
+    if kind not in ("process", "thread"):
+        raise ValueError(f"kind must be 'process' or 'thread', not {kind!r}")
+    workers = workers or os.cpu_count() or 1
+    r = range(start, stop, step)
+
+    head = []
+    if chunksize is None:
+        probe = r[:PROBE_ITEMS]
+        began = time.perf_counter()
+        head = _run_chunk(fn, probe)
+        per_item = (time.perf_counter() - began) / max(len(probe), 1)
+        r = r[len(probe):]
+        chunksize = tune_chunksize(per_item, len(r), workers)
+        if ordered:
+            yield from head
+
+    executor = ProcessPoolExecutor if kind == "process" else ThreadPoolExecutor
+    with executor(max_workers=workers) as pool:
+        futures = [pool.submit(_run_chunk, fn, chunk) for chunk in split_range(r, chunksize)]
+        if ordered:
+            for future in futures:
+                yield from future.result()
+        else:
+            yield from head
+            for future in as_completed(futures):
+                yield from future.result()
+
+
+# ---- demo work functions (module level, so a process pool can pickle them) ----
+
+def collatz_steps(n: int) -> int:
+    """CPU-bound: steps for n to reach 1."""
+    steps = 0
+    while n > 1:
+        n = n // 2 if n % 2 == 0 else 3 * n + 1
+        steps += 1
+    return steps
+
+
+def slow_io(n: int) -> int:
+    """I/O-bound stand-in: waits 1 ms, like a small network call."""
+    time.sleep(0.001)
+    return n
+
+
+def main():
+    print("=== parallel_range(1, 11, 1, collatz_steps) ===")
+    print(list(parallel_range(1, 11, 1, collatz_steps, workers=2)))
+
+    print("\n=== every 2nd number from 50 to 100, squared (threads, unordered) ===")
+    print(sorted(parallel_range(50, 100, 2, lambda i: i * i, kind="thread", ordered=False)))
+
+    print(f"\n=== benchmark (workers = {os.cpu_count()}), seconds ===")
+    n = 200_000
+    start = time.perf_counter()
+    expected = [collatz_steps(i) for i in range(1, n)]
+    print(f"{'CPU-bound serial loop':<33}:: {time.perf_counter() - start:.3f}")
+    for kind in ("thread", "process"):
+        start = time.perf_counter()
+        result = list(parallel_range(1, n, 1, collatz_steps, kind=kind))
+        print(f"{'CPU-bound parallel_range ' + kind:<33}:: {time.perf_counter() - start:.3f} (same: {result == expected})")
+
+    n = 500
+    start = time.perf_counter()
+    expected = [slow_io(i) for i in range(n)]
+    print(f"{'I/O-bound serial loop':<33}:: {time.perf_counter() - start:.3f}")
+    for kind, workers in (("thread", 32), ("process", None)):
+        start = time.perf_counter()
+        result = list(parallel_range(0, n, 1, slow_io, kind=kind, workers=workers))
+        print(f"{'I/O-bound parallel_range ' + kind:<33}:: {time.perf_counter() - start:.3f} (same: {result == expected})")
+
+
+if __name__ == "__main__":
+    main()
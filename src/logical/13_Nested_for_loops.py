@@ -8,12 +8,13 @@ This file demonstrates nested loops with:
 2) A multiplication table
 """
 
-def grid_printer():
+def grid_printer(ask=input):
     print("\n=== Grid Printer (nested loops) ===")
 
-    rows = int(input("How many rows?: "))
-    columns = int(input("How many columns?: "))
-    symbol = input("Enter a symbol to use: ")
+    # ask() defaults to input(); any prompt -> str function works (e.g. scripted answers)
+    rows = int(ask("How many rows?: "))
+    columns = int(ask("How many columns?: "))
+    symbol = ask("Enter a symbol to use: ")
 
     for i in range(rows):
         for j in range(columns):
@@ -0,0 +1,139 @@
+"""13_Nested_for_loops_tables.py
+
+Run:
+    python 13_Nested_for_loops_tables.py
+
+13_Nested_for_loops.py prints one cell at a time:
+
+    for i in range(1, 6):
+        for j in range(1, 6):
+            print(f"{i*j:2}", end=" ")
+
+That is one print() call per cell - 100 million calls for a 10,000 x 10,000
+table. Here each ROW is built with a single str.join over map() (the inner
+loop runs in C), rows are generated lazily (one row in memory at a time),
+and they are written to a file in large chunks. With NumPy installed the
+multiplication table is built as an outer product, a block of rows at a time.
+"""
+
+import operator
+import os
+import tempfile
+import time
+from itertools import islice, repeat
+
+try:
+    import numpy as np
+except ImportError:  # pure-Python rows only
+    np = None
+
+
+def table_rows(rows: int, columns: int, op=operator.mul, start: int = 1, width: int | None = None, sep: str = " "):
+    """Yield each row of `op(i, j)` as one string.
+
+    width=None pads multiplication tables to the widest product; for other
+    ops pass a width (or 0 for no padding).
+    """
+    cols = range(start, start + columns)
+    if width is None:
+        # i * j is largest (or most negative) at a corner of the table
+        corners = [i * j for i in (start, start + rows - 1) for j in (start, start + columns - 1)]
+        width = max(len(str(c)) for c in corners) if op is operator.mul else 0
+    spec = f">{width}"
+    for i in range(start, start + rows):
+        if op is operator.mul:
+            cells = range(i * start, i * (start + columns), i) if i else repeat(0, columns)
+        else:
+            cells = map(op, repeat(i), cols)
+        yield sep.join(map(format, cells, repeat(spec)))
+
+
+def grid_rows(rows: int, columns: int, symbol: str = "*"):
+    """The grid from grid_printer(): every row is the same string."""
+    row = symbol * columns
+    return repeat(row, rows)
+
+
+def write_rows(lines, file, chunk_rows: int = 1024) -> int:
+    """Write an iterable of row strings, chunk_rows at a time."""
+    count = 0
+    lines = iter(lines)
+    while True:
+        chunk = list(islice(lines, chunk_rows))
+        if not chunk:
+            return count
+        file.write("\n".join(chunk))
+        file.write("\n")
+        count += len(chunk)
+
+
+def write_multiplication_numpy(rows: int, columns: int, file, start: int = 1, block_rows: int = 256) -> None:
+    """Same text as table_rows(), via NumPy outer products, block by block."""
+    corners = [i * j for i in (start, start + rows - 1) for j in (start, start + columns - 1)]
+    width = max(len(str(c)) for c in corners)
+    cols = np.arange(start, start + columns, dtype=np.int64)
+    for first in range(start, start + rows, block_rows):
+        block = np.multiply.outer(np.arange(first, min(first + block_rows, start + rows), dtype=np.int64), cols)
+        np.savetxt(file, block, fmt=f"%{width}d", delimiter=" ")
+
+
+def multiplication_table():
+    print("\n=== 5x5 Multiplication Table (row at a time) ===")
+    for row in table_rows(5, 5):
+        print(row)
+
+
+def custom_tables():
+    print("\n=== Grid (3 x 8, '#') ===")
+    print("\n".join(grid_rows(3, 8, "#")))
+
+    print("\n=== Addition table i + j (width 2) ===")
+    for row in table_rows(4, 6, operator.add, width=2):
+        print(row)
+
+    print("\n=== max(i, j) ===")
+    for row in table_rows(4, 4, max, width=1):
+        print(row)
+
+
+def nested_print(rows: int, columns: int, file) -> None:
+    # the original style: one print() per cell
+    width = len(str(rows * columns))
+    for i in range(1, rows + 1):
+        for j in range(1, columns + 1):
+            print(f"{i * j:>{width}}", end=" " if j < columns else "", file=file)
+        print(file=file)
+
+
+def benchmark(n: int = 2000) -> None:
+    print(f"\n=== {n:,} x {n:,} multiplication table to a file, seconds ===")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "table.txt")
+
+        start = time.perf_counter()
+        with open(path, "w") as f:
+            nested_print(n, n, f)
+        print(f"nested print() per cell      :: {time.perf_counter() - start:.3f}")
+        with open(path) as f:
+            expected = f.read()
+
+        start = time.perf_counter()
+        with open(path, "w") as f:
+            write_rows(table_rows(n, n), f)
+        print(f"table_rows + write_rows      :: {time.perf_counter() - start:.3f}")
+        with open(path) as f:
+            print(f"same output                  :: {f.read() == expected}")
+
+        if np is not None:
+            start = time.perf_counter()
+            with open(path, "w") as f:
+                write_multiplication_numpy(n, n, f)
+            print(f"NumPy outer product          :: {time.perf_counter() - start:.3f}")
+            with open(path) as f:
+                print(f"same output                  :: {f.read() == expected}")
+
+
+if __name__ == "__main__":
+    multiplication_table()
+    custom_tables()
+    benchmark()
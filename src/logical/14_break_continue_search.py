@@ -0,0 +1,277 @@
+"""14_break_continue_search.py
+
+Run:
+    python 14_break_continue_search.py
+
+14_break_continue_pass.py shows the two loop-control patterns:
+
+    for n in numbers:              # break: stop at the first match
+        if n == target:
+            break
+
+    for s in items:                # continue: skip what you don't want
+        if not s.isdigit():
+            continue
+        total += int(s)
+
+This file turns them into reusable tools that pick a faster strategy when
+the input allows it:
+
+- Lookup(values)       many lookups in the same data: a dict {value: first
+                       index} (hash lookup), or bisect when the values are
+                       sorted but not hashable.
+- find_first(...)      one lookup: a short-circuiting scan that stops at the
+                       first match (the `break` loop, run by next()).
+- parallel_find(...)   one lookup with an expensive test over a huge list:
+                       chunks are tested in a process pool; once a chunk
+                       reports a hit, later chunks are cancelled.
+- sum_digit_tokens(...) / sum_digit_tokens_file(path)
+                       the `continue` loop as a stream: filter + map + sum run
+                       in C, and files are read in blocks, never whole.
+"""
+
+import os
+import random
+import tempfile
+import time
+from bisect import bisect_left
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from functools import partial
+from itertools import compress, islice
+from operator import eq
+
+NOT_FOUND = -1
+
+
+class Lookup:
+    """Index of `values` for repeated "is it there / where is it" questions."""
+
+    def __init__(self, values, strategy: str = "auto") -> None:
+        self._values = list(values)
+        if strategy == "auto":
+            try:
+                self._first = {}
+                for i, v in enumerate(self._values):
+                    self._first.setdefault(v, i)
+                strategy = "hash"
+            except TypeError:  # unhashable values (lists, dicts, ...)
+                strategy = "bisect" if _is_sorted(self._values) else "linear"
+        elif strategy == "hash":
+            self._first = {}
+            for i, v in enumerate(self._values):
+                self._first.setdefault(v, i)
+        elif strategy == "bisect":
+            if not _is_sorted(self._values):
+                raise ValueError("strategy 'bisect' needs sorted values")
+        elif strategy != "linear":
+            raise ValueError(f"strategy must be 'auto', 'hash', 'bisect' or 'linear', not {strategy!r}")
+        self.strategy = strategy
+
+    def index(self, target) -> int:
+        """Index of the first value equal to target, or NOT_FOUND (-1)."""
+        if self.strategy == "hash":
+            return self._first.get(target, NOT_FOUND)
+        if self.strategy == "bisect":
+            i = bisect_left(self._values, target)
+            return i if i < len(self._values) and self._values[i] == target else NOT_FOUND
+        return find_first(self._values, target=target)
+
+    def __contains__(self, target) -> bool:
+        return self.index(target) != NOT_FOUND
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+
+def _is_sorted(values) -> bool:
+    return all(a <= b for a, b in zip(values, values[1:]))
+
+
+def find_first(values, predicate=None, target=None, start: int = 0) -> int:
+    """Index of the first value (from `start`) matching predicate / equal to target.
+
+    The `break` loop without the loop: for a target on a list this is
+    list.index (a C loop); otherwise next() stops at the first match.
+    """
+    if predicate is None:
+        if isinstance(values, list):
+            try:
+                return values.index(target, start)
+            except ValueError:
+                return NOT_FOUND
+        predicate = partial(eq, target)
+    it = islice(values, start, None) if start else values
+    return next((i for i, v in enumerate(it, start) if predicate(v)), NOT_FOUND)
+
+
+def _scan_chunk(predicate, chunk, offset: int) -> int:
+    # runs in a worker process: compress() keeps the scan in C, next() stops at the first hit
+    hits = compress(range(offset, offset + len(chunk)), map(predicate, chunk))
+    return next(hits, NOT_FOUND)
+
+
+def parallel_find(values, predicate, chunksize: int = 10_000, workers: int | None = None) -> int:
+    """find_first(values, predicate), with chunks tested in parallel.
+
+    values may be any iterable, a generator included: it is read one chunk
+    at a time (itertools.islice) and only as far as needed. predicate must
+    be a module-level function (it is pickled). The answer is always the
+    LOWEST matching index: a hit in chunk k only ends the search once every
+    chunk before k has come back empty.
+    """
+    workers = workers or os.cpu_count() or 1
+    items = iter(values)
+
+    def chunks():
+        offset = 0
+        while chunk := list(islice(items, chunksize)):
+            yield offset, chunk
+            offset += len(chunk)
+
+    best = NOT_FOUND
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # keep only a couple of chunks per worker in flight, so a hit stops new work
+        pending = {}
+        starts = chunks()
+        done_below = 0  # every chunk starting below this offset has come back
+        finished = set()
+
+        def submit_next() -> bool:
+            if best != NOT_FOUND:
+                return False  # every chunk still to come starts above the hit
+            offset, chunk = next(starts, (None, None))
+            if offset is None:
+                return False
+            pending[pool.submit(_scan_chunk, predicate, chunk, offset)] = offset
+            return True
+
+        for _ in range(workers * 2):
+            if not submit_next():
+                break
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                offset = pending.pop(future)
+                finished.add(offset)
+                hit = future.result()
+                if hit != NOT_FOUND and (best == NOT_FOUND or hit < best):
+                    best = hit
+            while done_below in finished:
+                finished.discard(done_below)
+                done_below += chunksize
+            if best != NOT_FOUND and done_below > best:
+                for future in pending:
+                    future.cancel()
+                break
+            for _ in done:
+                submit_next()
+    return best
+
+
+def sum_digit_tokens(tokens) -> int:
+    """continue_example() as a stream: the sum of every all-digit token.
+
+    Uses isdecimal rather than isdigit: '²'.isdigit() is True but int('²')
+    raises, while every isdecimal string converts.
+    """
+    return sum(map(int, filter(str.isdecimal, tokens)))
+
+
+def iter_tokens(path: str, block_size: int = 1 << 20, encoding: str = "utf-8"):
+    """Whitespace-separated tokens of a text file, read block_size characters at a time."""
+    tail = ""
+    with open(path, encoding=encoding) as f:
+        while block := f.read(block_size):
+            block = tail + block
+            tokens = block.split()
+            # a token cut by the block edge is carried into the next block
+            tail = tokens.pop() if tokens and not block[-1:].isspace() else ""
+            yield from tokens
+    if tail:
+        yield tail
+
+
+def sum_digit_tokens_file(path: str, block_size: int = 1 << 20, encoding: str = "utf-8") -> int:
+    """sum_digit_tokens() over a file of tokens, in bounded memory.
+
+    The file is decoded and split like a str, so the same text gives the same
+    sum from a file as from sum_digit_tokens(text.split()) - non-ASCII
+    decimal digits and Unicode whitespace included.
+    """
+    return sum_digit_tokens(iter_tokens(path, block_size, encoding))
+
+
+# ---- demo / benchmark ----
+
+def long_collatz(n: int) -> bool:
+    """Deliberately slow test for parallel_find: n takes more than 350 Collatz steps to reach 1."""
+    steps = 0
+    while n > 1:
+        n = n // 2 if n % 2 == 0 else 3 * n + 1
+        steps += 1
+    return steps > 350
+
+
+def examples():
+    print("=== break_example via Lookup / find_first ===")
+    numbers = [3, 8, 2, 9, 5]
+    print("index of 9        ::", find_first(numbers, target=9))
+    print("first even        ::", find_first(numbers, lambda n: n % 2 == 0))
+    lookup = Lookup(numbers)
+    print(f"Lookup strategy   :: {lookup.strategy}, 9 in it: {9 in lookup}, 7 in it: {7 in lookup}")
+    pairs = Lookup([[1, 2], [3, 4], [5, 6]])  # lists are unhashable but sortable
+    print(f"Lookup strategy   :: {pairs.strategy}, index of [3, 4]: {pairs.index([3, 4])}")
+
+    print("\n=== continue_example via sum_digit_tokens ===")
+    print("total =", sum_digit_tokens(["10", "x", "25", "", "7"]))
+
+
+def benchmark():
+    print("\n=== 10,000 lookups in 100,000 values, seconds ===")
+    values = random.sample(range(10_000_000), 100_000)
+    targets = random.sample(values, 5_000) + random.sample(range(10_000_000), 5_000)
+    start = time.perf_counter()
+    expected = [v in values for v in targets[:200]]
+    print(f"{'x in list (200 lookups only)':<30}:: {time.perf_counter() - start:.3f}")
+    start = time.perf_counter()
+    lookup = Lookup(values)
+    found = [v in lookup for v in targets]
+    print(f"{'Lookup (hash), incl. build':<30}:: {time.perf_counter() - start:.3f} (same: {found[:200] == expected})")
+    ordered = Lookup(sorted(values), strategy="bisect")
+    start = time.perf_counter()
+    found_sorted = [v in ordered for v in targets]
+    print(f"{'Lookup (bisect, sorted)':<30}:: {time.perf_counter() - start:.3f} (same: {found_sorted == found})")
+
+    print(f"\n=== first n with an expensive test, workers = {os.cpu_count()}, seconds ===")
+    candidates = list(range(1, 1_000_000))
+    start = time.perf_counter()
+    expected = find_first(candidates, long_collatz)
+    print(f"{'find_first (serial)':<30}:: {time.perf_counter() - start:.3f}")
+    start = time.perf_counter()
+    result = parallel_find(candidates, long_collatz, chunksize=5_000)
+    print(f"{'parallel_find':<30}:: {time.perf_counter() - start:.3f} (same: {result == expected})")
+
+    n = 3_000_000
+    print(f"\n=== sum of digit tokens in a {n:,}-token file, seconds ===")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "tokens.txt")
+        words = ["10", "x", "25", "", "7", "abc", "12a", "999"]
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(" ".join(random.choice(words) or "\n" for _ in range(n)))
+
+        start = time.perf_counter()
+        total = 0
+        with open(path, encoding="utf-8") as f:
+            for s in f.read().split():
+                if not s.isdecimal():
+                    continue
+                total += int(s)
+        print(f"{'read() + for/continue loop':<30}:: {time.perf_counter() - start:.3f}")
+        start = time.perf_counter()
+        streamed = sum_digit_tokens_file(path, block_size=1 << 16)
+        print(f"{'sum_digit_tokens_file':<30}:: {time.perf_counter() - start:.3f} (same: {streamed == total})")
+
+
+if __name__ == "__main__":
+    examples()
+    benchmark()
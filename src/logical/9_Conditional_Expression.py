@@ -9,9 +9,9 @@ import logging
 # Syntax:
 # value_if_true if condition else value_if_false
 
-def main()->None:
-    x = input("Please enter your age: ")
-    message = "*** Right to vote ***!!!" if x.isdecimal() and x >= 18 else """May be you have Entered is not a number 
+def main(ask=input)->None:
+    x = ask("Please enter your age: ")
+    message = "*** Right to vote ***!!!" if x.isdecimal() and int(x) >= 18 else """May be you have Entered is not a number 
     (or) 
     Can not vote"""
     print(f"{message}")
@@ -1,6 +1,6 @@
 
-def main():
-    x = int(input("Please enter an integer: "))
+def main(ask=input):
+    x = int(ask("Please enter an integer: "))
 
     if x < 0:
         x = 0
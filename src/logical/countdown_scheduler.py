@@ -0,0 +1,70 @@
+"""countdown_scheduler.py
+
+Non-blocking countdowns on one asyncio event loop.
+
+12_For_Loop_By_Range_Count.py used to count down with time.sleep(1), which
+freezes the whole program for every tick. Here a countdown is a coroutine:
+while one waits, the event loop runs the others, so thousands of countdowns
+share one thread.
+
+Ticks are drift-corrected: tick k is scheduled at  start_time + k * interval,
+not "interval after the previous tick finished", so slow tick callbacks or a
+busy loop do not make the countdown fall further and further behind.
+
+    run_countdown(5)                       # blocking wrapper, prints 5 4 3 2 1
+
+    scheduler = CountdownScheduler()
+    scheduler.add("a", 3, interval=0.5)
+    scheduler.add("b", 10, interval=0.1, on_tick=print)
+    scheduler.run()                        # both at once
+"""
+
+import asyncio
+
+
+async def countdown(start: int, interval: float = 1.0, on_tick=None) -> float:
+    """Call on_tick(n) for n = start .. 1, one interval apart.
+
+    Returns the worst lateness seen (seconds a tick fired after its deadline).
+    """
+    loop = asyncio.get_running_loop()
+    began = loop.time()
+    worst = 0.0
+    for k, n in enumerate(range(start, 0, -1)):
+        deadline = began + k * interval
+        delay = deadline - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        worst = max(worst, loop.time() - deadline)
+        if on_tick is not None:
+            on_tick(n)
+    await asyncio.sleep(max(0.0, began + start * interval - loop.time()))  # the last second
+    return worst
+
+
+class CountdownScheduler:
+    def __init__(self) -> None:
+        self._countdowns = {}
+
+    def add(self, name, start: int, interval: float = 1.0, on_tick=None, on_done=None) -> None:
+        self._countdowns[name] = (start, interval, on_tick, on_done)
+
+    async def run_async(self) -> dict:
+        """Run every countdown concurrently; returns {name: worst lateness}."""
+        async def one(name, start, interval, on_tick, on_done):
+            worst = await countdown(start, interval, on_tick)
+            if on_done is not None:
+                on_done(name)
+            return worst
+
+        names = list(self._countdowns)
+        results = await asyncio.gather(*(one(name, *self._countdowns[name]) for name in names))
+        return dict(zip(names, results))
+
+    def run(self) -> dict:
+        return asyncio.run(self.run_async())
+
+
+def run_countdown(start: int, interval: float = 1.0, on_tick=print) -> float:
+    """Blocking wrapper for scripts: one countdown, returns its worst lateness."""
+    return asyncio.run(countdown(start, interval, on_tick))
@@ -0,0 +1,88 @@
+"""10_DTO_codec.py
+
+Run:
+    python 10_DTO_codec.py
+
+Shipping a list of Car DTOs (5_DataClass_DTO.py) as bytes: the generated
+struct codec (dto_codec.py) against pickle, json and dataclasses.asdict.
+Bytes on the wire, encode and decode time, best of 3.
+"""
+
+import dataclasses
+import importlib.util
+import json
+import os
+import pickle
+import random
+import sys
+import time
+
+from dto_codec import codec_for
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+N = 200_000
+
+
+def _load(filename: str):
+    spec = importlib.util.spec_from_file_location(filename[:-3], os.path.join(HERE, filename))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module  # so pickle can find the class again
+    spec.loader.exec_module(module)
+    return module
+
+
+def best_of(fn, repeat: int = 3):
+    """(result, best seconds of `repeat` runs)."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def main() -> None:
+    Car = _load("5_DataClass_DTO.py").Car
+    codec = codec_for(Car)
+
+    print("=== one Car ===")
+    car = Car("Toyota", "Rav4")
+    data = codec.encode(car)
+    print(f"{car} -> {data!r} ({len(data)} bytes) -> {codec.decode(data)}")
+    print("\n=== the generated code (memoryview version) ===")
+    print(codec.source())
+
+    makes = ["Toyota", "BMW", "Benz", "Ford", "Honda", "Citroën"]
+    cars = [Car(random.choice(makes), f"Model{random.randrange(500)}") for _ in range(N)]
+    asdict, fields = dataclasses.asdict, [f.name for f in dataclasses.fields(Car)]
+
+    formats = [
+        ("dto_codec", codec.encode_many, codec.decode_many),
+        ("pickle", lambda objs: pickle.dumps(objs, protocol=pickle.HIGHEST_PROTOCOL), pickle.loads),
+        ("json + asdict", lambda objs: json.dumps([asdict(c) for c in objs]).encode(),
+         lambda data: [Car(**d) for d in json.loads(data)]),
+        ("json + attribute lists", lambda objs: json.dumps([[c.make, c.model] for c in objs]).encode(),
+         lambda data: [Car(*row) for row in json.loads(data)]),
+    ]
+    print(f"=== {N:,} cars ===")
+    print(f"{'format':<24} {'bytes':>10} {'encode s':>9} {'decode s':>9}")
+    for label, encode, decode in formats:
+        data, encode_secs = best_of(lambda: encode(cars))
+        back, decode_secs = best_of(lambda: decode(data))
+        print(f"{label:<24} {len(data):>10,} {encode_secs:>9.3f} {decode_secs:>9.3f} (same: {back == cars})")
+    _, secs = best_of(lambda: [asdict(c) for c in cars])
+    print(f"{'asdict alone':<24} {'':>10} {secs:>9.3f}   ({len(fields)} fields, a dict per car)")
+
+    print("\n=== decoding out of a bigger buffer ===")
+    data = codec.encode_many(cars)
+    received = bytearray(b"HEADER" + data)  # e.g. a frame read into a reusable buffer
+    view = memoryview(received)[6:]
+    back, secs = best_of(lambda: codec.decode_many(view))
+    print(f"{'memoryview slice':<24} {'':>10} {'':>9} {secs:>9.3f} (same: {back == cars}, nothing copied)")
+    _, secs = best_of(lambda: codec.decode_many(bytes(received[6:])))
+    print(f"{'copied to bytes first':<24} {'':>10} {'':>9} {secs:>9.3f} (a {len(data):,} byte copy; "
+          f"short strings decode faster from bytes)")
+
+
+if __name__ == "__main__":
+    main()
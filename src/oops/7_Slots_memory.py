@@ -0,0 +1,113 @@
+"""7_Slots_memory.py
+
+Run:
+    python 7_Slots_memory.py
+
+Bytes per instance, construction rate and attribute-access speed of the
+Car variants: the dict-backed classes from this folder against the
+__slots__, frozen, namedtuple and dataclass(slots=True) versions in
+car_records.py.
+
+Bytes are measured with tracemalloc over N instances (the instance plus its
+__dict__, if any; the field values themselves are shared and not counted).
+Since Python 3.11 a plain instance keeps its attributes inline and only
+builds a real __dict__ when something asks for it, so the gap is smaller
+than on older versions - and grows again as soon as vars(obj) is used.
+"""
+
+import importlib.util
+import os
+import sys
+import time
+import tracemalloc
+
+from car_records import CarDTO, CarTuple, DataCar, FrozenCar, FrozenDataCar, FrozenHouse, SlottedCar, SlottedHouse
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+N = 200_000
+
+
+def _load(filename: str):
+    spec = importlib.util.spec_from_file_location(filename[:-3], os.path.join(HERE, filename))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def bytes_per_instance(cls, args: list) -> float:
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        objs = [cls(*a) for a in args]
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return (after - before - sys.getsizeof(objs)) / len(objs)
+
+
+def construction_rate(cls, args: list, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        [cls(*a) for a in args]
+        best = min(best, time.perf_counter() - start)
+    return len(args) / best
+
+
+def access_ns(objs: list, repeat: int = 3) -> float:
+    """ns to read two attributes of one instance (best of `repeat` runs)."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for o in objs:
+            o.make
+            o.year
+        best = min(best, time.perf_counter() - start)
+    return best / len(objs) * 1e9
+
+
+def main() -> None:
+    dict_car = _load("3_Self.py").Car
+    dict_house = _load("3_Return_Self.py").House
+    dto_car = _load("5_DataClass_DTO.py").Car
+
+    print("=== the variants behave like the originals ===")
+    car = SlottedCar("BMW", "Lola", 2002, "White")
+    print(f"{car!r} colour :: {car.get_colour()}")
+    frozen = FrozenCar("Benz", "Lola", 2026, "Green")
+    try:
+        frozen.color = "Red"
+    except AttributeError as e:
+        print(f"FrozenCar is read-only :: {type(e).__name__}: {e}")
+    try:
+        car.wheels = 8
+    except AttributeError as e:
+        print(f"no __dict__, no new attributes :: {e}")
+    print(f"frozen cars are hashable :: {len({frozen, FrozenCar('Benz', 'Lola', 2026, 'Green')})} distinct")
+
+    colours = ["Red", "White", "Green", "Blue"]
+    makes = ["Toyota", "BMW", "Benz", "Ford"]
+    years = list(range(1980, 2027))
+    args = [(makes[i % 4], f"Model{i % 50}", years[i % len(years)], colours[i % 3]) for i in range(N)]
+
+    print(f"\n=== {N:,} instances, four fields ===")
+    print(f"{'class':<30} {'bytes/instance':>15} {'created/s':>12} {'access ns':>10}")
+    for label, cls in (("3_Self.Car (__dict__)", dict_car), ("3_Return_Self.House (__dict__)", dict_house),
+                       ("SlottedCar", SlottedCar), ("SlottedHouse", SlottedHouse), ("FrozenCar", FrozenCar),
+                       ("FrozenHouse", FrozenHouse), ("CarTuple (namedtuple)", CarTuple),
+                       ("DataCar (slots=True)", DataCar), ("FrozenDataCar (frozen)", FrozenDataCar)):
+        size = bytes_per_instance(cls, args)
+        rate = construction_rate(cls, args)
+        objs = [cls(*a) for a in args]
+        print(f"{label:<30} {size:>15.1f} {rate:>12,.0f} {access_ns(objs):>10.1f}")
+
+    print(f"\n=== {N:,} instances, 5_DataClass_DTO.Car (make, model) ===")
+    pairs = [a[:2] for a in args]
+    for label, cls in (("@dataclass", dto_car), ("@dataclass(slots=True)", CarDTO)):
+        size = bytes_per_instance(cls, pairs)
+        rate = construction_rate(cls, pairs)
+        print(f"{label:<30} {size:>15.1f} {rate:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
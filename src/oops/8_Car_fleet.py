@@ -0,0 +1,92 @@
+"""8_Car_fleet.py
+
+Run:
+    python 8_Car_fleet.py
+
+One million cars as Car objects (3_Self.py) against one CarFleet
+(car_fleet.py): memory, bulk load, and the filter
+    year > 2000 and color == "Red"
+"""
+
+import importlib.util
+import os
+import random
+import time
+import tracemalloc
+
+from car_fleet import CarFleet
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+N = 1_000_000
+
+
+def _load(filename: str):
+    spec = importlib.util.spec_from_file_location(filename[:-3], os.path.join(HERE, filename))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def traced(build):
+    """(result of build(), bytes it allocated and kept)."""
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        result = build()
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, after - before
+
+
+def main() -> None:
+    Car = _load("3_Self.py").Car
+
+    print("=== a small fleet ===")
+    fleet = CarFleet([("BMW", "Lola", 2002, "White"), ("Benz", "Lola", 2026, "Green")])
+    fleet.append_car(Car("Toyota", "Rav4", 1989, "Red"))
+    for car in fleet:
+        print(f"{car!r} colour :: {car.get_colour()}")
+    print("year > 2000 ->", list(fleet.rows(fleet.where(year_min=2001))))
+    print("as a Car    ->", vars(fleet[0].to_car(Car)))
+
+    makes = ["Toyota", "BMW", "Benz", "Ford", "Honda", "Kia"]
+    colours = ["Red", "White", "Green", "Blue", "Black", "Silver"]
+    # rows as they would come out of a CSV reader: a new str object per text field
+    rows = [(f"{random.choice(makes)}", f"Model{random.randrange(500)}", random.randint(1980, 2026),
+             f"{random.choice(colours)}") for _ in range(N)]
+
+    print(f"\n=== {N:,} cars ===")
+    start = time.perf_counter()
+    cars, car_bytes = traced(lambda: [Car(*row) for row in rows])
+    print(f"{'list of Car':<22}:: built in {time.perf_counter() - start:.2f}s, {car_bytes / 2**20:7.1f} MiB "
+          f"(objects only, the row strings are shared)")
+    start = time.perf_counter()
+    fleet, fleet_bytes = traced(lambda: CarFleet(rows))
+    print(f"{'CarFleet':<22}:: built in {time.perf_counter() - start:.2f}s, {fleet_bytes / 2**20:7.1f} MiB "
+          f"(columns {fleet.nbytes() / 2**20:.1f} MiB)")
+
+    # what the Car list really costs: its own strings, as if each row had been read from a file
+    # (sys.getsizeof of an ASCII str is its length + 49)
+    string_bytes = sum(len(s) + 49 for row in rows for s in (row[0], row[1], row[3]))
+    print(f"{'list of Car + strings':<22}:: {(car_bytes + string_bytes) / 2**20:7.1f} MiB, "
+          f"{(car_bytes + string_bytes) / fleet_bytes:.0f}x the fleet")
+
+    print("\n=== year > 2000 and color == 'Red', seconds ===")
+    start = time.perf_counter()
+    expected = [i for i, c in enumerate(cars) if c.year > 2000 and c.color == "Red"]
+    print(f"{'list comprehension':<22}:: {time.perf_counter() - start:.3f}")
+    start = time.perf_counter()
+    result = fleet.where(year_min=2001, color="Red")
+    print(f"{'CarFleet.where':<22}:: {time.perf_counter() - start:.3f} (same: {result == expected})")
+
+    start = time.perf_counter()
+    expected = [i for i, c in enumerate(cars) if c.make in ("BMW", "Benz") and c.model == "Model7"]
+    print(f"{'make in / model ==':<22}:: {time.perf_counter() - start:.3f}")
+    start = time.perf_counter()
+    result = fleet.where(make=("BMW", "Benz"), model="Model7")
+    print(f"{'CarFleet.where':<22}:: {time.perf_counter() - start:.3f} (same: {result == expected})")
+
+
+if __name__ == "__main__":
+    main()
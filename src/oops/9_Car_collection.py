@@ -0,0 +1,94 @@
+"""9_Car_collection.py
+
+Run:
+    python 9_Car_collection.py
+
+Finding Car objects (3_Self.py) by make / model / year / colour: a linear
+scan of a list against CarCollection (car_collection.py) with hash indexes
+and a sorted year index, on 1,000,000 cars.
+"""
+
+import importlib.util
+import os
+import random
+import time
+
+from car_collection import CarCollection
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+N = 1_000_000
+
+
+def _load(filename: str):
+    spec = importlib.util.spec_from_file_location(filename[:-3], os.path.join(HERE, filename))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def timed(fn, repeat: int = 3):
+    """(result, best seconds of `repeat` runs)."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def main() -> None:
+    Car = _load("3_Self.py").Car
+
+    print("=== a small collection ===")
+    car_1, car_2 = Car("BMW", "Lola", 2002, "White"), Car("Benz", "Lola", 2026, "Green")
+    cars = CarCollection([car_1, car_2, Car()])
+    print("model == Lola      ->", [c.make for c in cars.query(model="Lola")])
+    print("year > 2000, Green ->", [c.make for c in cars.query(year_min=2001, color="Green")])
+    cars.update(car_1, color="Green")
+    print("after update       ->", [c.make for c in cars.query(year_min=2001, color="Green")])
+    cars.remove(car_2)
+    print("after remove       ->", [c.make for c in cars.query(year_min=2001, color="Green")])
+
+    makes = ["Toyota", "BMW", "Benz", "Ford", "Honda", "Kia"]
+    colours = ["Red", "White", "Green", "Blue", "Black", "Silver"]
+    fleet = [Car(random.choice(makes), f"Model{random.randrange(500)}", random.randint(1980, 2026),
+                 random.choice(colours)) for _ in range(N)]
+
+    print(f"\n=== {N:,} cars ===")
+    start = time.perf_counter()
+    cars = CarCollection(fleet)
+    print(f"{'building the indexes':<40}:: {time.perf_counter() - start:.2f}s")
+
+    queries = [
+        ("make == BMW and model == Model7", dict(make="BMW", model="Model7"),
+         lambda c: c.make == "BMW" and c.model == "Model7"),
+        ("year == 2010 and colour == Red", dict(year=2010, color="Red"),
+         lambda c: c.year == 2010 and c.get_colour() == "Red"),
+        ("2001 <= year <= 2003 and make == Kia", dict(year_min=2001, year_max=2003, make="Kia"),
+         lambda c: 2001 <= c.year <= 2003 and c.make == "Kia"),
+        ("year > 2000 and colour == Red", dict(year_min=2001, color="Red"),
+         lambda c: c.year > 2000 and c.get_colour() == "Red"),
+    ]
+    print(f"{'query':<40} {'scan s':>8} {'index s':>8} {'rows':>8}  plan")
+    for label, conditions, predicate in queries:
+        expected, scan = timed(lambda: [c for c in fleet if predicate(c)])
+        result, indexed = timed(lambda: cars.query(**conditions))
+        same = len(result) == len(expected) and set(map(id, result)) == set(map(id, expected))
+        plan = " -> ".join(f"{field} ({size:,})" for field, size in cars.explain(**conditions))
+        print(f"{label:<40} {scan:>8.4f} {indexed:>8.4f} {len(result):>8,}  {plan} (same: {same})")
+
+    print("\n=== keeping the indexes up to date, per car ===")
+    new = [Car("Tesla", f"Model{i % 4}", 2020 + i % 7, "Blue") for i in range(100_000)]
+    start = time.perf_counter()
+    for car in new:
+        cars.add(car)
+    print(f"{'add':<40}:: {(time.perf_counter() - start) / len(new) * 1e6:.2f} us")
+    start = time.perf_counter()
+    for car in new:
+        cars.remove(car)
+    print(f"{'remove':<40}:: {(time.perf_counter() - start) / len(new) * 1e6:.2f} us")
+    print(f"{'back to':<40}:: {len(cars):,} cars, Tesla left: {cars.query(make='Tesla') == []}")
+
+
+if __name__ == "__main__":
+    main()
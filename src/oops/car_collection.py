@@ -0,0 +1,172 @@
+"""car_collection.py
+
+CarCollection: Car objects (3_Self.py) with secondary indexes, so finding
+cars by make / model / year / colour does not scan every car.
+
+- make, model and colour (car.get_colour()) have hash indexes:
+  value -> the cars with that value,
+- year has a sorted index: year -> cars, plus the distinct years in a
+  sorted list, so year_min / year_max ranges are found with bisect,
+- add() / remove() / update() keep every index in step.
+
+    cars = CarCollection(list_of_cars)
+    cars.query(make="BMW", year_min=2001)           # [Car, ...]
+    cars.explain(make="BMW", year_min=2001)         # what the planner chose
+
+The planner counts how many cars each condition selects (exact and cheap:
+it only adds up bucket sizes), starts from the smallest set and checks the
+other conditions on just those cars. Each bucket is a dict used as an
+ordered set, so a query on one value returns cars in the order they were
+added.
+
+Change cars through update() (or remove() and add() again): an attribute
+changed behind the collection's back is not seen by its indexes.
+"""
+
+from bisect import bisect_left, bisect_right, insort
+from itertools import chain, compress, repeat
+from operator import attrgetter, ge, le, methodcaller
+
+HASH_FIELDS = {
+    "make": attrgetter("make"),
+    "model": attrgetter("model"),
+    "color": methodcaller("get_colour"),
+}
+get_year = attrgetter("year")
+_MISSING = object()
+
+
+class CarCollection:
+    def __init__(self, cars=()) -> None:
+        self._cars = {}  # car -> (make, model, color, year) as indexed, so remove() works after a change
+        self._hash = {field: {} for field in HASH_FIELDS}
+        self._years = {}  # year -> {car: None}
+        self._sorted_years = []
+        for car in cars:
+            self.add(car)
+
+    def __len__(self) -> int:
+        return len(self._cars)
+
+    def __iter__(self):
+        return iter(self._cars)
+
+    def __contains__(self, car) -> bool:
+        return car in self._cars
+
+    def add(self, car) -> None:
+        if car in self._cars:
+            raise ValueError(f"{car!r} is already in the collection")
+        keys = tuple(get(car) for get in HASH_FIELDS.values())
+        year = get_year(car)
+        hash(keys + (year,))  # an unhashable value raises TypeError here, before any index changes
+        bucket = self._years.get(year)
+        if bucket is None:
+            insort(self._sorted_years, year)  # the only other step that can fail (year not comparable)
+            bucket = self._years[year] = {}
+        bucket[car] = None
+        for index, key in zip(self._hash.values(), keys):
+            bucket = index.get(key)
+            if bucket is None:
+                bucket = index[key] = {}
+            bucket[car] = None
+        self._cars[car] = keys + (year,)
+
+    def remove(self, car) -> None:
+        """Raises KeyError if the car is not in the collection."""
+        *keys, year = self._cars.pop(car)
+        for index, key in zip(self._hash.values(), keys):
+            bucket = index[key]
+            del bucket[car]
+            if not bucket:
+                del index[key]
+        bucket = self._years[year]
+        del bucket[car]
+        if not bucket:
+            del self._years[year]
+            del self._sorted_years[bisect_left(self._sorted_years, year)]
+
+    def update(self, car, **changes) -> None:
+        """Change attributes of a car in the collection: update(car, color="Blue").
+
+        If the changed car can't be indexed (TypeError for an unhashable value),
+        its old attributes are put back and it stays in the collection.
+        """
+        old = {}  # the attributes changed so far, with their values before (or missing)
+        self.remove(car)
+        try:
+            for name, value in changes.items():
+                old[name] = getattr(car, name, _MISSING)
+                setattr(car, name, value)
+            self.add(car)
+        except BaseException:
+            for name, value in old.items():
+                if value is _MISSING:
+                    delattr(car, name)
+                else:
+                    setattr(car, name, value)
+            self.add(car)
+            raise
+
+    # ---- querying -----------------------------------------------------------
+
+    def _year_buckets(self, year=None, year_min=None, year_max=None) -> list:
+        lo = 0 if year_min is None else bisect_left(self._sorted_years, year_min)
+        hi = len(self._sorted_years) if year_max is None else bisect_right(self._sorted_years, year_max)
+        if year is None:
+            return [self._years[y] for y in self._sorted_years[lo:hi]]
+        if lo >= hi:
+            return []
+        first, last = self._sorted_years[lo], self._sorted_years[hi - 1]
+        years = dict.fromkeys([year] if isinstance(year, int) else year)
+        return [self._years[y] for y in years if y in self._years and first <= y <= last]
+
+    def _candidates(self, make=None, model=None, color=None, year=None, year_min=None, year_max=None) -> list:
+        """[(label, buckets, size), ...]: every condition with the cars it selects."""
+        candidates = []
+        for field, wanted in (("make", make), ("model", model), ("color", color)):
+            if wanted is not None:
+                values = [wanted] if isinstance(wanted, str) else dict.fromkeys(wanted)
+                index = self._hash[field]
+                buckets = [index[v] for v in values if v in index]
+                candidates.append((field, buckets, sum(map(len, buckets))))
+        if year is not None or year_min is not None or year_max is not None:
+            buckets = self._year_buckets(year, year_min, year_max)
+            candidates.append(("year", buckets, sum(map(len, buckets))))
+        return candidates
+
+    def explain(self, **conditions) -> list:
+        """[(field, cars it selects), ...], in the order the planner uses them."""
+        return [(label, size) for label, _, size in sorted(self._candidates(**conditions), key=lambda c: c[2])]
+
+    def query(self, make=None, model=None, color=None, year=None, year_min=None, year_max=None) -> list:
+        """Cars matching every given condition.
+
+        make / model / color / year: one value or a collection of values.
+        year_min / year_max: inclusive bounds (year > 2000 is year_min=2001).
+        """
+        candidates = self._candidates(make, model, color, year, year_min, year_max)
+        if not candidates:
+            return list(self._cars)
+        field, buckets, _ = min(candidates, key=lambda c: c[2])
+        cars = list(buckets[0]) if len(buckets) == 1 else list(chain.from_iterable(buckets))
+        # the other conditions, checked on the remaining cars only
+        for other, wanted in (("make", make), ("model", model), ("color", color)):
+            if wanted is not None and other != field and cars:
+                if isinstance(wanted, str):
+                    cars = list(filter(self._hash[other].get(wanted, {}).__contains__, cars))
+                else:
+                    wanted = frozenset(wanted)
+                    cars = list(compress(cars, map(wanted.__contains__, map(HASH_FIELDS[other], cars))))
+        if field != "year" and cars:
+            if year is not None:
+                years = frozenset([year] if isinstance(year, int) else year)
+                cars = list(compress(cars, map(years.__contains__, map(get_year, cars))))
+            if year_min is not None:
+                cars = list(compress(cars, map(ge, map(get_year, cars), repeat(year_min))))
+            if year_max is not None:
+                cars = list(compress(cars, map(le, map(get_year, cars), repeat(year_max))))
+        return cars
+
+    def distinct(self, field: str) -> list:
+        return list(self._sorted_years) if field == "year" else list(self._hash[field])
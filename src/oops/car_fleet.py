@@ -0,0 +1,265 @@
+"""car_fleet.py
+
+CarFleet: many Car(make, model, year, color) records stored column-wise.
+
+A list of Car objects costs one object per car (plus one string object per
+text field, when the values come from a file). CarFleet keeps one column
+per field instead:
+
+- make / model / color are dictionary-encoded: each distinct string is
+  stored once, and the column holds small integer codes - array('B'),
+  1 byte per car, widened to array('H') / array('I') only when a field
+  gets more than 256 / 65,536 distinct values,
+- year is an array('H') (2 bytes per car).
+
+    fleet = CarFleet()
+    fleet.append("BMW", "Lola", 2002, "White")
+    fleet.extend(rows)                          # bulk load (make, model, year, color) tuples
+    fleet.where(year_min=2001, color="Red")     # row numbers, like year > 2000 and color == "Red"
+    fleet[i]                                    # a CarView: reads the columns on demand
+
+where() scans whole columns at a time: with NumPy the arrays are viewed
+(without copying) as ndarrays and combined as boolean masks; without it the
+1-byte code columns are matched with bytes.translate (one C call gives a
+0/1 byte per row), several such masks are ANDed as big ints, and the
+other conditions only check the rows that survive.
+"""
+
+from array import array
+from itertools import compress, repeat
+from operator import eq, ge, le
+
+_WIDER = {"B": "H", "H": "I"}
+
+try:
+    import numpy as np
+except ImportError:  # pure-Python scans only
+    np = None
+
+
+class _Dictionary:
+    """Distinct strings <-> integer codes."""
+
+    __slots__ = ("values", "codes", "limit")
+
+    def __init__(self, limit: int) -> None:
+        self.values = []
+        self.codes = {}
+        self.limit = limit
+
+    def encode(self, value: str) -> int:
+        code = self.codes.get(value)
+        if code is None:
+            code = len(self.values)
+            if code >= self.limit:
+                raise OverflowError(f"more than {self.limit:,} distinct values")
+            self.codes[value] = code
+            self.values.append(value)
+        return code
+
+
+class CarView:
+    """One row of a CarFleet that reads like a Car (read-only)."""
+
+    __slots__ = ("_fleet", "_row")
+
+    def __init__(self, fleet: "CarFleet", row: int) -> None:
+        self._fleet = fleet
+        self._row = row
+
+    @property
+    def make(self) -> str:
+        return self._fleet._dicts["make"].values[self._fleet._columns["make"][self._row]]
+
+    @property
+    def model(self) -> str:
+        return self._fleet._dicts["model"].values[self._fleet._columns["model"][self._row]]
+
+    @property
+    def year(self) -> int:
+        return self._fleet._columns["year"][self._row]
+
+    @property
+    def color(self) -> str:
+        return self._fleet._dicts["color"].values[self._fleet._columns["color"][self._row]]
+
+    def get_colour(self) -> str:
+        return self.color
+
+    def as_tuple(self) -> tuple:
+        return self.make, self.model, self.year, self.color
+
+    def to_car(self, cls):
+        """A real object, e.g. view.to_car(Car) with Car from 3_Self.py."""
+        return cls(*self.as_tuple())
+
+    def __repr__(self) -> str:
+        return "CarView({!r}, {!r}, {!r}, {!r})".format(*self.as_tuple())
+
+
+class CarFleet:
+    def __init__(self, rows=()) -> None:
+        self._dicts = {"make": _Dictionary(1 << 16), "model": _Dictionary(1 << 32), "color": _Dictionary(1 << 16)}
+        self._columns = {"make": array("B"), "model": array("B"), "year": array("H"), "color": array("B")}
+        self.extend(rows)
+
+    def _fit(self, field: str) -> None:
+        """Widen a code column once its dictionary outgrows the item size."""
+        column = self._columns[field]
+        while len(self._dicts[field].values) > 1 << (8 * column.itemsize):
+            column = self._columns[field] = array(_WIDER[column.typecode], column)
+
+    def append(self, make: str, model: str, year: int, color: str) -> None:
+        columns, dicts = self._columns, self._dicts
+        columns["year"].append(year)  # checks the year before any code column is touched
+        try:
+            codes = [dicts[field].encode(value) for field, value in (("make", make), ("model", model), ("color", color))]
+        except OverflowError:
+            columns["year"].pop()
+            raise
+        for field, code in zip(("make", "model", "color"), codes):
+            self._fit(field)
+            columns[field].append(code)
+
+    def append_car(self, car) -> None:
+        """Any object with make / model / year / color attributes."""
+        self.append(car.make, car.model, car.year, car.color)
+
+    def extend(self, rows) -> None:
+        """Bulk load (make, model, year, color) rows; each column is encoded in one pass."""
+        rows = rows if isinstance(rows, list) else list(rows)
+        if not rows:
+            return
+        makes, models, years, colors = zip(*rows)
+        years = array("H", years)  # checks the years before any column is touched
+        text = (("make", makes), ("model", models), ("color", colors))
+        for field, values in text:
+            dictionary = self._dicts[field]
+            for value in dict.fromkeys(values):  # distinct values, in first-seen order
+                if value not in dictionary.codes:
+                    dictionary.encode(value)
+            self._fit(field)
+        for field, values in text:
+            self._columns[field].extend(map(self._dicts[field].codes.__getitem__, values))  # a C loop
+        self._columns["year"].extend(years)
+
+    def __len__(self) -> int:
+        return len(self._columns["year"])
+
+    def __getitem__(self, row: int) -> CarView:
+        if row < 0:
+            row += len(self)
+        if not 0 <= row < len(self):
+            raise IndexError("CarFleet index out of range")
+        return CarView(self, row)
+
+    def __iter__(self):
+        return map(CarView, repeat(self), range(len(self)))
+
+    def rows(self, indices):
+        """CarViews for the given row numbers (e.g. the result of where())."""
+        return map(CarView, repeat(self), indices)
+
+    def column(self, field: str) -> list:
+        """A decoded column: ['BMW', 'Benz', ...] / [2002, 2026, ...]."""
+        if field == "year":
+            return self._columns["year"].tolist()
+        return list(map(self._dicts[field].values.__getitem__, self._columns[field]))
+
+    def distinct(self, field: str) -> list:
+        return list(self._dicts[field].values)
+
+    def nbytes(self) -> int:
+        """Bytes in the code / year columns (the dictionaries are extra, but shared)."""
+        return sum(col.itemsize * len(col) for col in self._columns.values())
+
+    # ---- filtering ----------------------------------------------------------
+
+    def _codes(self, field: str, wanted) -> list:
+        """Codes of the wanted value(s); values never seen have no code."""
+        values = [wanted] if isinstance(wanted, str) else wanted
+        known = self._dicts[field].codes
+        return [known[v] for v in values if v in known]
+
+    def where(self, make=None, model=None, color=None, year=None, year_min=None, year_max=None) -> list:
+        """Row numbers matching every given condition.
+
+        make / model / color / year: one value or a collection of values.
+        year_min / year_max: inclusive bounds (year > 2000 is year_min=2001).
+        """
+        conditions = []  # (column, set of codes) or (column, op, bound)
+        for field, wanted in (("make", make), ("model", model), ("color", color)):
+            if wanted is not None:
+                conditions.append((field, self._codes(field, wanted)))
+        if year is not None:
+            conditions.append(("year", [year] if isinstance(year, int) else list(year)))
+        if year_min is not None:
+            conditions.append(("year", ge, year_min))
+        if year_max is not None:
+            conditions.append(("year", le, year_max))
+        if not conditions or not len(self):
+            return list(range(len(self)))
+        if any(len(c) == 2 and not c[1] for c in conditions):
+            return []  # a value that is not in the fleet at all
+        if np is not None:
+            return self._where_numpy(conditions)
+        return self._where_python(conditions)
+
+    def _where_numpy(self, conditions) -> list:
+        mask = np.ones(len(self), dtype=bool)
+        for condition in conditions:
+            column = np.frombuffer(self._columns[condition[0]], dtype=self._columns[condition[0]].typecode)
+            if len(condition) == 2:
+                mask &= np.isin(column, condition[1])
+            else:
+                _, op, bound = condition
+                mask &= column >= bound if op is ge else column <= bound
+        return np.flatnonzero(mask).tolist()
+
+    def _scan(self, condition, rows=None) -> list:
+        """Rows (all of them, or just `rows`) passing one condition; every loop runs in C."""
+        column = self._columns[condition[0]]
+        if rows is None:
+            rows, values = range(len(column)), column
+        else:
+            values = map(column.__getitem__, rows)
+        if len(condition) == 2:
+            codes = condition[1]
+            if len(codes) == 1:
+                hits = map(eq, values, repeat(codes[0]))
+            else:
+                hits = map(frozenset(codes).__contains__, values)
+        else:
+            _, op, bound = condition
+            hits = map(op, values, repeat(bound))
+        return list(compress(rows, hits))
+
+    def _byte_mask(self, condition) -> int:
+        """A 1-byte code column matched against a set of codes: one 0/1 byte per row, as an int."""
+        table = bytearray(256)
+        for code in condition[1]:
+            table[code] = 1
+        return int.from_bytes(self._columns[condition[0]].tobytes().translate(table), "little")
+
+    def _where_python(self, conditions) -> list:
+        # assuming values are spread evenly, equality on a column with many distinct
+        # values leaves the fewest rows, so it goes first; the rest only check survivors
+        def estimate(condition):
+            if len(condition) == 2:
+                return len(condition[1]) / max(len(self._dicts[condition[0]].values), 1) \
+                    if condition[0] != "year" else 0.05 * len(condition[1])
+            return 0.5
+        masked = [c for c in conditions if len(c) == 2 and self._columns[c[0]].typecode == "B"]
+        ordered = sorted((c for c in conditions if c not in masked), key=estimate)
+        if masked:
+            mask = self._byte_mask(masked[0])
+            for condition in masked[1:]:
+                mask &= self._byte_mask(condition)
+            rows = list(compress(range(len(self)), mask.to_bytes(len(self), "little")))
+        else:
+            rows = self._scan(ordered.pop(0))
+        for condition in ordered:
+            if not rows:
+                break
+            rows = self._scan(condition, rows)
+        return rows
@@ -0,0 +1,138 @@
+"""car_records.py
+
+Compact versions of the Car / House classes from this folder.
+
+The classes in 2_Class_constructor.py, 3_Self.py, 4_Class_vs_Instance_Variable.py
+and 3_Return_Self.py keep their four attributes in a per-instance __dict__.
+With __slots__ the attributes live in fixed places inside the object itself:
+no dict per instance, so less memory and slightly faster attribute access.
+The cost: no new attributes can be added to an instance (car.wheels = 8 on
+an instance fails unless "wheels" is a slot).
+
+    SlottedCar / SlottedHouse    mutable, __slots__
+    FrozenCar / FrozenHouse      __slots__, read-only after __init__, hashable
+    CarTuple                     collections.namedtuple
+    DataCar / FrozenDataCar      @dataclass(slots=True) (frozen=True)
+    CarDTO                       5_DataClass_DTO.Car with slots=True
+"""
+
+from collections import namedtuple
+from dataclasses import FrozenInstanceError, dataclass
+
+FIELDS = ("make", "model", "year", "color")
+
+
+class SlottedCar:
+    __slots__ = FIELDS
+
+    def __init__(self, make: str = "Toyota", model: str = "Rav4", year: int = 1989, color: str = "Red") -> None:
+        self.make = make
+        self.model = model
+        self.year = year
+        self.color = color
+
+    def get_colour(self) -> str:
+        return self.color
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.make!r}, {self.model!r}, {self.year!r}, {self.color!r})"
+
+    def __eq__(self, other) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return (self.make, self.model, self.year, self.color) == (other.make, other.model, other.year, other.color)
+
+    __hash__ = None  # mutable: not hashable, like a class with __eq__ and no __hash__
+
+
+class FrozenCar:
+    """SlottedCar that cannot be changed after construction (so it can be hashed)."""
+
+    __slots__ = FIELDS
+
+    def __init__(self, make: str = "Toyota", model: str = "Rav4", year: int = 1989, color: str = "Red") -> None:
+        # __setattr__ is blocked, so write through the slot descriptors directly
+        # (faster than the object.__setattr__ calls frozen dataclasses use)
+        _set_make(self, make)
+        _set_model(self, model)
+        _set_year(self, year)
+        _set_color(self, color)
+
+    def __setattr__(self, name, value) -> None:
+        raise FrozenInstanceError(f"cannot assign to field {name!r}")
+
+    def __delattr__(self, name) -> None:
+        raise FrozenInstanceError(f"cannot delete field {name!r}")
+
+    def __reduce__(self):
+        # rebuild through __init__: the default slot-state restore would hit __setattr__
+        return type(self), self._key()
+
+    def get_colour(self) -> str:
+        return self.color
+
+    def _key(self) -> tuple:
+        return self.make, self.model, self.year, self.color
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.make!r}, {self.model!r}, {self.year!r}, {self.color!r})"
+
+    def __eq__(self, other) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self) -> int:
+        return hash(self._key())
+
+
+_set_make, _set_model, _set_year, _set_color = (FrozenCar.__dict__[name].__set__ for name in FIELDS)
+
+
+class SlottedHouse(SlottedCar):
+    """House from 3_Return_Self.py (same four fields as Car)."""
+
+    __slots__ = ()
+
+    def get_instance(self) -> "SlottedHouse":
+        return self
+
+
+class FrozenHouse(FrozenCar):
+    __slots__ = ()
+
+    def get_instance(self) -> "FrozenHouse":
+        return self
+
+
+CarTuple = namedtuple("CarTuple", FIELDS, defaults=("Toyota", "Rav4", 1989, "Red"))
+
+
+@dataclass(slots=True)
+class DataCar:
+    make: str = "Toyota"
+    model: str = "Rav4"
+    year: int = 1989
+    color: str = "Red"
+
+    def get_colour(self) -> str:
+        return self.color
+
+
+@dataclass(slots=True, frozen=True)
+class FrozenDataCar:
+    make: str = "Toyota"
+    model: str = "Rav4"
+    year: int = 1989
+    color: str = "Red"
+
+    def get_colour(self) -> str:
+        return self.color
+
+
+@dataclass(slots=True)
+class CarDTO:
+    """Car from 5_DataClass_DTO.py, with slots."""
+
+    make: str
+    model: str
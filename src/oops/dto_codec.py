@@ -0,0 +1,202 @@
+"""dto_codec.py
+
+A compact binary format for dataclass DTOs such as Car in 5_DataClass_DTO.py,
+with encode / decode functions generated from the dataclass fields.
+
+    codec = codec_for(Car)
+    data = codec.encode_many(cars)        # one bytes object for the whole list
+    cars = codec.decode_many(data)        # also takes bytearray / memoryview / mmap
+
+Supported field types: str and bytes (length-prefixed), int (signed
+64-bit), float (double) and bool. One record is a struct header - the
+fixed-size fields and a uint32 byte length per str / bytes field, in field
+order - followed by the str / bytes values (UTF-8 for str):
+
+    Car("Toyota", "Rav4")  ->  <II: 6, 4> b"Toyota" b"Rav4"
+
+A batch is a uint32 record count followed by the records.
+
+pickle and json work out every object's type and attribute names while
+they run; here that is done once per dataclass: codec_for() writes the
+encode / decode functions for its fields as source code (one struct.Struct
+for the header, no per-field loops or type checks left at run time).
+Decoding reads through a memoryview: a bytearray or a slice of a bigger
+buffer is never copied as a whole, only each string is decoded out of it.
+A plain bytes object is sliced directly, which is cheaper for short
+strings than going through a memoryview.
+"""
+
+import dataclasses
+import functools
+import struct
+import typing
+
+_FIXED = {int: "q", float: "d", bool: "?"}
+_SIZED = (str, bytes)
+_COUNT = struct.Struct("<I")
+# what the generated encode raises for a bad field value: struct.error for a
+# number out of range, AttributeError / TypeError for a value of the wrong type
+_ENCODE_ERRORS = (struct.error, AttributeError, TypeError)
+
+
+def _layout(cls) -> list:
+    """[(name, type), ...] for the fields that __init__ takes."""
+    if not dataclasses.is_dataclass(cls):
+        raise TypeError(f"{cls!r} is not a dataclass")
+    hints = typing.get_type_hints(cls)
+    layout = []
+    for field in dataclasses.fields(cls):
+        if not field.init:
+            continue
+        kind = hints[field.name]
+        if kind not in _FIXED and kind not in _SIZED:
+            raise TypeError(f"{cls.__name__}.{field.name}: {kind!r} is not supported")
+        layout.append((field.name, kind))
+    return layout
+
+
+def _indent(lines: list, depth: int) -> str:
+    return "".join("    " * depth + line + "\n" for line in lines)
+
+
+def _source(layout: list, view: bool, keywords=frozenset()) -> str:
+    """The four generated functions, as Python source.
+
+    keywords: the kw_only fields, passed to the class by name (the rest go
+    by position, which is the faster call).
+    """
+    sized = [(i, name, kind) for i, (name, kind) in enumerate(layout) if kind in _SIZED]
+    args = ", ".join([f"f{i}" for i, (name, _) in enumerate(layout) if name not in keywords]
+                     + [f"{name}=f{i}" for i, (name, _) in enumerate(layout) if name in keywords])
+
+    # encoding: the str / bytes values first, then the header that needs their lengths
+    to_bytes = [f"f{i} = obj.{name}.encode()" if kind is str else f"f{i} = obj.{name}" for i, name, kind in sized]
+    header_values = ", ".join(f"obj.{name}" if kind in _FIXED else f"len(f{i})"
+                              for i, (name, kind) in enumerate(layout))
+    pieces = ", ".join([f"_head({header_values})"] + [f"f{i}" for i, _, _ in sized])
+
+    # decoding: one unpack_from for the header, then one slice per str / bytes value
+    # (a memoryview slice has no .decode(): str(slice, "utf-8") does the same)
+    header_names = ", ".join(f"f{i}" if kind in _FIXED else f"n{i}" for i, (_, kind) in enumerate(layout))
+    read = [f"{header_names}, = _unpack(data, pos)", "pos += _head_size"] if layout else []
+    if sized:
+        read += [f"if pos + {' + '.join(f'n{i}' for i, _, _ in sized)} > size:",
+                 "    raise ValueError('truncated record')"]
+    for i, _, kind in sized:
+        piece = f"data[pos:pos + n{i}]"
+        if kind is bytes:
+            read.append(f"f{i} = bytes({piece})")
+        else:
+            read.append(f'f{i} = str({piece}, "utf-8")' if view else f"f{i} = {piece}.decode()")
+        read.append(f"pos += n{i}")
+
+    return (
+        "def encode(obj):\n"
+        + _indent(to_bytes + [f"return b''.join(({pieces},))"], 1)
+        + "\ndef encode_many(objs):\n"
+        + _indent(["parts = [_count(len(objs))]", "extend = parts.extend", "for obj in objs:"], 1)
+        + _indent(to_bytes + [f"extend(({pieces},))"], 2)
+        + _indent(["return b''.join(parts)"], 1)
+        + "\ndef decode_from(data, pos, size):\n"
+        + _indent(read + [f"return _cls({args}), pos"], 1)
+        + "\ndef decode_all(data, pos, size, count):\n"
+        + _indent(["out = []", "append = out.append", "for _ in _range(count):"], 1)
+        + _indent(read + [f"append(_cls({args}))"], 2)
+        + _indent(["return out, pos"], 1)
+    )
+
+
+class Codec:
+    """Generated encode / decode functions for one dataclass (see codec_for)."""
+
+    def __init__(self, cls) -> None:
+        self.cls = cls
+        self.layout = _layout(cls)
+        self.keywords = frozenset(field.name for field in dataclasses.fields(cls) if field.kw_only)
+        self.header = struct.Struct("<" + "".join(_FIXED.get(kind, "I") for _, kind in self.layout))
+        self._bytes_fns = self._generate(view=False)
+        self._view_fns = self._generate(view=True)
+        self._encode = self._bytes_fns["encode"]
+        self._encode_many = self._bytes_fns["encode_many"]
+
+    def _generate(self, view: bool) -> dict:
+        namespace = {"_cls": self.cls, "_head": self.header.pack, "_unpack": self.header.unpack_from,
+                     "_head_size": self.header.size, "_count": _COUNT.pack, "_range": range}
+        exec(compile(_source(self.layout, view, self.keywords), f"<codec {self.cls.__name__}>", "exec"), namespace)
+        return namespace
+
+    def source(self) -> str:
+        """The generated code, for reading."""
+        return _source(self.layout, view=True, keywords=self.keywords)
+
+    def _bad_field(self, obj) -> str:
+        """Which field of obj can't be encoded, as a ValueError message."""
+        for name, kind in self.layout:
+            value = getattr(obj, name, None)
+            try:
+                if kind in _FIXED:
+                    struct.pack("<" + _FIXED[kind], value)
+                elif kind is str:
+                    _COUNT.pack(len(value.encode()))
+                else:
+                    _COUNT.pack(len(b"".join((value,))))
+            except (struct.error, AttributeError, TypeError) as e:
+                return f"{self.cls.__name__}.{name} = {value!r}: {e}"
+        return f"{self.cls.__name__}: cannot encode {obj!r}"
+
+    def encode(self, obj) -> bytes:
+        try:
+            return self._encode(obj)
+        except _ENCODE_ERRORS:
+            raise ValueError(self._bad_field(obj)) from None
+
+    def encode_many(self, objs) -> bytes:
+        objs = objs if isinstance(objs, (list, tuple)) else list(objs)
+        try:
+            return self._encode_many(objs)
+        except _ENCODE_ERRORS:
+            pass
+        for i, obj in enumerate(objs):  # only on failure: find the record and field
+            try:
+                self._encode(obj)
+            except _ENCODE_ERRORS:
+                raise ValueError(f"record {i}: {self._bad_field(obj)}") from None
+        raise ValueError(f"more than {2 ** 32 - 1:,} records")
+
+    def _reader(self, buffer):
+        """(data to slice, size, generated functions) without copying buffer."""
+        if type(buffer) is bytes:
+            return buffer, len(buffer), self._bytes_fns
+        view = memoryview(buffer)
+        if view.format != "B" or view.ndim != 1:
+            view = view.cast("B")
+        return view, len(view), self._view_fns
+
+    def decode(self, buffer):
+        """One record (as made by encode)."""
+        data, size, fns = self._reader(buffer)
+        try:
+            obj, pos = fns["decode_from"](data, 0, size)
+        except struct.error as e:
+            raise ValueError(f"truncated record: {e}") from None
+        if pos != size:
+            raise ValueError(f"{size - pos} bytes after the record")
+        return obj
+
+    def decode_many(self, buffer) -> list:
+        """A batch (as made by encode_many)."""
+        data, size, fns = self._reader(buffer)
+        try:
+            (count,) = _COUNT.unpack_from(data, 0)
+            objs, pos = fns["decode_all"](data, _COUNT.size, size, count)
+        except struct.error as e:
+            raise ValueError(f"truncated batch: {e}") from None
+        if pos != size:
+            raise ValueError(f"{size - pos} bytes after the last record")
+        return objs
+
+
+@functools.lru_cache(maxsize=None)
+def codec_for(cls) -> Codec:
+    """The Codec of a dataclass, generated once per class."""
+    return Codec(cls)
@@ -0,0 +1,81 @@
+"""output_sink.py
+
+A buffered replacement for many small print() calls.
+
+    with OutputSink() as out:                 # sys.stdout, looked up at each flush
+        out.print("a", "b", "c", sep="-")     # same sep / end rules as print()
+
+    OutputSink("report.txt")                  # a file path (or an open file)
+    OutputSink(NULL)                          # null sink: output is thrown away
+
+Every print() to a terminal is its own write (stdout is line-buffered there),
+so a loop printing a million lines makes a million system calls.
+OutputSink keeps the text in a list and writes it in one go when
+- the buffer reaches `max_chars` characters, or
+- `max_delay` seconds have passed since the last write (checked on each call),
+- or on flush() / close() / leaving the `with` block.
+"""
+
+import sys
+import time
+
+NULL = object()  # OutputSink(NULL) throws the output away
+
+
+class OutputSink:
+    def __init__(self, target=None, max_chars: int = 1 << 16, max_delay: float = 0.5) -> None:
+        # target=None: whatever sys.stdout is when flushing, so redirect_stdout() and
+        # a replaced sys.stdout are followed like print() follows them
+        self._owns_file = isinstance(target, str)
+        self._file = open(target, "w", encoding="utf-8") if self._owns_file else target
+        self.max_chars = max_chars
+        self.max_delay = max_delay
+        self._parts = []
+        self._size = 0
+        self._last_flush = time.monotonic()
+
+    def write(self, text: str) -> None:
+        self._parts.append(text)
+        self._size += len(text)
+        if self._size >= self.max_chars or time.monotonic() - self._last_flush >= self.max_delay:
+            self.flush()
+
+    def print(self, *objects, sep: str | None = " ", end: str | None = "\n", flush: bool = False) -> None:
+        """Same rules as print(): None for sep/end means the default."""
+        if sep is None:
+            sep = " "
+        if end is None:
+            end = "\n"
+        # same as self.write(), inlined: this is the hot path
+        text = (objects[0] if len(objects) == 1 and type(objects[0]) is str
+                else sep.join(map(str, objects))) + end
+        self._parts.append(text)
+        self._size += len(text)
+        if flush or self._size >= self.max_chars or time.monotonic() - self._last_flush >= self.max_delay:
+            self.flush()
+
+    def writelines(self, lines, end: str = "\n") -> None:
+        """Many lines in one call (end is added after each)."""
+        parts = list(map(str, lines))
+        if parts:
+            self.write(end.join(parts) + end)
+
+    def flush(self) -> None:
+        if self._parts and self._file is not NULL:
+            file = sys.stdout if self._file is None else self._file
+            file.write("".join(self._parts))
+            file.flush()
+        self._parts.clear()
+        self._size = 0
+        self._last_flush = time.monotonic()
+
+    def close(self) -> None:
+        self.flush()
+        if self._owns_file:
+            self._file.close()
+
+    def __enter__(self) -> "OutputSink":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
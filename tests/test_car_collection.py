@@ -0,0 +1,40 @@
+import importlib.util
+import os
+import sys
+
+import pytest
+
+_OOPS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src", "oops")
+sys.path.insert(0, _OOPS)
+
+from car_collection import CarCollection  # noqa: E402
+
+_spec = importlib.util.spec_from_file_location("3_Self", os.path.join(_OOPS, "3_Self.py"))
+_self = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(_self)
+Car = _self.Car
+
+
+def _indexed(cars):
+    return {field: {key: list(bucket) for key, bucket in index.items()} for field, index in cars._hash.items()}
+
+
+def test_failed_add_leaves_the_indexes_untouched():
+    cars = CarCollection([Car("BMW", "X5", 2001, "Blue")])
+    before = _indexed(cars), dict(cars._years), list(cars._sorted_years)
+    for bad in (Car("Audi", "A4", 2001, ["Red"]), Car("Audi", "A4", "2001", "Red")):
+        with pytest.raises(TypeError):
+            cars.add(bad)
+        assert (_indexed(cars), dict(cars._years), list(cars._sorted_years)) == before
+        assert len(cars) == 1 and bad not in cars
+
+
+def test_failed_update_restores_the_car():
+    car = Car("BMW", "X5", 2001, "Blue")
+    cars = CarCollection([car, Car("Audi", "A4", 2005, "Red")])
+    with pytest.raises(TypeError):
+        cars.update(car, make="Mini", color=["x"])
+    assert (car.make, car.color) == ("BMW", "Blue")
+    assert car in cars and len(cars) == 2
+    assert cars.query(make="BMW", color="Blue") == [car]
+    assert cars.query(make="Mini") == []
@@ -0,0 +1,16 @@
+import copy
+import os
+import pickle
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src", "oops"))
+
+from car_records import FrozenCar, FrozenHouse  # noqa: E402
+
+
+def test_frozen_records_round_trip_through_pickle_and_copy():
+    for cls in (FrozenCar, FrozenHouse):
+        car = cls("Benz", "Lola", 2026, "Green")
+        for clone in (pickle.loads(pickle.dumps(car)), copy.copy(car), copy.deepcopy(car)):
+            assert type(clone) is cls
+            assert clone == car and hash(clone) == hash(car)
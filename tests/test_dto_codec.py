@@ -0,0 +1,41 @@
+import dataclasses
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src", "oops"))
+
+from dto_codec import codec_for  # noqa: E402
+
+
+@dataclasses.dataclass(kw_only=True)
+class Part:
+    name: str
+    count: int = 0
+
+
+@dataclasses.dataclass
+class Order:
+    id: int
+    note: str = dataclasses.field(kw_only=True, default="")
+    data: bytes = b""
+    rush: bool = False
+
+
+def test_kw_only_fields_round_trip():
+    for obj in (Part(name="bolt", count=3), Order(7, b"\x00", True, note="é")):
+        codec = codec_for(type(obj))
+        assert codec.decode(codec.encode(obj)) == obj
+        assert codec.decode_many(bytearray(codec.encode_many([obj, obj]))) == [obj, obj]
+
+
+@pytest.mark.parametrize("bad", [Part(name=None), Part(name=b"bolt"), Part(name="bolt", count="3"),
+                                 Part(name="bolt", count=2 ** 63)])
+def test_bad_field_values_raise_value_error_naming_the_field(bad):
+    codec = codec_for(Part)
+    field = "name" if not isinstance(bad.name, str) else "count"
+    with pytest.raises(ValueError, match=f"Part.{field} = "):
+        codec.encode(bad)
+    with pytest.raises(ValueError, match=f"record 1: Part.{field} = "):
+        codec.encode_many([Part(name="ok"), bad])
@@ -0,0 +1,46 @@
+import importlib.util
+import os
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src", "logical", "10_Logical_Operator_rules.py")
+_spec = importlib.util.spec_from_file_location("logical_rules", _PATH)
+rules = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(rules)
+
+# the rules of the module's demo, plus `in` against columns and constants
+DEMO_RULES = [rules.ENTRY, "x < 0", "x == 0", "x == 1", "age >= 18"]
+IN_RULES = ["'ad' in role", "'ad' not in role", "role in ('admin', 'guest')", "role not in ['x']",
+            "x in (1, 2) and 'ad' in role"]
+
+
+def _batch(n: int = 200) -> dict:
+    return {
+        "has_id": [random.random() < 0.9 for _ in range(n)],
+        "is_banned": [random.random() < 0.2 for _ in range(n)],
+        "is_admin": [random.random() < 0.1 for _ in range(n)],
+        "x": [random.randint(-3, 5) for _ in range(n)],
+        "age": [random.randint(10, 40) for _ in range(n)],
+        "role": [random.choice(["admin", "guest", "x", "bad"]) for _ in range(n)],
+    }
+
+
+@pytest.mark.parametrize("expr", DEMO_RULES + IN_RULES)
+def test_rule_backends_agree(expr):
+    batch = _batch()
+    rule = rules.Rule(expr)
+    columns = {f: batch[f] for f in rule.fields}
+    expected = rule.mask(columns, backend="python")
+    arrays = {f: np.asarray(col) for f, col in columns.items()}
+    assert rule.mask(arrays).tolist() == expected  # backend="auto" picks NumPy for arrays
+    assert rule.mask(columns, backend="numpy").tolist() == expected
+
+
+def test_ruleset_backends_agree():
+    batch = _batch()
+    numbers = rules.RuleSet([("x < 0", "Negative"), ("x == 0", "Zero"), ("x == 1", "Single")], default="More")
+    expected = numbers.decide({"x": batch["x"]}, backend="python")
+    assert list(numbers.decide({"x": np.asarray(batch["x"])})) == expected
@@ -0,0 +1,47 @@
+import array
+import importlib.util
+import math
+import os
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src", "8_Math_batch.py")
+_spec = importlib.util.spec_from_file_location("math_batch", _PATH)
+math_batch = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(math_batch)
+
+
+def test_numpy_backend_is_used():
+    assert math_batch.BACKEND == "numpy"
+
+
+@pytest.mark.parametrize("section", list(math_batch.FAMILIES))
+def test_family_result_matches_input_kind(section):
+    values = [0.1, 0.5, 0.9]
+    for given, kind in ((values, list), (array.array("d", values), array.array),
+                        (memoryview(array.array("d", values)), array.array), (np.array(values), np.ndarray)):
+        results = math_batch.batch_family(section, given)
+        for name, out in results.items():
+            assert type(out) is kind, (section, name, type(given))
+            expected = [float(math_batch._lookup(name)[0](v)) for v in values]
+            assert [float(x) for x in out] == pytest.approx(expected, rel=1e-12)
+
+
+@pytest.mark.parametrize("given", [[1.5, math.nan], array.array("d", [math.nan]), np.array([math.nan])])
+def test_nan_to_int_raises_like_math(given):
+    with pytest.raises(ValueError):
+        math_batch.batch_family("rounding", given)
+
+
+@pytest.mark.parametrize("given", [[math.inf], array.array("d", [-math.inf]), np.array([math.inf])])
+def test_inf_to_int_raises_like_math(given):
+    with pytest.raises(OverflowError):
+        math_batch.batch("ceil", given)
+
+
+def test_huge_values_stay_exact_in_lists():
+    assert math_batch.batch("floor", [1e300]) == [math.floor(1e300)]
+    with pytest.raises(OverflowError):
+        math_batch.batch("floor", np.array([1e300]))
@@ -0,0 +1,53 @@
+import importlib.util
+import os
+
+_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src", "3_Variable_TypeCasting_bulk.py")
+_spec = importlib.util.spec_from_file_location("typecasting_bulk", _PATH)
+typecasting_bulk = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(typecasting_bulk)
+
+
+def _per_element(values):
+    out = []
+    for s in values:
+        try:
+            out.append(int(s))
+        except ValueError:
+            out.append(None)
+    return out
+
+
+def test_matches_per_element_cast():
+    values = ["1", "2", "x", " 3 ", "", "-7", "1_000", "2.5", "9"]
+    result = typecasting_bulk.cast_column(values, int, fill=-1)
+    expected = _per_element(values)
+    assert list(result.null_mask) == [v is None for v in expected]
+    assert list(result.values) == [-1 if v is None else v for v in expected]
+    assert result.failures == 3
+    assert result.examples == ["x", "", "2.5"]
+
+
+def test_valid_values_are_converted_once(monkeypatch):
+    calls = []
+    parse = typecasting_bulk._parse_bool
+
+    def counting(s):
+        calls.append(s)
+        return parse(s)
+
+    monkeypatch.setattr(typecasting_bulk, "_parse_bool", counting)
+    values = ["yes", "no", "maybe", "on", "", "nope", "off"]
+    result = typecasting_bulk.cast_column(values, bool)
+    assert list(result.values) == [1, 0, 0, 1, 0, 0, 0]
+    assert list(result.null_mask) == [0, 0, 1, 0, 0, 1, 0]
+    for s in ("yes", "no", "on", "", "off"):
+        assert calls.count(s) == 1
+
+
+def test_out_of_range_and_too_many_digits_are_invalid():
+    huge = "9" * 5000  # int() refuses it: "Exceeds the limit (4300 digits) ..."
+    values = ["1", huge, "9223372036854775807", "9223372036854775808", "2"]
+    result = typecasting_bulk.cast_column(values, int)
+    assert list(result.values) == [1, 0, 2 ** 63 - 1, 0, 2]
+    assert list(result.null_mask) == [0, 1, 0, 1, 0]
+    assert result.failures == 2